@@ -6,7 +6,7 @@ from enum import Enum
 from typing import Dict, List, Union
 
 from TM1py.Objects.TM1Object import TM1Object
-from TM1py.Utils import case_and_space_insensitive_equals
+from TM1py.Utils import case_and_space_insensitive_equals, lower_and_drop_spaces
 
 
 class Element(TM1Object):
@@ -107,4 +107,5 @@ class Element(TM1Object):
         )
 
     def __hash__(self):
-        return super().__hash__()
+        # consistent with __eq__ and cheaper than hashing the JSON body
+        return hash((lower_and_drop_spaces(self.name), self.element_type))
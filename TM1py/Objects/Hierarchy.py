@@ -15,6 +15,58 @@ from TM1py.Utils.Utils import (
 )
 
 
+class _MutationCounter:
+    """counts changes, so that the index can tell that the public `elements` or `edges` were edited in place"""
+
+    mutations = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.mutations += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.mutations += 1
+
+    def pop(self, key, default=None):
+        self.mutations += 1
+        return super().pop(key, default)
+
+    def popitem(self):
+        self.mutations += 1
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self.mutations += 1
+
+
+class _Elements(_MutationCounter, CaseAndSpaceInsensitiveDict):
+    pass
+
+
+class _Edges(_MutationCounter, CaseAndSpaceInsensitiveTuplesDict):
+    pass
+
+
+class _HierarchyIndex:
+    """parent -> children and child -> parents adjacency of a hierarchy over normalized element names"""
+
+    def __init__(self, elements: CaseAndSpaceInsensitiveDict, edges: CaseAndSpaceInsensitiveTuplesDict, signature):
+        self.signature = signature
+        self.elements: Dict[str, Element] = dict(elements.adjusted_items())
+        # normalized name -> list of (edge, normalized name of child or parent)
+        self.children: Dict[str, List[Tuple[Tuple[str, str], str]]] = collections.defaultdict(list)
+        self.parents: Dict[str, List[Tuple[Tuple[str, str], str]]] = collections.defaultdict(list)
+        for (parent, component), edge in zip(edges.adjusted_keys(), edges.keys()):
+            self.children[parent].append((edge, component))
+            self.parents[component].append((edge, parent))
+        self.children = dict(self.children)
+        self.parents = dict(self.parents)
+        # level per normalized name. Computed on demand
+        self.levels: Optional[Dict[str, int]] = None
+
+
 class Hierarchy(TM1Object):
     """Abstraction of TM1 Hierarchy
     Requires reference to a Dimension
@@ -53,16 +105,18 @@ class Hierarchy(TM1Object):
         self._name = name
         self._dimension_name = None
         self.dimension_name = dimension_name
-        self._elements: Dict[str, Element] = CaseAndSpaceInsensitiveDict()
+        self._elements: Dict[str, Element] = _Elements()
         if elements:
             for elem in elements:
                 self._elements[elem.name] = elem
         self._element_attributes = list(element_attributes) if element_attributes else []
-        self._edges = CaseAndSpaceInsensitiveTuplesDict(edges) if edges else CaseAndSpaceInsensitiveTuplesDict()
+        self._edges = _Edges(edges) if edges else _Edges()
         self._subsets = list(subsets) if subsets else []
         # balanced is true, false or None (in versions < TM1 11)
         self._balanced = False if not structure else structure == 0
         self._default_member = default_member
+        # adjacency index for traversals. Built on demand
+        self._index: Optional[_HierarchyIndex] = None
 
     @classmethod
     def from_dict(cls, hierarchy_as_dict: Dict, dimension_name: str = None) -> "Hierarchy":
@@ -147,72 +201,152 @@ class Hierarchy(TM1Object):
             raise ValueError("Element: {} not found in Hierarchy: {}".format(element_name, self.name))
 
     def get_ancestors(self, element_name: str, recursive: bool = False) -> Set[Element]:
-        ancestors = set()
-
-        for parent, component in self._edges:
-            if not case_and_space_insensitive_equals(component, element_name):
-                continue
-
-            ancestor: Element = self.elements[parent]
-            ancestors.add(ancestor)
-
-            if recursive:
-                ancestors = ancestors.union(self.get_ancestors(ancestor.name, True))
-        return ancestors
+        return {
+            self._get_index().elements[parent]
+            for (_, parent) in self._traverse(element_name, upwards=True, recursive=recursive)
+        }
 
     def get_descendants(self, element_name: str, recursive: bool = False, leaves_only=False) -> Set[Element]:
         descendants = set()
 
-        for parent, component in self._edges:
-            if not case_and_space_insensitive_equals(parent, element_name):
-                continue
-
-            descendant: Element = self.elements[component]
-            if not leaves_only:
+        elements = self._get_index().elements
+        for _, component in self._traverse(element_name, upwards=False, recursive=recursive):
+            descendant: Element = elements[component]
+            if not leaves_only or descendant.element_type == Element.Types.NUMERIC:
                 descendants.add(descendant)
-            else:
-                if descendant.element_type == Element.Types.NUMERIC:
-                    descendants.add(descendant)
-
-            if recursive and descendant.element_type == Element.Types.CONSOLIDATED:
-                descendants = descendants.union(self.get_descendants(descendant.name, True, leaves_only=leaves_only))
         return descendants
 
     def get_descendant_edges(self, element_name: str, recursive: bool = False) -> Dict:
-        descendant_edges = dict()
+        return {edge: self._edges[edge] for edge, _ in self._traverse(element_name, upwards=False, recursive=recursive)}
+
+    def get_ancestor_edges(self, element_name: str, recursive: bool = False) -> Dict:
+        return {edge: self._edges[edge] for edge, _ in self._traverse(element_name, upwards=True, recursive=recursive)}
+
+    def get_leaves(self, element_name: str = None) -> Set[Element]:
+        """Elements without children, i.e. level 0 elements
 
-        for (parent, component), weight in self._edges.items():
-            if not case_and_space_insensitive_equals(parent, element_name):
-                continue
+        :param element_name: only leaves under this element (including the element itself if it is a leaf).
+            All leaves of the hierarchy if None
+        :return: set of elements
+        """
+        index = self._get_index()
 
-            descendant_edges[parent, component] = weight
-            descendant: Element = self.elements[component]
+        if element_name is None:
+            return {element for key, element in index.elements.items() if key not in index.children}
 
-            if recursive and descendant.element_type == Element.Types.CONSOLIDATED:
-                descendant_edges.update(self.get_descendant_edges(descendant.name, True))
+        if lower_and_drop_spaces(element_name) not in index.children:
+            return {self.get_element(element_name)}
 
-        return descendant_edges
+        return {
+            index.elements[component]
+            for _, component in self._traverse(element_name, upwards=False, recursive=True)
+            if component not in index.children
+        }
 
-    def get_ancestor_edges(self, element_name: str, recursive: bool = False) -> Dict:
-        ancestor_edges = dict()
+    def get_level(self, element_name: str) -> int:
+        """Level of an element: 0 for leaves, otherwise 1 + max level of its children
 
-        for (parent, component), weight in self._edges.items():
-            if not case_and_space_insensitive_equals(component, element_name):
-                continue
+        :param element_name: name of the element
+        :return: level
+        """
+        self.get_element(element_name)
+        index = self._get_index()
+
+        if index.levels is None:
+            levels = dict()
+            for key in self._topological_keys(top_down=False):
+                levels[key] = 1 + max((levels[component] for _, component in index.children.get(key, ())), default=-1)
+            index.levels = levels
+        return index.levels[lower_and_drop_spaces(element_name)]
+
+    def topological_order(self, top_down: bool = False) -> List[str]:
+        """Element names ordered so that every element comes after all its children (or parents with top_down)
+
+        :param top_down: parents before children if True, children before parents otherwise
+        :return: list of element names
+        """
+        elements = self._get_index().elements
+        return [elements[key].name for key in self._topological_keys(top_down=top_down)]
 
-            ancestor_edges[parent, component] = weight
-            ancestor: Element = self.elements[component]
+    def path_to_root(self, element_name: str) -> List[str]:
+        """Names of the element and its ancestors up to a root element.
+        For elements with multiple parents the path follows the first parent.
 
-            if recursive:
-                ancestor_edges.update(self.get_ancestor_edges(ancestor.name, True))
+        :param element_name: name of the element
+        :return: list of element names, starting with the element itself
+        """
+        index = self._get_index()
+
+        path = [self.get_element(element_name).name]
+        current = lower_and_drop_spaces(element_name)
+        visited = {current}
+        while index.parents.get(current):
+            _, current = index.parents[current][0]
+            if current in visited:
+                raise ValueError(f"Hierarchy: {self.name} contains a cycle")
+            visited.add(current)
+            path.append(index.elements[current].name)
+        return path
+
+    def _topological_keys(self, top_down: bool) -> List[str]:
+        """Kahn's algorithm over the normalized element names"""
+        index = self._get_index()
+        following = index.children if top_down else index.parents
+        preceding = index.parents if top_down else index.children
+
+        pending = {key: len(preceding.get(key, ())) for key in index.elements}
+        queue = collections.deque(key for key, count in pending.items() if count == 0)
+
+        order = []
+        while queue:
+            key = queue.popleft()
+            order.append(key)
+            for _, next_key in following.get(key, ()):
+                pending[next_key] -= 1
+                if pending[next_key] == 0:
+                    queue.append(next_key)
+
+        if len(order) != len(pending):
+            raise ValueError(f"Hierarchy: {self.name} contains a cycle")
+        return order
+
+    def _traverse(self, element_name: str, upwards: bool, recursive: bool) -> Iterable[Tuple[Tuple[str, str], str]]:
+        """Edges above or below an element, each with the normalized name of the element on the other end.
+        Downwards recursion continues through consolidations only
+        """
+        index = self._get_index()
+        adjacency = index.parents if upwards else index.children
+
+        queue = collections.deque([lower_and_drop_spaces(element_name)])
+        visited = set(queue)
+        while queue:
+            for edge, next_key in adjacency.get(queue.popleft(), ()):
+                yield edge, next_key
+                if not recursive or next_key in visited:
+                    continue
+                if not upwards and index.elements[next_key].element_type != Element.Types.CONSOLIDATED:
+                    continue
+                visited.add(next_key)
+                queue.append(next_key)
+
+    def _get_index(self) -> "_HierarchyIndex":
+        """Adjacency index over normalized element names.
+        Built on first use and rebuilt when the hierarchy changes, also through the public `elements` and `edges`.
+        """
+        signature = (id(self._edges), self._edges.mutations, id(self._elements), self._elements.mutations)
+        if self._index is None or self._index.signature != signature:
+            self._index = _HierarchyIndex(self._elements, self._edges, signature)
+        return self._index
 
-        return ancestor_edges
+    def _invalidate_index(self):
+        self._index = None
 
     def add_element(self, element_name: str, element_type: Union[str, Element.Types]):
         if element_name in self._elements:
             raise ValueError("Element name must be unique")
 
         self._elements[element_name] = Element(name=element_name, element_type=element_type)
+        self._invalidate_index()
 
     def add_component(self, parent_name: str, component_name: str, weight: int):
         if parent_name not in self._elements:
@@ -229,19 +363,23 @@ class Hierarchy(TM1Object):
 
     def update_element(self, element_name: str, element_type: Union[str, Element.Types]):
         self._elements[element_name].element_type = element_type
+        self._invalidate_index()
 
     def remove_element(self, element_name: str):
         if element_name not in self._elements:
             return
         del self._elements[element_name]
         self.remove_edges_related_to_element(element_name=element_name)
+        self._invalidate_index()
 
     def remove_all_elements(self):
-        self._elements = CaseAndSpaceInsensitiveDict()
+        self._elements = _Elements()
         self.remove_all_edges()
+        self._invalidate_index()
 
     def add_edge(self, parent: str, component: str, weight: float):
         self._edges[(parent, component)] = weight
+        self._invalidate_index()
 
     def update_edge(self, parent: str, component: str, weight: float):
         self._edges[(parent, component)] = weight
@@ -249,13 +387,15 @@ class Hierarchy(TM1Object):
     def remove_edge(self, parent: str, component: str):
         if (parent, component) in self.edges:
             del self.edges[(parent, component)]
+            self._invalidate_index()
 
     def remove_edges(self, edges: Iterable[Tuple[str, str]]):
         for edge in edges:
             self.remove_edge(*edge)
 
     def remove_all_edges(self):
-        self._edges = CaseAndSpaceInsensitiveTuplesDict()
+        self._edges = _Edges()
+        self._invalidate_index()
 
     def remove_edges_related_to_element(self, element_name: str):
         element_name_adjusted = lower_and_drop_spaces(element_name)
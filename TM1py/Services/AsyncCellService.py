@@ -0,0 +1,534 @@
+# -*- coding: utf-8 -*-
+import json
+from typing import Dict, Iterable, List, Union
+
+from mdxpy import MdxBuilder
+
+from TM1py.Exceptions.Exceptions import TM1pyRestException
+from TM1py.Services.AsyncRestService import AsyncRestService
+from TM1py.Services.CellService import CellService
+from TM1py.Utils import Utils, add_url_parameters, format_url
+from TM1py.Utils.Utils import CaseAndSpaceInsensitiveTuplesDict
+
+
+class AsyncCellService:
+    """Service to handle Read operations to TM1 cubes through an AsyncRestService
+
+    All functions are coroutines. Many queries can be executed concurrently from one event loop, e.g.:
+        async with AsyncRestService(**params) as rest:
+            cells = AsyncCellService(rest)
+            results = await asyncio.gather(*[cells.execute_mdx_values(mdx) for mdx in mdx_list])
+    """
+
+    def __init__(self, tm1_rest: AsyncRestService):
+        """
+
+        :param tm1_rest: instance of AsyncRestService
+        """
+        self._rest = tm1_rest
+
+    @property
+    def version(self) -> str:
+        return self._rest.version
+
+    async def create_cellset(self, mdx: Union[str, MdxBuilder], sandbox_name: str = None, **kwargs) -> str:
+        """Execute MDX in order to create cellset at server. return the cellset-id
+
+        :param mdx: MDX Query, as string
+        :param sandbox_name: str
+        :return:
+        """
+        url = "/ExecuteMDX"
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        data = {"MDX": mdx.to_mdx() if isinstance(mdx, MdxBuilder) else mdx}
+        response = await self._rest.POST(url=url, data=json.dumps(data, ensure_ascii=False), **kwargs)
+        return response.json()["ID"]
+
+    async def create_cellset_from_view(
+        self, cube_name: str, view_name: str, private: bool, sandbox_name: str = None, **kwargs
+    ) -> str:
+        """create cellset from a cube view. return the cellset-id
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param private: True (private) or False (public)
+        :param sandbox_name: str
+        :return:
+        """
+        url = format_url(
+            "/Cubes('{cube_name}')/{views}('{view_name}')/tm1.Execute",
+            cube_name=cube_name,
+            views="PrivateViews" if private else "Views",
+            view_name=view_name,
+        )
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        response = await self._rest.POST(url=url, **kwargs)
+        return response.json()["ID"]
+
+    async def delete_cellset(self, cellset_id: str, sandbox_name: str = None, **kwargs):
+        """Delete a cellset
+
+        :param cellset_id:
+        :param sandbox_name: str
+        :return:
+        """
+        url = "/Cellsets('{}')".format(cellset_id)
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        return await self._rest.DELETE(url, **kwargs)
+
+    async def _tidy_cellset(self, cellset_id: str, sandbox_name: str = None):
+        try:
+            await self.delete_cellset(cellset_id=cellset_id, sandbox_name=sandbox_name)
+
+        except TM1pyRestException as ex:
+            # Fail silently if cellset is already removed
+            if not ex.status_code == 404:
+                raise ex
+
+    async def extract_cellset_raw(
+        self,
+        cellset_id: str,
+        cell_properties: Iterable[str] = None,
+        elem_properties: Iterable[str] = None,
+        member_properties: Iterable[str] = None,
+        top: int = None,
+        skip: int = None,
+        skip_contexts: bool = False,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_hierarchies: bool = False,
+        delete_cellset: bool = True,
+        **kwargs,
+    ) -> Dict:
+        """Extract full cellset data and return the raw data from TM1
+
+        :param cellset_id: String; ID of existing cellset
+        :param cell_properties: List of properties to be queried from cells. E.g. ['Value', 'RuleDerived', ...]
+        :param elem_properties: List of properties to be queried from elements. E.g. ['UniqueName','Attributes', ...]
+        :param member_properties: List properties to be queried from the member. E.g. ['Name', 'UniqueName']
+        :param top: Integer limiting the number of cells and the number or rows returned
+        :param skip: Integer limiting the number of cells and the number or rows returned
+        :param skip_contexts:
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_hierarchies: retrieve Hierarchies property on Axes
+        :param delete_cellset: delete cellset after extraction
+        :return: Raw format from TM1.
+        """
+        url = CellService._build_cellset_raw_url(
+            cellset_id=cellset_id,
+            cell_properties=list(cell_properties) if cell_properties else None,
+            elem_properties=elem_properties,
+            member_properties=member_properties,
+            top=top,
+            skip=skip,
+            skip_contexts=skip_contexts,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_hierarchies=include_hierarchies,
+        )
+        try:
+            response = await self._rest.GET(url=url, **kwargs)
+            return response.json()
+        finally:
+            if delete_cellset:
+                await self._tidy_cellset(cellset_id, sandbox_name)
+
+    async def extract_cellset_values(
+        self,
+        cellset_id: str,
+        sandbox_name: str = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        delete_cellset: bool = True,
+        **kwargs,
+    ) -> List[Union[str, float]]:
+        """Extract cellset data and return only the cells and values
+
+        :param cellset_id: String; ID of existing cellset
+        :param sandbox_name: str
+        :param skip_zeros: bool
+        :param skip_consolidated_cells: bool
+        :param skip_rule_derived_cells: bool
+        :param delete_cellset: delete cellset after extraction
+        :return: List of cell values
+        """
+        url = CellService._build_cellset_values_url(
+            cellset_id=cellset_id,
+            sandbox_name=sandbox_name,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+        )
+        try:
+            response = await self._rest.GET(url=url, **kwargs)
+            return [cell["Value"] for cell in response.json()["Cells"]]
+        finally:
+            if delete_cellset:
+                await self._tidy_cellset(cellset_id, sandbox_name)
+
+    async def extract_cellset(
+        self,
+        cellset_id: str,
+        cell_properties: Iterable[str] = None,
+        top: int = None,
+        skip: int = None,
+        delete_cellset: bool = True,
+        skip_contexts: bool = False,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        element_unique_names: bool = True,
+        skip_cell_properties: bool = False,
+        skip_sandbox_dimension: bool = False,
+        **kwargs,
+    ) -> CaseAndSpaceInsensitiveTuplesDict:
+        """Execute cellset and return the cells with their properties
+
+        :param cellset_id:
+        :param cell_properties: properties to be queried from the cell. E.g. Value, Ordinal, RuleDerived, ...
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param delete_cellset:
+        :param skip_contexts:
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param skip_cell_properties: cell values in result dictionary, instead of cell_properties dictionary
+        :param skip_sandbox_dimension: skip sandbox dimension
+        :return: Content in sweet concise structure.
+        """
+        raw_cellset = await self.extract_cellset_raw(
+            cellset_id,
+            cell_properties=cell_properties or ["Value"],
+            elem_properties=["UniqueName"],
+            member_properties=["UniqueName"],
+            top=top,
+            skip=skip,
+            skip_contexts=skip_contexts,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_hierarchies=False,
+            delete_cellset=delete_cellset,
+            **kwargs,
+        )
+
+        return Utils.build_content_from_cellset_dict(
+            raw_cellset_as_dict=raw_cellset,
+            top=top,
+            element_unique_names=element_unique_names,
+            skip_cell_properties=skip_cell_properties,
+            skip_sandbox_dimension=skip_sandbox_dimension,
+        )
+
+    async def extract_cellset_cellcount(self, cellset_id: str, sandbox_name: str = None, **kwargs) -> int:
+        """Retrieve number of cells in the cellset
+
+        :param cellset_id:
+        :param sandbox_name: str
+        :return:
+        """
+        url = "/Cellsets('{}')/Cells/$count".format(cellset_id)
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        try:
+            response = await self._rest.GET(url, **kwargs)
+            return int(response.content)
+        finally:
+            await self._tidy_cellset(cellset_id, sandbox_name)
+
+    async def execute_mdx(
+        self,
+        mdx: Union[str, MdxBuilder],
+        cell_properties: List[str] = None,
+        top: int = None,
+        skip_contexts: bool = False,
+        skip: int = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        element_unique_names: bool = True,
+        skip_cell_properties: bool = False,
+        skip_sandbox_dimension: bool = False,
+        **kwargs,
+    ) -> CaseAndSpaceInsensitiveTuplesDict:
+        """Execute MDX and return the cells with their properties
+
+        :param mdx: MDX Query, as string
+        :param cell_properties: properties to be queried from the cell. E.g. Value, Ordinal, RuleDerived, ...
+        :param top: Int, number of cells to return (counting from top)
+        :param skip_contexts: skip elements from titles / contexts in response
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param skip_cell_properties: cell values in result dictionary, instead of cell_properties dictionary
+        :param skip_sandbox_dimension: skip sandbox dimension
+        :return: content in sweet concise structure.
+        """
+        cellset_id = await self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+        return await self.extract_cellset(
+            cellset_id=cellset_id,
+            cell_properties=cell_properties,
+            top=top,
+            skip=skip,
+            skip_contexts=skip_contexts,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=True,
+            sandbox_name=sandbox_name,
+            element_unique_names=element_unique_names,
+            skip_cell_properties=skip_cell_properties,
+            skip_sandbox_dimension=skip_sandbox_dimension,
+            **kwargs,
+        )
+
+    async def execute_view(
+        self,
+        cube_name: str,
+        view_name: str,
+        private: bool = False,
+        cell_properties: Iterable[str] = None,
+        top: int = None,
+        skip_contexts: bool = False,
+        skip: int = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        element_unique_names: bool = True,
+        skip_cell_properties: bool = False,
+        skip_sandbox_dimension: bool = False,
+        **kwargs,
+    ) -> CaseAndSpaceInsensitiveTuplesDict:
+        """get view content as dictionary with sweet and concise structure.
+
+        :param cube_name: String
+        :param view_name: String
+        :param private: True (private) or False (public)
+        :param cell_properties: List, cell properties: [Values, Status, HasPicklist, etc.]
+        :param top: Int, number of cells to return (counting from top)
+        :param skip_contexts: skip elements from titles / contexts in response
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param skip_cell_properties: cell values in result dictionary, instead of cell_properties dictionary
+        :param skip_sandbox_dimension: skip sandbox dimension
+        :return: Dictionary : {([dim1].[elem1], [dim2][elem6]): {'Value':3127.312, 'Ordinal':12}   ....  }
+        """
+        cellset_id = await self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        return await self.extract_cellset(
+            cellset_id=cellset_id,
+            cell_properties=cell_properties,
+            top=top,
+            skip=skip,
+            skip_contexts=skip_contexts,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=True,
+            sandbox_name=sandbox_name,
+            element_unique_names=element_unique_names,
+            skip_cell_properties=skip_cell_properties,
+            skip_sandbox_dimension=skip_sandbox_dimension,
+            **kwargs,
+        )
+
+    async def execute_mdx_raw(
+        self,
+        mdx: Union[str, MdxBuilder],
+        cell_properties: Iterable[str] = None,
+        elem_properties: Iterable[str] = None,
+        member_properties: Iterable[str] = None,
+        top: int = None,
+        skip_contexts: bool = False,
+        skip: int = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_hierarchies: bool = False,
+        **kwargs,
+    ) -> Dict:
+        """Execute MDX and return the raw data from TM1
+
+        :param mdx: String, a valid MDX Query
+        :param cell_properties: List of properties to be queried from the cell. E.g. ['Value', 'RuleDerived', ...]
+        :param elem_properties: List of properties to be queried from the elements. E.g. ['Name','Attributes', ...]
+        :param member_properties: List of properties to be queried from the members. E.g. ['Name','Attributes', ...]
+        :param top: Integer limiting the number of cells and the number or rows returned
+        :param skip_contexts: skip elements from titles / contexts in response
+        :param skip: Integer limiting the number of cells and the number or rows returned
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_hierarchies: retrieve Hierarchies property on Axes
+        :return: Raw format from TM1.
+        """
+        cellset_id = await self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+        return await self.extract_cellset_raw(
+            cellset_id=cellset_id,
+            cell_properties=cell_properties,
+            elem_properties=elem_properties,
+            member_properties=member_properties,
+            top=top,
+            skip=skip,
+            skip_contexts=skip_contexts,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_hierarchies=include_hierarchies,
+            delete_cellset=True,
+            **kwargs,
+        )
+
+    async def execute_view_raw(
+        self,
+        cube_name: str,
+        view_name: str,
+        private: bool = False,
+        cell_properties: Iterable[str] = None,
+        elem_properties: Iterable[str] = None,
+        member_properties: Iterable[str] = None,
+        top: int = None,
+        skip_contexts: bool = False,
+        skip: int = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        **kwargs,
+    ) -> Dict:
+        """Execute a cube view and return the raw data from TM1
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param private: True (private) or False (public)
+        :param cell_properties: List of properties to be queried from the cell. E.g. ['Value', 'RuleDerived', ...]
+        :param elem_properties: List of properties to be queried from the elements. E.g. ['Name','Attributes', ...]
+        :param member_properties: List of properties to be queried from the members. E.g. ['Name','Attributes', ...]
+        :param top: Integer limiting the number of cells and the number or rows returned
+        :param skip_contexts: skip elements from titles / contexts in response
+        :param skip: Integer limiting the number of cells and the number or rows returned
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :return: Raw format from TM1.
+        """
+        cellset_id = await self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        return await self.extract_cellset_raw(
+            cellset_id=cellset_id,
+            cell_properties=cell_properties,
+            elem_properties=elem_properties,
+            member_properties=member_properties,
+            top=top,
+            skip=skip,
+            skip_contexts=skip_contexts,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            delete_cellset=True,
+            **kwargs,
+        )
+
+    async def execute_mdx_values(
+        self,
+        mdx: Union[str, MdxBuilder],
+        sandbox_name: str = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        **kwargs,
+    ) -> List[Union[str, float]]:
+        """Optimized for performance. Query only raw cell values.
+        Coordinates are omitted !
+
+        :param mdx: a valid MDX Query
+        :param sandbox_name: str
+        :param skip_zeros: bool
+        :param skip_consolidated_cells: bool
+        :param skip_rule_derived_cells: bool
+        :return: List of cell values
+        """
+        cellset_id = await self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+        return await self.extract_cellset_values(
+            cellset_id,
+            sandbox_name=sandbox_name,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=True,
+            **kwargs,
+        )
+
+    async def execute_view_values(
+        self,
+        cube_name: str,
+        view_name: str,
+        private: bool = False,
+        sandbox_name: str = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        **kwargs,
+    ) -> List[Union[str, float]]:
+        """Execute view and retrieve only the cell values
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param private: True (private) or False (public)
+        :param sandbox_name: str
+        :param skip_zeros: bool
+        :param skip_consolidated_cells: bool
+        :param skip_rule_derived_cells: bool
+        :return: List of cell values
+        """
+        cellset_id = await self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        return await self.extract_cellset_values(
+            cellset_id,
+            sandbox_name=sandbox_name,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=True,
+            **kwargs,
+        )
+
+    async def execute_mdx_cellcount(self, mdx: Union[str, MdxBuilder], sandbox_name: str = None, **kwargs) -> int:
+        """Execute MDX in order to understand how many cells are in a cellset.
+        Only return number of cells in the cellset. FAST!
+
+        :param mdx: MDX Query, as string
+        :param sandbox_name: str
+        :return: Number of Cells in the CellSet
+        """
+        cellset_id = await self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+        return await self.extract_cellset_cellcount(cellset_id, sandbox_name=sandbox_name, **kwargs)
@@ -0,0 +1,622 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import functools
+import time
+import warnings
+from io import BytesIO
+from typing import Dict, Optional, Union
+
+from TM1py.Exceptions.Exceptions import TM1pyRestException, TM1pyTimeout
+from TM1py.Services.RestService import RestService
+
+try:
+    import httpx
+
+    _has_httpx = True
+except ImportError:
+    _has_httpx = False
+
+
+class AsyncRestService:
+    """Non-blocking communication with TM1 instance through HTTP.
+    Allows to await HTTP Methods
+        - GET
+        - POST
+        - PATCH
+        - PUT
+        - DELETE
+    Authentication, cookies and HTTP headers are shared with a (blocking) RestService,
+    so all authentication modes of RestService are supported.
+    Requests are executed through httpx.AsyncClient, which allows to run many concurrent requests
+    from one event loop without a thread per request.
+    Based on httpx module
+    """
+
+    def __init__(self, rest_service: RestService = None, **kwargs):
+        """Create an instance of AsyncRestService
+
+        :param rest_service: existing RestService to share the TM1 session with.
+        If None, a new RestService is created from kwargs
+        :param kwargs: See RestService for all supported arguments
+        """
+        if not _has_httpx:
+            raise ImportError("AsyncRestService requires httpx")
+
+        self._owns_rest_service = rest_service is None
+        self._rest = rest_service if rest_service is not None else RestService(**kwargs)
+        self._client = None
+        # incremented on every re-connect. Avoids concurrent requests re-connecting the same expired session
+        self._session_generation = 0
+        self._connect_lock = None
+
+    @classmethod
+    async def create(cls, **kwargs) -> "AsyncRestService":
+        """Create an AsyncRestService without blocking the running event loop during authentication
+
+        :param kwargs: See RestService for all supported arguments
+        :return: AsyncRestService
+        """
+        loop = asyncio.get_running_loop()
+        rest_service = await loop.run_in_executor(None, functools.partial(RestService, **kwargs))
+        async_rest_service = cls(rest_service=rest_service)
+        async_rest_service._owns_rest_service = True
+        return async_rest_service
+
+    @property
+    def rest_service(self) -> RestService:
+        return self._rest
+
+    @property
+    def version(self) -> str:
+        return self._rest.version
+
+    @property
+    def session_id(self) -> str:
+        return self._rest.session_id
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client()
+            self._connect_lock = asyncio.Lock()
+        return self._client
+
+    def _build_client(self) -> "httpx.AsyncClient":
+        verify = self._rest._verify
+        if self._rest._ssl_context is not None:
+            verify = self._rest._ssl_context
+
+        limits = httpx.Limits(
+            max_connections=self._rest._connection_pool_size,
+            max_keepalive_connections=self._rest._connection_pool_size,
+        )
+        # waiting for a free connection from the pool must not count towards the timeout
+        timeout = httpx.Timeout(self._rest._timeout, pool=None)
+
+        mounts = None
+        if self._rest._proxies:
+            mounts = {
+                f"{scheme}://": httpx.AsyncHTTPTransport(proxy=proxy, verify=verify, limits=limits)
+                for scheme, proxy in self._rest._proxies.items()
+            }
+
+        client = httpx.AsyncClient(
+            verify=verify, cert=self._rest._cert, limits=limits, timeout=timeout, mounts=mounts, trust_env=False
+        )
+        self._copy_cookies(client)
+        return client
+
+    def _copy_cookies(self, client: "httpx.AsyncClient"):
+        """take over session cookies (e.g. TM1SessionId, paSession) from the RestService"""
+        client.cookies.clear()
+        for cookie in self._rest._s.cookies:
+            client.cookies.set(cookie.name, cookie.value, domain=cookie.domain, path=cookie.path)
+
+    async def connect(self):
+        """(Re-)Authenticate through the RestService and take over the new session"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._rest.connect)
+        self._session_generation += 1
+        self._copy_cookies(self._get_client())
+
+    async def _re_connect(self, session_generation: int):
+        self._get_client()
+        async with self._connect_lock:
+            # another coroutine re-connected in the meantime
+            if session_generation != self._session_generation:
+                return
+            await self.connect()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        encoding: str = "utf-8",
+        async_requests_mode: Optional[bool] = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """
+        Execute a request to TM1 REST API
+        """
+        url, data = self._rest._url_and_body(url=url, data=data, encoding=encoding)
+        if isinstance(data, BytesIO):
+            data = data.getvalue()
+        headers = {**self._rest._headers, **headers} if headers else dict(self._rest._headers)
+        timeout = timeout if timeout else self._rest._timeout
+
+        if return_async_id:
+            async_requests_mode = True
+        elif async_requests_mode is None:
+            async_requests_mode = self._rest._async_requests_mode
+
+        try:
+            response = await self._execute_request(
+                method=method,
+                url=url,
+                data=data,
+                headers=headers,
+                timeout=timeout,
+                async_requests_mode=async_requests_mode,
+                cancel_at_timeout=cancel_at_timeout,
+                return_async_id=return_async_id,
+            )
+
+        except httpx.TimeoutException:
+            if cancel_at_timeout or (cancel_at_timeout is None and self._rest._cancel_at_timeout):
+                await self.cancel_running_operation()
+            raise TM1pyTimeout(method=method, url=url, timeout=timeout)
+
+        except (httpx.RemoteProtocolError, httpx.ReadError, httpx.WriteError) as e:
+            if not self._rest._re_connect_on_remote_disconnect:
+                raise e
+            response = await self._handle_remote_disconnect(
+                e, method, url, data, headers, timeout, idempotent, async_requests_mode, cancel_at_timeout
+            )
+
+        # If async_id is returned as string, return it directly
+        if return_async_id and isinstance(response, str):
+            return response
+
+        if verify_response:
+            self.verify_response(response=response)
+        response.encoding = encoding
+        return response
+
+    async def _execute_request(
+        self,
+        method: str,
+        url: str,
+        data: bytes,
+        headers: Dict,
+        timeout: float,
+        async_requests_mode: bool,
+        cancel_at_timeout: bool,
+        return_async_id: bool,
+    ):
+        if not async_requests_mode:
+            return await self._execute_sync_request(method=method, url=url, data=data, headers=headers, timeout=timeout)
+
+        return await self._execute_async_request(
+            method=method,
+            url=url,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            return_async_id=return_async_id,
+        )
+
+    async def _send(self, method: str, url: str, data: bytes, headers: Dict, timeout: float) -> "httpx.Response":
+        """send request and re-connect once if session is timed out"""
+        client = self._get_client()
+        session_generation = self._session_generation
+        request_timeout = httpx.Timeout(timeout, pool=None)
+        response = await client.request(method=method, url=url, content=data, headers=headers, timeout=request_timeout)
+
+        # Handle session timeout
+        if self._rest._re_connect_on_session_timeout and response.status_code == 401:
+            await self._re_connect(session_generation)
+            response = await client.request(
+                method=method, url=url, content=data, headers=headers, timeout=request_timeout
+            )
+
+        return response
+
+    async def _execute_sync_request(self, method: str, url: str, data: bytes, headers: Dict, timeout: float):
+        """
+        Execute a single request with session timeout handling
+        """
+        return await self._send(method=method, url=url, data=data, headers=headers, timeout=timeout)
+
+    async def _execute_async_request(
+        self,
+        method: str,
+        url: str,
+        data: bytes,
+        headers: Dict,
+        timeout: float,
+        cancel_at_timeout: bool,
+        return_async_id: bool,
+    ):
+        """
+        Execute a request in TM1 async mode (respond-async) and await the result without blocking the event loop
+        """
+        headers = {**headers, "Prefer": "respond-async"}
+        response = await self._send(method=method, url=url, data=data, headers=headers, timeout=timeout)
+        self.verify_response(response=response)
+
+        if "Location" in response.headers and "'" in response.headers.get("Location", ""):
+            async_id = response.headers.get("Location").split("'")[1]
+            if return_async_id:
+                return async_id
+
+            response = await self._poll_async_response(async_id, timeout, cancel_at_timeout, method, url)
+            response = self._transform_async_response(response)
+
+        return response
+
+    async def _poll_async_response(
+        self, async_id: str, timeout: float, cancel_at_timeout: bool, method: str, url: str
+    ) -> "httpx.Response":
+        """
+        Poll for async operation completion
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        attempt = 0
+        while True:
+            response = await self.retrieve_async_response(async_id)
+            if response.status_code in [200, 201]:
+                return response
+
+            wait = self._rest.polling_strategy.wait_time(attempt, response)
+            attempt += 1
+            if deadline is not None and time.monotonic() + wait > deadline:
+                break
+            await asyncio.sleep(wait)
+
+        # Timeout reached
+        if cancel_at_timeout or (cancel_at_timeout is None and self._rest._cancel_at_timeout):
+            await self.cancel_async_operation(async_id)
+        raise TM1pyTimeout(method=method, url=url, timeout=timeout)
+
+    @staticmethod
+    def _transform_async_response(response: "httpx.Response") -> "httpx.Response":
+        """
+        Transform async response for TM1 version compatibility
+        """
+        # Response transformation necessary in TM1 < v11
+        if response.content.startswith(b"HTTP/"):
+            urllib3_response = RestService.urllib3_response_from_bytes(response.content)
+            return httpx.Response(
+                status_code=urllib3_response.status,
+                headers=list(urllib3_response.headers.items()),
+                content=urllib3_response.data,
+                request=response.request,
+            )
+
+        # In v12 status_code must be set explicitly
+        if "asyncresult" in response.headers:
+            response.status_code = int(response.headers["asyncresult"].split()[0])
+
+        return response
+
+    async def _handle_remote_disconnect(
+        self,
+        original_error: Exception,
+        method: str,
+        url: str,
+        data: bytes,
+        headers: Dict,
+        timeout: float,
+        idempotent: bool,
+        async_requests_mode: bool,
+        cancel_at_timeout: bool,
+    ):
+        """
+        Handle remote disconnect errors with reconnection and retry logic
+        """
+        warnings.warn(f"Connection aborted due to remote disconnect. Attempting to reconnect: {original_error}")
+
+        # drop all pooled connections, as they may be broken too
+        if self._client is not None:
+            await self._client.aclose()
+        try:
+            await self.connect()
+        except Exception as connect_error:
+            raise connect_error from original_error
+
+        # Only retry if idempotent
+        if not idempotent:
+            warnings.warn(
+                f"Successfully reconnected but not retrying {method.upper()} request (idempotent={idempotent})"
+            )
+            raise original_error
+
+        warnings.warn(f"Successfully reconnected. Retrying {method.upper()} request...")
+        return await self._execute_request(
+            method=method,
+            url=url,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            async_requests_mode=async_requests_mode,
+            cancel_at_timeout=cancel_at_timeout,
+            return_async_id=False,
+        )
+
+    async def GET(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = True,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """Perform a GET request against TM1 instance
+        :param url:
+        :param data: the payload
+        :param headers: custom headers
+        :param async_requests_mode: changes internal REST execution mode to avoid 60s timeout on IBM cloud
+        :param return_async_id: If True function will return async_id after initiation and not await the execution
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param encoding:
+        :return: response object or async_id
+        """
+        return await self.request(
+            method="GET",
+            url=url,
+            data=data,
+            headers=headers,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def POST(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """Perform a POST request against TM1 instance
+        :param url:
+        :param data: the payload
+        :param headers: custom headers
+        :param async_requests_mode: changes internal REST execution mode to avoid 60s timeout on IBM cloud
+        :param return_async_id: If True function will return async_id after initiation and not await the execution
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param encoding:
+        :return: response object or async_id
+        """
+        return await self.request(
+            method="POST",
+            url=url,
+            data=data,
+            headers=headers,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def PATCH(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """Perform a PATCH request against TM1 instance
+        :param url:
+        :param data: the payload
+        :param headers: custom headers
+        :param async_requests_mode: changes internal REST execution mode to avoid 60s timeout on IBM cloud
+        :param return_async_id: If True function will return async_id after initiation and not await the execution
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param encoding:
+        :return: response object or async_id
+        """
+        return await self.request(
+            method="PATCH",
+            url=url,
+            data=data,
+            headers=headers,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def PUT(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """Perform a PUT request against TM1 instance
+        :param url:
+        :param data: the payload
+        :param headers: custom headers
+        :param async_requests_mode: changes internal REST execution mode to avoid 60s timeout on IBM cloud
+        :param return_async_id: If True function will return async_id after initiation and not await the execution
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param encoding:
+        :return: response object or async_id
+        """
+        return await self.request(
+            method="PUT",
+            url=url,
+            data=data,
+            headers=headers,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def DELETE(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """Perform a DELETE request against TM1 instance
+        :param url:
+        :param data: the payload
+        :param headers: custom headers
+        :param async_requests_mode: changes internal REST execution mode to avoid 60s timeout on IBM cloud
+        :param return_async_id: If True function will return async_id after initiation and not await the execution
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param encoding:
+        :return: response object or async_id
+        """
+        return await self.request(
+            method="DELETE",
+            url=url,
+            data=data,
+            headers=headers,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def retrieve_async_response(self, async_id: str, **kwargs) -> "httpx.Response":
+        url = f"/_async('{async_id}')"
+        return await self.GET(url, async_requests_mode=False, **kwargs)
+
+    async def cancel_async_operation(self, async_id: str, **kwargs):
+        url = f"/_async('{async_id}')"
+        response = await self.DELETE(url, async_requests_mode=False, **kwargs)
+        self.verify_response(response)
+
+    async def cancel_running_operation(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._rest.cancel_running_operation)
+
+    async def is_connected(self) -> bool:
+        """Check if Connection to TM1 Server is established.
+        :Returns:
+            Boolean
+        """
+        try:
+            await self.GET("/Configuration/ServerName/$value")
+            return True
+        except Exception:
+            return False
+
+    async def close(self):
+        """Close the HTTP connections of the async client. TM1 session remains active"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def logout(self, timeout: float = None, **kwargs):
+        """End TM1 Session and HTTP session"""
+        try:
+            await self.POST(
+                "/ActiveSession/tm1.Close",
+                "",
+                headers={"Connection": "close"},
+                timeout=timeout,
+                async_requests_mode=False,
+                **kwargs,
+            )
+        finally:
+            await self.close()
+            self._rest._s.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        # shared sessions are closed by the owner of the RestService
+        if not self._owns_rest_service:
+            await self.close()
+            return
+
+        try:
+            await self.logout()
+        except Exception as e:
+            warnings.warn(f"Logout Failed due to Exception: {e}")
+
+    @staticmethod
+    def verify_response(response: "httpx.Response"):
+        """check if Status Code is OK
+        :Parameters:
+            `response`: httpx.Response
+                the response that is returned from a method call
+        :Exceptions:
+            TM1pyException, raises TM1pyException when Code is not 200, 204 etc.
+        """
+        if response.is_error:
+            raise TM1pyRestException(
+                response.text,
+                status_code=response.status_code,
+                reason=response.reason_phrase,
+                headers=response.headers,
+            )
@@ -1,17 +1,33 @@
 # -*- coding: utf-8 -*-
 import asyncio
+import codecs
+import copy
 import csv
 import functools
+import inspect
 import itertools
 import json
 import math
+import threading
+import time
 import uuid
 import warnings
 from collections import OrderedDict
 from concurrent.futures.thread import ThreadPoolExecutor
 from contextlib import suppress
-from io import StringIO
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from io import BytesIO, StringIO
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import ijson
 from mdxpy import MdxBuilder, MdxHierarchySet, MdxTuple, Member
@@ -27,11 +43,14 @@ from TM1py.Objects.MDXView import MDXView
 from TM1py.Objects.NativeView import NativeView
 from TM1py.Objects.Process import Process
 from TM1py.Objects.Subset import AnonymousSubset
+from TM1py.Services.CubeMetadataCache import CubeMetadataCache
 from TM1py.Services.FileService import FileService
+from TM1py.Services.MdxResultCache import MdxResultCache
 from TM1py.Services.ObjectService import ObjectService
 from TM1py.Services.ProcessService import ProcessService
 from TM1py.Services.RestService import RestService
 from TM1py.Services.SandboxService import SandboxService
+from TM1py.Services.SessionPool import SessionPool
 from TM1py.Services.ViewService import ViewService
 from TM1py.Utils import (
     CaseAndSpaceInsensitiveSet,
@@ -43,8 +62,13 @@ from TM1py.Utils.Utils import (
     CaseAndSpaceInsensitiveDict,
     CaseAndSpaceInsensitiveTuplesDict,
     abbreviate_mdx,
+    aggregate_numeric_duplicate_intersections,
+    build_arrow_table_from_cells,
+    build_arrow_table_from_cellset_dict,
+    build_cell_update_statements_from_dataframe,
     build_cellset_from_pandas_dataframe,
     build_csv_from_cellset_dict,
+    build_dataframe_from_cellset_dict,
     build_dataframe_from_csv,
     build_mdx_and_values_from_cellset,
     build_mdx_from_cellset,
@@ -58,12 +82,15 @@ from TM1py.Utils.Utils import (
     extract_compact_json_cellset,
     frame_to_significant_digits,
     get_cube,
+    get_measure_element_type,
     lower_and_drop_spaces,
     require_data_admin,
     require_ops_admin,
     require_pandas,
+    require_pyarrow,
     require_version,
     resembles_mdx,
+    run_async,
     verify_version,
     wrap_in_curly_braces,
 )
@@ -75,6 +102,14 @@ try:
 except ImportError:
     _has_pandas = False
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    _has_pyarrow = True
+except ImportError:
+    _has_pyarrow = False
+
 
 @decohints
 def tidy_cellset(func):
@@ -199,15 +234,150 @@ def odata_compact_json(return_as_dict: bool):
     return wrap
 
 
+_result_cache_state = threading.local()
+
+
+@decohints
+def cache_result(func):
+    """Serve the result of a read operation from the `MdxResultCache` of the service, if it is enabled.
+
+    Decorated function must have either `mdx` or `cube_name` and `view_name` as arguments.
+    Queries against a sandbox are never cached, as sandbox changes don't update the last data update of the cube
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = self._result_cache
+        # nested calls (e.g. execute_mdx_dataframe -> execute_mdx_csv) are covered by the outermost call
+        if cache is None or getattr(_result_cache_state, "active", False):
+            return func(self, *args, **kwargs)
+
+        bound_arguments = signature.bind(self, *args, **kwargs)
+        bound_arguments.apply_defaults()
+        arguments = dict(bound_arguments.arguments)
+        del arguments["self"]
+        arguments.update(arguments.pop("kwargs", {}))
+        # the sessions a query runs on don't affect its result
+        arguments.pop("session_pool", None)
+        if arguments.get("sandbox_name"):
+            return func(self, *args, **kwargs)
+
+        if "mdx" in arguments:
+            mdx = arguments["mdx"]
+            mdx = mdx.to_mdx() if isinstance(mdx, MdxBuilder) else mdx
+            arguments["mdx"] = cache.normalize_mdx(mdx)
+            # calculated members and sets can read from other cubes
+            cube_names = CaseAndSpaceInsensitiveSet([get_cube(mdx)])
+            cube_names.update(cache.referenced_cubes(mdx))
+        else:
+            cube_names = [arguments["cube_name"]]
+
+        # results depend on the server and on the element security of the user
+        key = cache.build_key(*self._get_result_cache_scope(), func.__name__, sorted(arguments.items()))
+        markers = tuple(self._get_last_data_update(cube_name) for cube_name in cube_names)
+        found, result = cache.get(key, markers)
+        if found:
+            return result
+
+        _result_cache_state.active = True
+        try:
+            result = func(self, *args, **kwargs)
+        finally:
+            _result_cache_state.active = False
+
+        cache.put(key, markers, result)
+        return result
+
+    return wrapper
+
+
+class _ChunkReader:
+    """file-like read access to an iterable of byte chunks"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
 class CellService(ObjectService):
     """Service to handle Read and Write operations to TM1 cubes"""
 
+    # increase when the code of the reusable blob loader processes changes
+    BLOB_LOADER_PROCESS_VERSION = 1
+
     def __init__(self, tm1_rest: RestService):
         """
 
         :param tm1_rest: instance of RestService
         """
         super().__init__(tm1_rest)
+        self._blob_loader_processes = set()
+        self._blob_loader_processes_lock = threading.Lock()
+        self._result_cache: Optional[MdxResultCache] = None
+        self._result_cache_user: Optional[str] = None
+
+    @property
+    def result_cache(self) -> Optional[MdxResultCache]:
+        return self._result_cache
+
+    def enable_result_cache(
+        self, cache: MdxResultCache = None, max_entries: int = 128, path: Union[str, Path] = None
+    ) -> MdxResultCache:
+        """Serve repeated `execute_mdx*` and `execute_view*` calls from a local `MdxResultCache`.
+        Results are only served if the last data update of the cube is unchanged.
+        Results are keyed on the server and the user, so a shared cache never serves results across users
+
+        :param cache: existing MdxResultCache to share between services. A new one is created if None
+        :param max_entries: max number of results to keep. Ignored if cache is passed
+        :param path: directory to store the results in. Results are kept in memory if None. Ignored if cache is passed
+        :return: the MdxResultCache in use
+        """
+        self._result_cache = cache or MdxResultCache(max_entries=max_entries, path=path)
+        return self._result_cache
+
+    def disable_result_cache(self):
+        self._result_cache = None
+
+    def _on_session(self, session_pool: Optional[SessionPool], function: Callable) -> Callable:
+        """Wrap function(cell_service, item) to run on a session borrowed from the pool, or on this service
+        if no pool is passed"""
+
+        def run(item):
+            if session_pool is None:
+                return function(self, item)
+            with session_pool.session() as tm1:
+                return function(tm1.cells, item)
+
+        return run
+
+    def _get_last_data_update(self, cube_name: str) -> Optional[str]:
+        try:
+            return self.get_cube_service().get_last_data_update(cube_name)
+        except TM1pyRestException as ex:
+            # bracketed names followed by a tuple that are not cubes
+            if ex.status_code == 404:
+                return None
+            raise
+
+    def _get_result_cache_scope(self) -> Tuple[str, str]:
+        """server and user of the session. Results are only shared within the same scope"""
+        if self._result_cache_user is None:
+            self._result_cache_user = self._rest.GET("/ActiveUser/Name/$value").text
+        return self._rest._base_url, self._result_cache_user.lower()
 
     def get_value(
         self,
@@ -846,18 +1016,20 @@ class CellService(ObjectService):
         url = add_url_parameters(url, **{"!sandbox": sandbox_name})
         return self._rest.POST(url=url, data=json.dumps(payload), **kwargs)
 
+    @property
+    def metadata_cache(self) -> CubeMetadataCache:
+        """cube metadata of the connection, shared by all services"""
+        return self._rest.metadata_cache
+
     def get_dimension_names_for_writing(self, cube_name: str, **kwargs) -> List[str]:
-        """Get dimensions of a cube. Skip sandbox dimension
+        """Get dimensions of a cube. Skip sandbox dimension.
+        Served from the `metadata_cache` of the connection
 
         :param cube_name:
         :param kwargs:
         :return:
         """
-        from TM1py.Services import CubeService
-
-        cube_service = CubeService(self._rest)
-        dimensions = cube_service.get_dimension_names(cube_name, True, **kwargs)
-        return dimensions
+        return self.metadata_cache.get_dimension_names(cube_name, skip_sandbox_dimension=True, **kwargs)
 
     @require_pandas
     def write_dataframe(
@@ -881,6 +1053,7 @@ class CellService(ObjectService):
         clear_view: str = None,
         static_dimension_elements: Dict = None,
         infer_column_order: bool = False,
+        use_persistent_process: bool = False,
         **kwargs,
     ) -> str:
         """
@@ -910,6 +1083,8 @@ class CellService(ObjectService):
         :param static_dimension_elements: Dict of fixed dimension element pairs. Column is created for you.
         :param infer_column_order: bool indicating whether the column order of the dataframe should automatically be
             inferred and mapped to the dimension order in the cube.
+        :param use_persistent_process: with use_blob=True, install a reusable loader process per cube signature
+            on first use and run it instead of compiling an unbound process on every call
         :return: changeset or None
         """
         if not isinstance(data, pd.DataFrame):
@@ -947,7 +1122,13 @@ class CellService(ObjectService):
         if not len(data.columns) == len(dimensions) + 1:
             raise ValueError("Number of columns in 'data' DataFrame must be number of dimensions in cube + 1")
 
-        cells = build_cellset_from_pandas_dataframe(data, sum_numeric_duplicates=sum_numeric_duplicates)
+        if use_blob and not use_ti:
+            # blobs are built from the data frame directly, without the intermediate cellset
+            if isinstance(data.index, pd.MultiIndex):
+                data.reset_index(inplace=True)
+            cells = aggregate_numeric_duplicate_intersections(data) if sum_numeric_duplicates else data
+        else:
+            cells = build_cellset_from_pandas_dataframe(data, sum_numeric_duplicates=sum_numeric_duplicates)
 
         return self.write(
             cube_name=cube_name,
@@ -966,6 +1147,7 @@ class CellService(ObjectService):
             measure_dimension_elements=measure_dimension_elements,
             allow_spread=allow_spread,
             clear_view=clear_view,
+            use_persistent_process=use_persistent_process,
             **kwargs,
         )
 
@@ -983,6 +1165,7 @@ class CellService(ObjectService):
         sandbox_name: str = None,
         precision: int = None,
         measure_dimension_elements: Dict = None,
+        session_pool: SessionPool = None,
         **kwargs,
     ) -> Optional[str]:
         """Write asynchronously
@@ -1000,6 +1183,8 @@ class CellService(ObjectService):
         Necessary to decrease when dealing with large numbers to avoid "number too long" TI syntax error.
         :param measure_dimension_elements: dictionary of measure elements and their types to improve
         performance when `use_ti` is `True`.
+        :param session_pool: SessionPool. Write the chunks through independent TM1 sessions from the pool
+        instead of the session of this service
         :param kwargs:
         :return:
         """
@@ -1015,8 +1200,8 @@ class CellService(ObjectService):
             for _ in range(0, len(data), slice_size):
                 yield {k: data[k] for k in itertools.islice(it, slice_size)}
 
-        def _write(chunk: Dict):
-            return self.write(
+        def _write_on(cell_service: "CellService", chunk: Dict):
+            return cell_service.write(
                 cube_name=cube_name,
                 cellset_as_dict=chunk,
                 dimensions=dimensions,
@@ -1033,6 +1218,7 @@ class CellService(ObjectService):
             failures = []
 
             with ThreadPoolExecutor(max_workers) as executor:
+                _write = self._on_session(session_pool, _write_on)
                 futures = [loop.run_in_executor(executor, _write, chunk) for chunk in _chunks(data)]
 
                 for future in futures:
@@ -1043,7 +1229,7 @@ class CellService(ObjectService):
 
             return failures
 
-        exceptions = asyncio.run(_write_async(cells))
+        exceptions = run_async(_write_async(cells))
         if not exceptions:
             return
 
@@ -1072,6 +1258,7 @@ class CellService(ObjectService):
         sandbox_name: str = None,
         deactivate_transaction_log: bool = False,
         reactivate_transaction_log: bool = False,
+        session_pool: SessionPool = None,
         **kwargs,
     ):
         """Write DataFrame into a cube using unbound TI processes in a multi-threading way. Requires admin permissions.
@@ -1087,6 +1274,8 @@ class CellService(ObjectService):
         :param sandbox_name: name of the sandbox or None
         :param deactivate_transaction_log:
         :param reactivate_transaction_log:
+        :param session_pool: SessionPool. Write the slices through independent TM1 sessions from the pool
+        instead of the session of this service
         :return: the Future’s result or raise exception.
         """
         if not isinstance(data, pd.DataFrame):
@@ -1101,8 +1290,8 @@ class CellService(ObjectService):
         def _chunks(df: "pd.DataFrame"):
             return [df.iloc[i : i + slice_size_of_dataframe] for i in range(0, df.shape[0], slice_size_of_dataframe)]
 
-        def _write(chunk: "pd.DataFrame"):
-            return self.write_dataframe(
+        def _write_on(cell_service: "CellService", chunk: "pd.DataFrame"):
+            return cell_service.write_dataframe(
                 cube_name=cube_name,
                 data=chunk,
                 dimensions=dimensions,
@@ -1117,6 +1306,7 @@ class CellService(ObjectService):
             failures = []
 
             with ThreadPoolExecutor(max_workers) as executor:
+                _write = self._on_session(session_pool, _write_on)
                 futures = [loop.run_in_executor(executor, _write, chunk) for chunk in _chunks(df)]
 
                 for future in futures:
@@ -1127,7 +1317,7 @@ class CellService(ObjectService):
 
             return failures
 
-        exceptions = asyncio.run(_write_async(data))
+        exceptions = run_async(_write_async(data))
         if not exceptions:
             return
 
@@ -1138,6 +1328,221 @@ class CellService(ObjectService):
             attempts=sum([exception.attempts if hasattr(exception, "attempts") else 1 for exception in exceptions]),
         )
 
+    @require_pandas
+    @manage_transaction_log
+    def write_dataframe_bulk(
+        self,
+        cube_name: str,
+        data: "pd.DataFrame",
+        rows_per_blob: int = 1_000_000,
+        max_workers: int = 8,
+        dimensions: Iterable[str] = None,
+        increment: bool = False,
+        sandbox_name: str = None,
+        deactivate_transaction_log: bool = False,
+        reactivate_transaction_log: bool = False,
+        skip_non_updateable: bool = False,
+        sum_numeric_duplicates: bool = True,
+        allow_spread: bool = False,
+        retries: int = 2,
+        remove_blob: bool = True,
+        multi_part_upload: bool = None,
+        max_mb_per_part: float = 200,
+        upload_workers: int = 1,
+        use_persistent_process: bool = False,
+        **kwargs,
+    ) -> List[Dict]:
+        """Write a large DataFrame into a cube through CSV blobs and one reusable TI process. Requires admin permissions.
+        Unlike `write_dataframe_async`, the loader process is created once and receives the blob name as parameter.
+        Each blob is built, uploaded (multipart on v12) and loaded in its own thread, so at most `max_workers`
+        blobs are held in memory at a time.
+        Column order must match dimensions in the target cube with an additional column for the values.
+        Column names are not relevant.
+
+        :param cube_name:
+        :param data: Pandas Data Frame
+        :param rows_per_blob: Number of rows written to each blob, e.g. 1,000,000
+        :param max_workers: Max number of blobs uploaded and loaded in parallel
+        :param dimensions:
+        :param increment: increment or update cell values. Defaults to False.
+        :param sandbox_name: name of the sandbox or None
+        :param deactivate_transaction_log:
+        :param reactivate_transaction_log:
+        :param skip_non_updateable: skip cells that are not updateable (e.g. rule derived or consolidated)
+        :param sum_numeric_duplicates: Aggregate numerical values for duplicated intersections
+        :param allow_spread: allow TI process to use CellPutProportionalSpread on C elements
+        :param retries: Number of times a blob upload is repeated after a REST error or a blob is reloaded after
+            an aborted load. Loads that fail with a REST error are not repeated, as they may have run on the server
+        :param remove_blob: choose False to persist blobs after write. Can be helpful for troubleshooting.
+        :param multi_part_upload: use multipart upload for the blobs (only available from TM1 12 onwards)
+        :param max_mb_per_part: max size of a part in a multipart upload
+        :param upload_workers: max number of threads uploading the parts of one blob
+        :param use_persistent_process: run the reusable loader process for the cube signature
+            instead of creating a temporary process for this call
+        :return: list of dicts with statistics per blob: partition, file_name, rows, bytes, attempts, status,
+            error_log_file, upload_seconds, load_seconds, rows_per_second
+        """
+        if not isinstance(data, pd.DataFrame):
+            raise ValueError("argument 'data' must of type DataFrame")
+
+        if rows_per_blob < 1:
+            raise ValueError("argument 'rows_per_blob' must be a positive integer")
+
+        if not dimensions:
+            dimensions = self.get_dimension_names_for_writing(cube_name=cube_name)
+
+        if not len(data.columns) == len(dimensions) + 1:
+            raise ValueError("Number of columns in 'data' DataFrame must be number of dimensions in cube + 1")
+
+        if isinstance(data.index, pd.MultiIndex):
+            data = data.reset_index()
+
+        if sum_numeric_duplicates:
+            # don't mutate passed data frame. Aggregation works on a copy
+            data = aggregate_numeric_duplicate_intersections(data.copy())
+
+        if data.empty:
+            return []
+
+        process_service = ProcessService(self._rest)
+        file_service = FileService(self._rest)
+
+        unique_name = self.suggest_unique_object_name()
+        # v11 automatically adds blb file extensions to documents created via the contents api
+        blob_suffix = "" if verify_version(required_version="12", version=self.version) else ".blb"
+
+        if use_persistent_process:
+            process = None
+            loader_arguments = dict(
+                cube_name=cube_name,
+                dimension_count=len(dimensions),
+                increment=increment,
+                skip_non_updateable=skip_non_updateable,
+                allow_spread=allow_spread,
+                sandbox_name=sandbox_name,
+            )
+            process_name = self._get_or_create_blob_loader_process(**loader_arguments)
+            process_parameters = {"pCube": cube_name, "pSandbox": sandbox_name or "", "pClearView": ""}
+        else:
+            process_name = "}" + unique_name
+            process = self._build_blob_to_cube_process(
+                cube_name=cube_name,
+                process_name=process_name,
+                blob_filename=f"{unique_name}.0.csv",
+                dimensions=list(dimensions),
+                increment=increment,
+                skip_non_updateable=skip_non_updateable,
+                sandbox_name=sandbox_name,
+                allow_spread=allow_spread,
+                clear_view=None,
+                blob_filename_parameter="pFileName",
+            )
+            process_parameters = {}
+
+        def _build_csv(chunk: "pd.DataFrame") -> bytes:
+            csv_content = StringIO()
+            csv_writer = csv.writer(csv_content, delimiter=",", quoting=csv.QUOTE_ALL)
+            csv_writer.writerows(
+                row[:-1] + (row[-1].replace("\r", "").replace("\n", "") if isinstance(row[-1], str) else row[-1],)
+                for row in chunk.itertuples(index=False, name=None)
+            )
+            return csv_content.getvalue().encode("utf-8")
+
+        def _load(partition: int, chunk: "pd.DataFrame") -> Dict:
+            file_name = f"{unique_name}.{partition}.csv"
+            statistics = {
+                "partition": partition,
+                "file_name": file_name,
+                "rows": len(chunk),
+                "bytes": 0,
+                "attempts": 0,
+                "status": None,
+                "error_log_file": None,
+                "upload_seconds": 0.0,
+                "load_seconds": 0.0,
+                "rows_per_second": 0.0,
+            }
+
+            uploaded = False
+            try:
+                for attempt in range(1, retries + 2):
+                    statistics["attempts"] = attempt
+                    if not uploaded:
+                        try:
+                            start = time.perf_counter()
+                            file_content = _build_csv(chunk)
+                            statistics["bytes"] = len(file_content)
+                            file_service.create(
+                                file_name=file_name,
+                                file_content=file_content,
+                                multi_part_upload=multi_part_upload,
+                                max_mb_per_part=max_mb_per_part,
+                                max_workers=upload_workers,
+                            )
+                            del file_content
+                            uploaded = True
+                            statistics["upload_seconds"] = time.perf_counter() - start
+                        except TM1pyRestException:
+                            if attempt > retries:
+                                raise
+                            continue
+
+                    # REST errors during the load are not retried. The process may have run on the server
+                    # and loading the blob again would write (or increment) its values twice
+                    start = time.perf_counter()
+                    if use_persistent_process:
+                        success, status, error_log_file = self._execute_blob_loader_process(
+                            process_name, loader_arguments, pFileName=file_name + blob_suffix, **process_parameters
+                        )
+                    else:
+                        success, status, error_log_file = process_service.execute_with_return(
+                            process_name=process_name, pFileName=file_name + blob_suffix
+                        )
+                    statistics["load_seconds"] = time.perf_counter() - start
+
+                    statistics["status"] = status
+                    statistics["error_log_file"] = error_log_file
+                    # aborted loads are rolled back by TM1 and can be repeated. Minor errors are committed.
+                    if success or status == "HasMinorErrors":
+                        break
+
+                seconds = statistics["upload_seconds"] + statistics["load_seconds"]
+                statistics["rows_per_second"] = statistics["rows"] / seconds if seconds else 0.0
+                return statistics
+
+            finally:
+                if uploaded and remove_blob:
+                    file_service.delete(file_name=file_name)
+
+        async def _write_async(df: "pd.DataFrame"):
+            loop = asyncio.get_event_loop()
+
+            with ThreadPoolExecutor(max_workers) as executor:
+                futures = [
+                    loop.run_in_executor(executor, _load, partition, df.iloc[i : i + rows_per_blob])
+                    for partition, i in enumerate(range(0, df.shape[0], rows_per_blob))
+                ]
+                return [await future for future in futures]
+
+        if process:
+            process_service.create(process)
+        try:
+            statistics = run_async(_write_async(data))
+        finally:
+            if process:
+                process_service.delete(process_name)
+
+        failures = [partition for partition in statistics if partition["status"] != "CompletedSuccessfully"]
+        if not failures:
+            return statistics
+
+        # merge all failures into one combined Exception
+        raise TM1pyWritePartialFailureException(
+            statuses=[partition["status"] for partition in failures],
+            error_log_files=[partition["error_log_file"] for partition in failures],
+            attempts=sum(partition["attempts"] for partition in failures),
+        )
+
     @manage_changeset
     def write_value(
         self,
@@ -1188,6 +1593,8 @@ class CellService(ObjectService):
         remove_blob: bool = True,
         allow_spread: bool = False,
         clear_view: str = None,
+        use_persistent_process: bool = False,
+        max_workers: int = 1,
         **kwargs,
     ) -> Optional[str]:
         """Write values to a cube
@@ -1217,12 +1624,21 @@ class CellService(ObjectService):
         :param remove_blob: remove blob file after writing with use_blob=True
         :param allow_spread: allow TI process in use_blob or use_ti to use CellPutProportionalSpread on C elements
         :param clear_view: name of cube view to clear before writing
+        :param use_persistent_process: with use_blob=True, install a reusable loader process per cube signature
+            on first use and run it instead of compiling an unbound process on every call
+        :param max_workers: with use_ti=True, number of unbound processes executed in parallel
         :return: changeset or None
         """
 
         if clear_view and not use_blob:
             raise ValueError("'clear_view' can only be used in conjunction with 'use_blob'")
 
+        if use_persistent_process and not use_blob:
+            raise ValueError("'use_persistent_process' can only be used in conjunction with 'use_blob'")
+
+        if max_workers > 1 and not use_ti:
+            raise ValueError("'max_workers' can only be used in conjunction with 'use_ti'")
+
         if use_ti:
             return self.write_through_unbound_process(
                 cube_name=cube_name,
@@ -1236,6 +1652,7 @@ class CellService(ObjectService):
                 measure_dimension_elements=measure_dimension_elements,
                 dimensions=dimensions,
                 allow_spread=allow_spread,
+                max_workers=max_workers,
                 **kwargs,
             )
 
@@ -1252,6 +1669,7 @@ class CellService(ObjectService):
                 remove_blob=remove_blob,
                 allow_spread=allow_spread,
                 clear_view=clear_view,
+                use_persistent_process=use_persistent_process,
                 **kwargs,
             )
 
@@ -1337,6 +1755,7 @@ class CellService(ObjectService):
         is_attribute_cube: bool = None,
         dimensions: List = None,
         allow_spread: bool = False,
+        max_workers: int = 1,
         **kwargs,
     ):
         """
@@ -1351,9 +1770,15 @@ class CellService(ObjectService):
             When all written values are numeric you can pass a defaultdict with default key: 'Numeric'
         :param is_attribute_cube: bool or None
         :param allow_spread: allow TI process in use_blob or use_ti to use CellPutProportionalSpread on C elements
+        :param max_workers: number of processes executed in parallel when the statements exceed one process.
+            Processes may complete in any order. With allow_spread they are always executed one after the other,
+            as spreads may overlap with values written by other processes
         :param kwargs: Additional arguments for the REST request.
         :return: Success: bool, Messages: list, ChangeSet: None
         """
+        if max_workers < 1:
+            raise ValueError("argument 'max_workers' must be a positive integer")
+
         if is_attribute_cube is None:
             is_attribute_cube = cube_name.lower().startswith("}elementattributes_")
 
@@ -1375,6 +1800,16 @@ class CellService(ObjectService):
                 skip_non_updateable=skip_non_updateable,
             )
 
+        elif _has_pandas and not allow_spread:
+            statements = self._build_cell_update_statements_vectorized(
+                cube_name=cube_name,
+                cellset_as_dict=cellset_as_dict,
+                increment=increment,
+                measure_dimension_elements=measure_dimension_elements,
+                precision=precision,
+                skip_non_updateable=skip_non_updateable,
+            )
+
         else:
             if not dimensions and allow_spread:
                 dimensions = self.get_dimension_names_for_writing(cube_name=cube_name, **kwargs)
@@ -1389,25 +1824,30 @@ class CellService(ObjectService):
                 allow_spread=allow_spread,
             )
 
-        chunk = list()
+        # each process takes max_statements in the prolog and max_statements in the epilog
+        chunk_size = Process.max_statements(self.version) * 2
+        chunks = [statements[i : i + chunk_size] for i in range(0, len(statements), chunk_size)] or [[]]
 
-        max_statements = Process.max_statements(self.version)
-        for n, statement in enumerate(statements):
-            chunk.append(statement)
-            if n > 0 and n % (max_statements * 2) == 0:
-                success, status, log_file = self._execute_write_statements(chunk, enable_sandbox, kwargs)
-                successes.append(success)
-                if not success:
-                    statuses.append(status)
-                    log_files.append(log_file)
-
-                chunk = list()
-
-        success, status, log_file = self._execute_write_statements(chunk, enable_sandbox, kwargs)
-        successes.append(success)
-        if not success:
-            statuses.append(status)
-            log_files.append(log_file)
+        def _execute(chunk: List[str]) -> Tuple[bool, str, str]:
+            return self._execute_write_statements(chunk, enable_sandbox, kwargs)
+
+        async def _execute_async():
+            loop = asyncio.get_event_loop()
+
+            with ThreadPoolExecutor(max_workers) as executor:
+                futures = [loop.run_in_executor(executor, _execute, chunk) for chunk in chunks]
+                return [await future for future in futures]
+
+        if max_workers > 1 and len(chunks) > 1 and not allow_spread:
+            results = run_async(_execute_async())
+        else:
+            results = [_execute(chunk) for chunk in chunks]
+
+        for success, status, log_file in results:
+            successes.append(success)
+            if not success:
+                statuses.append(status)
+                log_files.append(log_file)
 
         if not any(successes):
             if "HasMinorErrors" in statuses:
@@ -1425,7 +1865,7 @@ class CellService(ObjectService):
     def write_through_blob(
         self,
         cube_name: str,
-        cellset_as_dict: dict,
+        cellset_as_dict: Union[Dict, "pd.DataFrame"],
         increment: bool = False,
         sandbox_name: str = None,
         skip_non_updateable: bool = False,
@@ -1433,12 +1873,16 @@ class CellService(ObjectService):
         dimensions: str = None,
         allow_spread: bool = False,
         clear_view: str = None,
+        use_persistent_process: bool = False,
+        compression: str = None,
         **kwargs,
     ):
         """
-        Writes data back to TM1 via an unbound TI process having an uploaded CSV as data source
+        Writes data back to TM1 via an unbound TI process having an uploaded CSV as data source.
+        The CSV is built and uploaded in chunks, so that the client doesn't hold the complete file in memory
         :param cube_name: str
-        :param cellset_as_dict:
+        :param cellset_as_dict: cellset as dict or DataFrame with element columns in the natural order
+            of the cube dimensions and the values in the last column
         :param increment: increment or update cell values
         :param sandbox_name: str
         :param skip_non_updateable: skip cells that are not updateable (e.g. rule derived or consolidated)
@@ -1446,42 +1890,67 @@ class CellService(ObjectService):
         :param dimensions: optional. Dimension names in their natural order. Will speed up the execution!
         :param allow_spread: allow TI process in use_blob or use_ti to use CellPutProportionalSpread on C elements.
         :param clear_view: name of cube view to clear before writing
+        :param use_persistent_process: install a reusable loader process per cube signature on first use
+            and run it instead of compiling an unbound process on every call
+        :param compression: 'gzip' or 'zstd' to upload the blob compressed.
+            Requires a server that accepts compressed request bodies
         :param kwargs: Additional arguments for the REST request
         :return: Success: bool, Messages: list, ChangeSet: None
         """
 
         process_service = ProcessService(self._rest)
-        cube_service = self.get_cube_service()
         file_service = FileService(self._rest)
 
         unique_name = self.suggest_unique_object_name()
 
-        # Transform cells to format that's consumable for TI
-        csv_content = StringIO()
-        csv_writer = csv.writer(csv_content, delimiter=",", quoting=csv.QUOTE_ALL)
-        csv_writer.writerows(
-            list(elements) + [value.replace("\r", "").replace("\n", "") if isinstance(value, str) else value]
-            for elements, value in cellset_as_dict.items()
-        )
+        # Transform cells to format that's consumable for TI. CSV is encoded and uploaded chunk by chunk
+        if isinstance(cellset_as_dict, pd.DataFrame):
+            csv_chunks = self._build_blob_csv_chunks_from_dataframe(cellset_as_dict)
+        else:
+            csv_chunks = self._build_blob_csv_chunks(cellset_as_dict)
 
         file_name = f"{unique_name}.csv"
-        file_service.create(file_name=file_name, file_content=csv_content.getvalue().encode("utf-8"), **kwargs)
+        file_service.create(file_name=file_name, file_content=csv_chunks, compression=compression, **kwargs)
 
         try:
-            # Create and execute unbound TI process to load blob file to cube
-            process = self._build_blob_to_cube_process(
-                cube_name=cube_name,
-                process_name=unique_name,
-                blob_filename=file_name,
-                dimensions=dimensions or cube_service.get_dimension_names(cube_name),
-                increment=increment,
-                skip_non_updateable=skip_non_updateable,
-                sandbox_name=sandbox_name,
-                allow_spread=allow_spread,
-                clear_view=clear_view,
-            )
+            dimensions = dimensions or self.get_dimension_names_for_writing(cube_name)
+
+            if use_persistent_process:
+                loader_arguments = dict(
+                    cube_name=cube_name,
+                    dimension_count=len(dimensions),
+                    increment=increment,
+                    skip_non_updateable=skip_non_updateable,
+                    allow_spread=allow_spread,
+                    sandbox_name=sandbox_name,
+                )
+                process_name = self._get_or_create_blob_loader_process(**loader_arguments)
+                # v11 automatically adds blb file extensions to documents created via the contents api
+                blob_suffix = "" if verify_version(required_version="12", version=self.version) else ".blb"
+                success, status, log_file = self._execute_blob_loader_process(
+                    process_name,
+                    loader_arguments,
+                    pCube=cube_name,
+                    pFileName=file_name + blob_suffix,
+                    pSandbox=sandbox_name or "",
+                    pClearView=clear_view or "",
+                )
+
+            else:
+                # Create and execute unbound TI process to load blob file to cube
+                process = self._build_blob_to_cube_process(
+                    cube_name=cube_name,
+                    process_name=unique_name,
+                    blob_filename=file_name,
+                    dimensions=dimensions,
+                    increment=increment,
+                    skip_non_updateable=skip_non_updateable,
+                    sandbox_name=sandbox_name,
+                    allow_spread=allow_spread,
+                    clear_view=clear_view,
+                )
+                success, status, log_file = process_service.execute_process_with_return(process=process, **kwargs)
 
-            success, status, log_file = process_service.execute_process_with_return(process=process, **kwargs)
             if not success:
                 if status in ["HasMinorErrors"]:
                     raise TM1pyWritePartialFailureException([status], [log_file], 1)
@@ -1492,6 +1961,50 @@ class CellService(ObjectService):
             if remove_blob:
                 file_service.delete(file_name=file_name)
 
+    @staticmethod
+    def _build_blob_csv_chunks(cellset_as_dict: Dict, rows_per_chunk: int = 100_000) -> Generator[bytes, None, None]:
+        csv_content = StringIO()
+        csv_writer = csv.writer(csv_content, delimiter=",", quoting=csv.QUOTE_ALL)
+
+        cells = iter(cellset_as_dict.items())
+        while True:
+            csv_writer.writerows(
+                list(elements) + [value.replace("\r", "").replace("\n", "") if isinstance(value, str) else value]
+                for elements, value in itertools.islice(cells, rows_per_chunk)
+            )
+            if not csv_content.tell():
+                return
+
+            yield csv_content.getvalue().encode("utf-8")
+            csv_content.seek(0)
+            csv_content.truncate()
+
+    @staticmethod
+    def _build_blob_csv_chunks_from_dataframe(
+        data: "pd.DataFrame", rows_per_chunk: int = 100_000
+    ) -> Generator[bytes, None, None]:
+        for i in range(0, len(data), rows_per_chunk):
+            chunk = data.iloc[i : i + rows_per_chunk]
+            values = chunk.iloc[:, -1]
+            if not pd.api.types.is_numeric_dtype(values):
+                is_string = values.map(lambda value: isinstance(value, str)).astype(bool)
+                chunk = chunk.copy()
+                chunk.iloc[:, -1] = values.where(
+                    ~is_string,
+                    values.astype(str).str.replace("\r", "", regex=False).str.replace("\n", "", regex=False),
+                )
+
+            csv_content = BytesIO()
+            chunk.to_csv(
+                csv_content,
+                header=False,
+                index=False,
+                quoting=csv.QUOTE_ALL,
+                lineterminator="\r\n",
+                encoding="utf-8",
+            )
+            yield csv_content.getvalue()
+
     def _build_blob_to_cube_process(
         self,
         cube_name: str,
@@ -1503,6 +2016,7 @@ class CellService(ObjectService):
         sandbox_name: str,
         allow_spread: bool,
         clear_view: str,
+        blob_filename_parameter: str = None,
     ) -> Process:
 
         # v11 automatically adds blb file extensions to documents created via the contents api
@@ -1527,6 +2041,13 @@ class CellService(ObjectService):
         {self.generate_enable_sandbox_ti(sandbox_name)}
         """
 
+        # Let the blob be passed as parameter so the process can be reused for multiple blobs
+        if blob_filename_parameter:
+            dataload_process.add_parameter(name=blob_filename_parameter, prompt="", value=blob_filename)
+            dataload_process.prolog_procedure = (
+                dataload_process.prolog_procedure + f"\rDatasourceNameForServer = {blob_filename_parameter};\r"
+            )
+
         if clear_view:
             dataload_process.prolog_procedure = (
                 dataload_process.prolog_procedure + f"\rViewZeroOut('{cube_name}', '{clear_view}');\r"
@@ -1607,62 +2128,244 @@ class CellService(ObjectService):
 
         return dataload_process
 
-    def _build_cube_to_blob_process(
+    def _build_blob_to_cube_loader_process(
         self,
-        cube: str,
-        variables: List[str],
-        skip_variables: List[str],
-        top: int,
-        skip: int,
-        skip_zeros: bool,
-        skip_consolidated_cells: bool,
-        skip_rule_derived_cells: bool,
-        value_separator: str,
         process_name: str,
-        view_name: str,
-        file_name: str,
-        header_line: str,
-        quote_character: str = '"',
-        sandbox_name: str = None,
+        dimension_count: int,
+        increment: bool,
+        skip_non_updateable: bool,
+        allow_spread: bool,
+        enable_sandbox: bool,
     ) -> Process:
-        process = Process(
+        """Build a reusable variant of the process from `_build_blob_to_cube_process`.
+        Cube, blob file, sandbox and clear view are passed as parameters: pCube, pFileName, pSandbox, pClearView
+
+        :param process_name: name of the process
+        :param dimension_count: number of dimensions of the cubes the process can write to
+        :param increment: increment or update cell values
+        :param skip_non_updateable: skip cells that are not updateable (e.g. rule derived or consolidated)
+        :param allow_spread: allow TI process to use CellPutProportionalSpread on C elements
+        :param enable_sandbox: process sets the active sandbox from pSandbox
+        :return: Process
+        """
+        dataload_process = Process(
             name=process_name,
-            datasource_type="TM1CubeView",
-            datasource_view=view_name,
-            datasource_data_source_name_for_server=cube,
-            datasource_data_source_name_for_client=cube,
-            datasource_ascii_delimiter_char=value_separator,
+            datasource_type="ASCII",
+            datasource_ascii_header_records=0,
+            datasource_ascii_delimiter_char=",",
             datasource_ascii_decimal_separator=".",
             datasource_ascii_thousand_separator="",
+            datasource_ascii_quote_character='"',
         )
+        for parameter in ("pCube", "pFileName", "pSandbox", "pClearView"):
+            dataload_process.add_parameter(name=parameter, prompt="", value="", parameter_type="String")
+
+        dimension_variables = [f"sDim{n}" for n in range(1, dimension_count + 1)]
+        element_variables = [f"v{n}" for n in range(1, dimension_count + 1)]
+
+        if enable_sandbox:
+            enable_sandbox_statement = """
+        If(pSandbox @= '');
+            ServerActiveSandboxSet('');SetUseActiveSandboxProperty(0);
+        Else;
+            ServerActiveSandboxSet(pSandbox);SetUseActiveSandboxProperty(1);
+        EndIf;"""
+        else:
+            enable_sandbox_statement = ""
 
-        # v11 automatically adds blb file extensions to documents created via the contents api
-        if not verify_version(required_version="12", version=self.version):
-            file_name += ".blb"
-
-        # Create variables in process data source as all String
-        for variable in variables:
-            process.add_variable(name=variable, variable_type="String")
+        dimension_statements = "\r".join(
+            f"{variable} = TabDim(pCube, {n});" for n, variable in enumerate(dimension_variables, start=1)
+        )
 
-        prolog_procedure = f"""
-        {self.generate_enable_sandbox_ti(sandbox_name)}
-        ViewExtractSkipCalcsSet('{cube}', '{view_name}', {'1' if skip_consolidated_cells else '0'});
-        ViewExtractSkipRuleValuesSet('{cube}', '{view_name}', {'1' if skip_rule_derived_cells else '0'});
-        ViewExtractSkipZeroesSet('{cube}', '{view_name}', {'1' if skip_zeros else '0'});
-        DatasourceAsciiDelimiter='{value_separator}';
-        DatasourceAsciiQuoteCharacter='{quote_character}';
-        DatasourceASCIIDecimalSeparator='.';
-        nRecord=0;
+        dataload_process.prolog_procedure = f"""
+        SetInputCharacterSet('TM1CS_UTF8');
+        {enable_sandbox_statement}
+        DatasourceNameForServer = pFileName;
+        If(pClearView @<> '');
+            ViewZeroOut(pCube, pClearView);
+        EndIf;
+        {dimension_statements}
         """
 
-        process.prolog_procedure = prolog_procedure
+        for variable in element_variables:
+            dataload_process.add_variable(name=variable, variable_type="String")
+        value_variable = "vValue"
+        dataload_process.add_variable(name=value_variable, variable_type="String")
 
-        # ignore some variable in file and output variables ordered by their ordinal e.g. v2,v4,v5,v11
-        output_variables = sorted(set(variables) - set(skip_variables), key=lambda v: int(v[1:]))
-        comma_sep_variables = ",".join(output_variables)
-        data_procedure_pre = f"""
-        IF (nRecord = 0);
-          SetOutputCharacterSet('{file_name}','TM1CS_UTF8');
+        comma_sep_var_elements = ",".join(element_variables)
+        measure_dimension, measure_element = dimension_variables[-1], element_variables[-1]
+
+        if skip_non_updateable:
+            cell_is_updateable_pre = f"If( CellIsUpdateable(pCube,{comma_sep_var_elements}) = 1 );"
+            cell_is_updateable_post = "\rElse;\r" "   ItemSkip;\r" "EndIf;\r"
+        else:
+            cell_is_updateable_pre = ""
+            cell_is_updateable_post = ""
+
+        numeric_function_str = "CellIncrementN" if increment else "CellPutN"
+
+        measure_type_equal = f"ElementType({measure_dimension}, '', {measure_element}) @= "
+        numeric_write_condition = "% \n".join(
+            [measure_type_equal + possible_type for possible_type in ["'N'", "'AN'", "'C'", "''"]]
+        )
+        string_write_condition = "% \n".join(
+            [measure_type_equal + possible_type for possible_type in ["'S'", "'AS'", "'AA'"]]
+        )
+
+        if allow_spread:
+            any_c_element_in_write = "% \n".join(
+                [f"ElementType({dim}, '', {ele}) @= 'C'" for dim, ele in zip(dimension_variables, element_variables)]
+            )
+            numeric_write_statement = f"""
+            nValue = StringToNumber({value_variable});
+            IF({any_c_element_in_write});
+                CellPutProportionalSpread(nValue,pCube,{comma_sep_var_elements});
+            ELSE;
+                {numeric_function_str}(nValue,pCube,{comma_sep_var_elements});
+            ENDIF;
+            """
+        else:
+            numeric_write_statement = f"""
+            nValue = StringToNumber({value_variable});
+            {numeric_function_str}(nValue,pCube,{comma_sep_var_elements});
+            """
+
+        input_statement = f"""
+        If({numeric_write_condition});
+            {numeric_write_statement}
+        ElseIf({string_write_condition});
+            CellPutS({value_variable},pCube,{comma_sep_var_elements});
+        EndIf;"""
+
+        dataload_process.data_procedure = cell_is_updateable_pre + input_statement + cell_is_updateable_post
+        return dataload_process
+
+    def _get_or_create_blob_loader_process(
+        self,
+        cube_name: str,
+        dimension_count: int,
+        increment: bool,
+        skip_non_updateable: bool,
+        allow_spread: bool,
+        sandbox_name: str = None,
+    ) -> str:
+        """Install the reusable loader process for the cube signature on first use
+
+        :return: name of the process
+        """
+        if sandbox_name and not self._rest.sandboxing_disabled and not self.sandbox_exists(sandbox_name):
+            raise ValueError(f"Sandbox '{sandbox_name}' does not exist")
+
+        # attribute cubes can not be incremented
+        if cube_name.lower().startswith("}elementattributes_"):
+            increment = False
+
+        enable_sandbox = not self._rest.sandboxing_disabled
+        flags = "".join(str(int(flag)) for flag in (increment, allow_spread, skip_non_updateable, enable_sandbox))
+        process_name = f"}}tm1py.BlobToCube.v{self.BLOB_LOADER_PROCESS_VERSION}.{dimension_count}.{flags}"
+
+        with self._blob_loader_processes_lock:
+            if process_name in self._blob_loader_processes:
+                return process_name
+
+            process_service = ProcessService(self._rest)
+            if not process_service.exists(process_name):
+                process = self._build_blob_to_cube_loader_process(
+                    process_name=process_name,
+                    dimension_count=dimension_count,
+                    increment=increment,
+                    skip_non_updateable=skip_non_updateable,
+                    allow_spread=allow_spread,
+                    enable_sandbox=enable_sandbox,
+                )
+                try:
+                    process_service.create(process)
+                except TM1pyRestException:
+                    # another session may have installed the process in the meantime
+                    if not process_service.exists(process_name):
+                        raise
+
+            self._blob_loader_processes.add(process_name)
+            return process_name
+
+    def _execute_blob_loader_process(
+        self, process_name: str, loader_arguments: Dict, **parameters
+    ) -> Tuple[bool, str, str]:
+        """Execute the reusable loader process. Reinstall it once, if it was deleted on the server
+
+        :param process_name: name as returned by `_get_or_create_blob_loader_process`
+        :param loader_arguments: arguments that `_get_or_create_blob_loader_process` was called with
+        :param parameters: process parameters
+        :return: success (boolean), status (String), error_log_file (String)
+        """
+        process_service = ProcessService(self._rest)
+        try:
+            return process_service.execute_with_return(process_name=process_name, **parameters)
+        except TM1pyRestException as ex:
+            if not ex.status_code == 404:
+                raise
+
+        with self._blob_loader_processes_lock:
+            self._blob_loader_processes.discard(process_name)
+        process_name = self._get_or_create_blob_loader_process(**loader_arguments)
+        return process_service.execute_with_return(process_name=process_name, **parameters)
+
+    def _build_cube_to_blob_process(
+        self,
+        cube: str,
+        variables: List[str],
+        skip_variables: List[str],
+        top: int,
+        skip: int,
+        skip_zeros: bool,
+        skip_consolidated_cells: bool,
+        skip_rule_derived_cells: bool,
+        value_separator: str,
+        process_name: str,
+        view_name: str,
+        file_name: str,
+        header_line: str,
+        quote_character: str = '"',
+        sandbox_name: str = None,
+    ) -> Process:
+        process = Process(
+            name=process_name,
+            datasource_type="TM1CubeView",
+            datasource_view=view_name,
+            datasource_data_source_name_for_server=cube,
+            datasource_data_source_name_for_client=cube,
+            datasource_ascii_delimiter_char=value_separator,
+            datasource_ascii_decimal_separator=".",
+            datasource_ascii_thousand_separator="",
+        )
+
+        # v11 automatically adds blb file extensions to documents created via the contents api
+        if not verify_version(required_version="12", version=self.version):
+            file_name += ".blb"
+
+        # Create variables in process data source as all String
+        for variable in variables:
+            process.add_variable(name=variable, variable_type="String")
+
+        prolog_procedure = f"""
+        {self.generate_enable_sandbox_ti(sandbox_name)}
+        ViewExtractSkipCalcsSet('{cube}', '{view_name}', {'1' if skip_consolidated_cells else '0'});
+        ViewExtractSkipRuleValuesSet('{cube}', '{view_name}', {'1' if skip_rule_derived_cells else '0'});
+        ViewExtractSkipZeroesSet('{cube}', '{view_name}', {'1' if skip_zeros else '0'});
+        DatasourceAsciiDelimiter='{value_separator}';
+        DatasourceAsciiQuoteCharacter='{quote_character}';
+        DatasourceASCIIDecimalSeparator='.';
+        nRecord=0;
+        """
+
+        process.prolog_procedure = prolog_procedure
+
+        # ignore some variable in file and output variables ordered by their ordinal e.g. v2,v4,v5,v11
+        output_variables = sorted(set(variables) - set(skip_variables), key=lambda v: int(v[1:]))
+        comma_sep_variables = ",".join(output_variables)
+        data_procedure_pre = f"""
+        IF (nRecord = 0);
+          SetOutputCharacterSet('{file_name}','TM1CS_UTF8');
         ENDIF;
         nRecord = nRecord + 1;
         """
@@ -1809,17 +2512,7 @@ class CellService(ObjectService):
         statements = list()
 
         for coordinates, value in cellset_as_dict.items():
-            # default to 'Numeric' so that not existing elements trigger minor error during TI execution
-            measure_element = coordinates[-1]
-            try:
-                element_type = measure_dimension_elements[measure_element]
-
-            except KeyError:
-                if ":" in measure_element:
-                    measure_element = measure_element.split(":")[1]
-                    element_type = measure_dimension_elements.get(measure_element, "Numeric")
-                else:
-                    element_type = "Numeric"
+            element_type = get_measure_element_type(coordinates[-1], measure_dimension_elements)
 
             if element_type == "String":
                 function_str = "CellPutS("
@@ -1889,6 +2582,27 @@ class CellService(ObjectService):
 
         return statements
 
+    @staticmethod
+    def _build_cell_update_statements_vectorized(
+        cube_name: str,
+        cellset_as_dict: Dict,
+        increment: bool,
+        measure_dimension_elements: Dict,
+        precision: int = None,
+        skip_non_updateable: bool = False,
+    ) -> List[str]:
+        data = pd.DataFrame(list(cellset_as_dict.keys()))
+        data[len(data.columns)] = list(cellset_as_dict.values())
+
+        return build_cell_update_statements_from_dataframe(
+            data,
+            cube_name=cube_name,
+            increment=increment,
+            measure_dimension_elements=measure_dimension_elements,
+            precision=precision,
+            skip_non_updateable=skip_non_updateable,
+        )
+
     def generate_enable_sandbox_ti(self, sandbox_name):
         if self._rest.sandboxing_disabled:
             enable_sandbox = ""
@@ -1904,14 +2618,7 @@ class CellService(ObjectService):
         return enable_sandbox
 
     def get_elements_from_all_measure_hierarchies(self, cube_name: str) -> Dict[str, str]:
-        from TM1py.Services.CubeService import CubeService
-        from TM1py.Services.ElementService import ElementService
-
-        cube_service = CubeService(self._rest)
-        element_service = ElementService(self._rest)
-
-        measure_dimension = cube_service.get_measure_dimension(cube_name=cube_name)
-        return element_service.get_element_types_from_all_hierarchies(dimension_name=measure_dimension)
+        return self.metadata_cache.get_measure_element_types(cube_name)
 
     def _execute_write_statements(self, statements: List[str], enable_sandbox: str, kwargs) -> Tuple[bool, str, str]:
         max_statements = Process.max_statements(self.version)
@@ -2062,6 +2769,7 @@ class CellService(ObjectService):
 
         return self._rest.PATCH(url, json.dumps(data, ensure_ascii=False), **kwargs)
 
+    @cache_result
     def execute_mdx(
         self,
         mdx: str,
@@ -2197,6 +2905,60 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    def execute_mdx_partitioned(
+        self,
+        mdx: Union[str, MdxBuilder],
+        partitions: int = 8,
+        max_workers: int = 8,
+        cell_properties: List[str] = None,
+        skip_contexts: bool = False,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        element_unique_names: bool = True,
+        skip_cell_properties: bool = False,
+        skip_sandbox_dimension: bool = False,
+        **kwargs,
+    ) -> CaseAndSpaceInsensitiveTuplesDict:
+        """Execute MDX and retrieve the cells in rectangular partitions of the cellset in parallel.
+        Unlike execute_mdx_async, which pages through the cells with $top / $skip, every partition is
+        requested through tm1.GetPartition, so TM1 doesn't have to rescan the cellset for every skip offset.
+
+        :param mdx: MDX Query, as string
+        :param partitions: Int, number of partitions the cellset is split into
+        :param max_workers: Int, number of threads to use in parallel
+        :param cell_properties: properties to be queried from the cell. E.g. Value, Ordinal, RuleDerived, ...
+        :param skip_contexts: skip elements from titles / contexts in response
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param skip_cell_properties: cell values in result dictionary, instead of cell_properties dictionary
+        :param skip_sandbox_dimension: bool = False
+        :return: content in sweet concise structure, in ordinal order.
+        """
+        cellset_id = self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+
+        return self.extract_cellset_partitioned(
+            cellset_id=cellset_id,
+            partitions=partitions,
+            max_workers=max_workers,
+            cell_properties=cell_properties,
+            skip_contexts=skip_contexts,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=True,
+            sandbox_name=sandbox_name,
+            element_unique_names=element_unique_names,
+            skip_cell_properties=skip_cell_properties,
+            skip_sandbox_dimension=skip_sandbox_dimension,
+            **kwargs,
+        )
+
+    @cache_result
     def execute_view(
         self,
         cube_name: str,
@@ -2335,6 +3097,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_result
     def execute_mdx_raw(
         self,
         mdx: str,
@@ -2388,6 +3151,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_result
     def execute_view_raw(
         self,
         cube_name: str,
@@ -2445,6 +3209,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_result
     def execute_mdx_values(
         self,
         mdx: str,
@@ -2478,6 +3243,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_result
     def execute_view_values(
         self,
         cube_name: str,
@@ -2517,6 +3283,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_result
     def execute_mdx_rows_and_values(
         self, mdx: str, element_unique_names: bool = True, sandbox_name: str = None, **kwargs
     ) -> CaseAndSpaceInsensitiveTuplesDict:
@@ -2533,6 +3300,7 @@ class CellService(ObjectService):
             cellset_id, element_unique_names, delete_cellset=True, sandbox_name=sandbox_name, **kwargs
         )
 
+    @cache_result
     def execute_view_rows_and_values(
         self,
         cube_name: str,
@@ -2559,6 +3327,7 @@ class CellService(ObjectService):
             cellset_id, element_unique_names, delete_cellset=True, sandbox_name=sandbox_name, **kwargs
         )
 
+    @cache_result
     def execute_mdx_csv(
         self,
         mdx: Union[str, MdxBuilder],
@@ -2576,6 +3345,8 @@ class CellService(ObjectService):
         use_compact_json: bool = False,
         use_blob: bool = False,
         mdx_headers: bool = False,
+        compression: str = None,
+        partitions: int = 1,
         **kwargs,
     ) -> str:
         """Optimized for performance. Get csv string of coordinates and values.
@@ -2597,8 +3368,16 @@ class CellService(ObjectService):
         :param use_compact_json: bool
         :param use_blob: Has better performance on datasets > 1M cells and lower memory footprint in any case.
         :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param compression: 'gzip' or 'zstd'. With use_blob, download the blob compressed
+        :param partitions: Int, with use_blob, number of slices of the row set that are exported in parallel by
+        concurrent TI processes. Requires mdx as MdxBuilder
         :return: String
         """
+        if compression and not use_blob:
+            raise ValueError("'compression' can only be used in conjunction with 'use_blob'")
+        if partitions > 1 and not use_blob:
+            raise ValueError("'partitions' can only be used in conjunction with 'use_blob'")
+
         if use_blob:
             if include_attributes:
                 raise ValueError("'include_attributes' must not be used in conjunction with 'use_blob'")
@@ -2621,6 +3400,8 @@ class CellService(ObjectService):
                 value_separator=value_separator,
                 sandbox_name=sandbox_name,
                 mdx_headers=mdx_headers,
+                compression=compression,
+                partitions=partitions,
                 **kwargs,
             )
 
@@ -2660,6 +3441,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_result
     def execute_view_csv(
         self,
         cube_name: str,
@@ -2679,6 +3461,7 @@ class CellService(ObjectService):
         use_blob: bool = False,
         arranged_axes: Tuple[List, List, List] = None,
         mdx_headers: bool = False,
+        compression: str = None,
         **kwargs,
     ) -> str:
         """Optimized for performance. Get csv string of coordinates and values.
@@ -2704,8 +3487,12 @@ class CellService(ObjectService):
          Allows function to skip retrieval of cellset composition.
          E.g.: arranged_axes=(["Year"], ["Region","Product"], ["Period", "Version"])
         :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param compression: 'gzip' or 'zstd'. With use_blob, download the blob compressed
         :return: dict, String
         """
+        if compression and not use_blob:
+            raise ValueError("'compression' can only be used in conjunction with 'use_blob'")
+
         if use_blob:
             if use_iterative_json:
                 raise ValueError("'use_iterative_json' must not be used in conjunction with 'use_blob'")
@@ -2730,6 +3517,7 @@ class CellService(ObjectService):
                 sandbox_name=sandbox_name,
                 arranged_axes=arranged_axes,
                 mdx_headers=mdx_headers,
+                compression=compression,
                 **kwargs,
             )
 
@@ -2768,6 +3556,97 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    def execute_mdx_iter(
+        self,
+        mdx: Union[str, MdxBuilder],
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        element_unique_names: bool = False,
+        batch_size: int = None,
+        **kwargs,
+    ) -> Generator:
+        """Execute MDX and stream the cells as (coordinates, value) tuples.
+        Response is parsed incrementally, so memory consumption does not grow with the number of cells.
+
+        :param mdx: MDX Query, as string
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param batch_size: if provided, yield lists of up to batch_size (coordinates, value) tuples
+        :return: Generator of (coordinates, value) tuples. Coordinates are row elements followed by column elements
+        """
+        cellset_id = self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+        yield from self.extract_cellset_iter(
+            cellset_id=cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            element_unique_names=element_unique_names,
+            batch_size=batch_size,
+            delete_cellset=True,
+            **kwargs,
+        )
+
+    def execute_view_iter(
+        self,
+        cube_name: str,
+        view_name: str,
+        private: bool = False,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        element_unique_names: bool = False,
+        batch_size: int = None,
+        **kwargs,
+    ) -> Generator:
+        """Execute view and stream the cells as (coordinates, value) tuples.
+        Response is parsed incrementally, so memory consumption does not grow with the number of cells.
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param private: True (private) or False (public)
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param batch_size: if provided, yield lists of up to batch_size (coordinates, value) tuples
+        :return: Generator of (coordinates, value) tuples. Coordinates are row elements followed by column elements
+        """
+        cellset_id = self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        yield from self.extract_cellset_iter(
+            cellset_id=cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            element_unique_names=element_unique_names,
+            batch_size=batch_size,
+            delete_cellset=True,
+            **kwargs,
+        )
+
+    @cache_result
     def execute_mdx_elements_value_dict(
         self,
         mdx: str,
@@ -2813,6 +3692,7 @@ class CellService(ObjectService):
         return elements_value_dict
 
     @require_pandas
+    @cache_result
     def execute_mdx_dataframe(
         self,
         mdx: Union[str, MdxBuilder],
@@ -2832,6 +3712,9 @@ class CellService(ObjectService):
         fillna_numeric_attributes_value: Any = 0,
         fillna_string_attributes: bool = False,
         fillna_string_attributes_value: Any = "",
+        use_vectorized: bool = False,
+        parallel: int = 1,
+        session_pool: SessionPool = None,
         **kwargs,
     ) -> "pd.DataFrame":
         """Optimized for performance. Get Pandas DataFrame from MDX Query.
@@ -2860,11 +3743,59 @@ class CellService(ObjectService):
         :param fillna_string_attributes: boolean, fills empty string attributes with fillna_string_attributes_value
         :param fillna_numeric_attributes_value: Any, value with which to replace na if fillna_numeric_attributes is True
         :param fillna_string_attributes_value: Any, value with which to replace na if fillna_string_attributes is True
+        :param use_vectorized: build data frame directly from the cellset with categorical element columns,
+        instead of going through csv. Significantly faster and less memory on large cellsets.
+        :param parallel: Int, number of slices of the row set that are queried in parallel. Requires mdx as MdxBuilder.
+        The members of the row hierarchy with the most elements are split into disjoint slices.
+        Results are concatenated in the order of the slices
+        :param session_pool: SessionPool. With parallel, query the slices through independent TM1 sessions
+        from the pool instead of the session of this service
         :return: Pandas Dataframe
         """
         if (fillna_numeric_attributes or fillna_string_attributes) and not include_attributes:
             raise ValueError("Include attributes must be True if fillna_numeric or fillna_string is True.")
 
+        if parallel > 1:
+            if top is not None or skip is not None:
+                raise ValueError("'top' and 'skip' must not be used in conjunction with 'parallel'")
+
+            mdx_slices = self._split_mdx_row_axis(mdx, parts=parallel)
+            if len(mdx_slices) > 1:
+
+                def _execute_mdx_dataframe_on(cell_service: "CellService", mdx_slice: MdxBuilder) -> "pd.DataFrame":
+                    return cell_service.execute_mdx_dataframe(
+                        mdx=mdx_slice,
+                        skip_zeros=skip_zeros,
+                        skip_consolidated_cells=skip_consolidated_cells,
+                        skip_rule_derived_cells=skip_rule_derived_cells,
+                        sandbox_name=sandbox_name,
+                        include_attributes=include_attributes,
+                        use_iterative_json=use_iterative_json,
+                        use_compact_json=use_compact_json,
+                        use_blob=use_blob,
+                        shaped=shaped,
+                        mdx_headers=mdx_headers,
+                        fillna_numeric_attributes=fillna_numeric_attributes,
+                        fillna_numeric_attributes_value=fillna_numeric_attributes_value,
+                        fillna_string_attributes=fillna_string_attributes,
+                        fillna_string_attributes_value=fillna_string_attributes_value,
+                        use_vectorized=use_vectorized,
+                        **kwargs,
+                    )
+
+                async def _execute_mdx_dataframe_slices_async():
+                    loop = asyncio.get_event_loop()
+                    _execute_mdx_dataframe = self._on_session(session_pool, _execute_mdx_dataframe_on)
+                    with ThreadPoolExecutor(len(mdx_slices)) as executor:
+                        futures = [
+                            loop.run_in_executor(executor, _execute_mdx_dataframe, mdx_slice)
+                            for mdx_slice in mdx_slices
+                        ]
+                        # gather keeps the order of the slices
+                        return await asyncio.gather(*futures)
+
+                return pd.concat(run_async(_execute_mdx_dataframe_slices_async()), ignore_index=True)
+
         # necessary to assure column order in line with cube view
         if shaped:
             skip_zeros = False
@@ -2915,6 +3846,7 @@ class CellService(ObjectService):
             fillna_numeric_attributes_value=fillna_numeric_attributes_value,
             fillna_string_attributes=fillna_string_attributes,
             fillna_string_attributes_value=fillna_string_attributes_value,
+            use_vectorized=use_vectorized,
             **kwargs,
         )
 
@@ -2935,11 +3867,20 @@ class CellService(ObjectService):
         use_blob: bool = False,
         shaped: bool = False,
         mdx_headers: bool = False,
+        session_pool: SessionPool = None,
         **kwargs,
     ) -> "pd.DataFrame":
+        """Execute a list of MDX queries in parallel and concatenate the results in the order of the list
 
-        def _execute_mdx_dataframe(mdx: Union[str, MdxBuilder]):
-            return self.execute_mdx_dataframe(
+        :param mdx_list: list of valid MDX queries
+        :param max_workers: Int, number of threads to use in parallel
+        :param session_pool: SessionPool. Execute the queries through independent TM1 sessions from the pool
+        instead of the session of this service
+        :return: Pandas Dataframe
+        """
+
+        def _execute_mdx_dataframe_on(cell_service: "CellService", mdx: Union[str, MdxBuilder]):
+            return cell_service.execute_mdx_dataframe(
                 mdx=mdx,
                 top=top,
                 skip=skip,
@@ -2959,6 +3900,7 @@ class CellService(ObjectService):
         async def _exec_mdx_dataframe_async():
             loop = asyncio.get_event_loop()
             result_list = []
+            _execute_mdx_dataframe = self._on_session(session_pool, _execute_mdx_dataframe_on)
             with ThreadPoolExecutor(max_workers) as executor:
                 futures = [loop.run_in_executor(executor, _execute_mdx_dataframe, mdx) for mdx in mdx_list]
                 for future in futures:
@@ -2966,18 +3908,156 @@ class CellService(ObjectService):
                     result_list.append(result)
             return pd.concat(result_list, ignore_index=True)
 
-        result_dataframe = asyncio.run(_exec_mdx_dataframe_async())
+        result_dataframe = run_async(_exec_mdx_dataframe_async())
 
         return result_dataframe
 
     @require_pandas
-    def execute_mdx_dataframe_shaped(
+    def execute_mdx_dataframe_partitioned(
         self,
-        mdx: str,
-        sandbox_name: str = None,
-        display_attribute: bool = False,
-        use_iterative_json: bool = False,
-        use_blob: bool = False,
+        mdx: Union[str, MdxBuilder],
+        partitions: int = 8,
+        max_workers: int = 8,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        multiindex: bool = False,
+        **kwargs,
+    ) -> "pd.DataFrame":
+        """Get Pandas DataFrame from MDX Query. Cells are retrieved in rectangular partitions of the cellset in
+        parallel. Rows in the DataFrame are in the ordinal order of the cellset.
+
+        :param mdx: Valid MDX Query
+        :param partitions: Int, number of partitions the cellset is split into
+        :param max_workers: Int, number of threads to use in parallel
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param multiindex: True or False
+        :return: Pandas Dataframe
+        """
+        cellset = self.execute_mdx_partitioned(
+            mdx=mdx,
+            partitions=partitions,
+            max_workers=max_workers,
+            cell_properties=["Value"],
+            skip_contexts=True,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            element_unique_names=True,
+            skip_sandbox_dimension=True,
+            **kwargs,
+        )
+        return build_pandas_dataframe_from_cellset(cellset, multiindex=multiindex, sort_values=False)
+
+    @require_pyarrow
+    @cache_result
+    def execute_mdx_arrow(
+        self,
+        mdx: Union[str, MdxBuilder],
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        use_compact_json: bool = False,
+        mdx_headers: bool = False,
+        **kwargs,
+    ) -> "pa.Table":
+        """Get pyarrow Table from MDX Query. Element and attribute columns are dictionary encoded.
+        Built directly from the cellset, without pandas or an intermediate csv.
+
+        :param mdx: Valid MDX Query
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param use_compact_json: bool
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :return: pyarrow Table
+        """
+        cellset_id = self.create_cellset(mdx, sandbox_name=sandbox_name, **kwargs)
+        return self.extract_cellset_arrow(
+            cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            use_compact_json=use_compact_json,
+            mdx_headers=mdx_headers,
+            **kwargs,
+        )
+
+    @require_pyarrow
+    def execute_mdx_to_parquet(
+        self,
+        mdx: Union[str, MdxBuilder],
+        path: str,
+        row_group_size: int = 100_000,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        mdx_headers: bool = False,
+        compression: str = "snappy",
+        **kwargs,
+    ) -> int:
+        """Write result of MDX Query to a parquet file. The cellset is streamed and written in row groups,
+        so memory consumption is bound by row_group_size rather than the size of the cellset.
+
+        :param mdx: Valid MDX Query
+        :param path: path of the parquet file
+        :param row_group_size: Int, number of cells per row group
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param compression: parquet compression codec. E.g. 'snappy', 'gzip', 'zstd' or None
+        :return: number of rows written
+        """
+        cellset_id = self.create_cellset(mdx, sandbox_name=sandbox_name, **kwargs)
+        return self.extract_cellset_to_parquet(
+            cellset_id,
+            path=path,
+            row_group_size=row_group_size,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            mdx_headers=mdx_headers,
+            compression=compression,
+            delete_cellset=True,
+            **kwargs,
+        )
+
+    @require_pandas
+    @cache_result
+    def execute_mdx_dataframe_shaped(
+        self,
+        mdx: str,
+        sandbox_name: str = None,
+        display_attribute: bool = False,
+        use_iterative_json: bool = False,
+        use_blob: bool = False,
         mdx_headers: bool = False,
         **kwargs,
     ) -> "pd.DataFrame":
@@ -3028,6 +4108,7 @@ class CellService(ObjectService):
         )
 
     @require_pandas
+    @cache_result
     def execute_view_dataframe_shaped(
         self,
         cube_name: str,
@@ -3094,6 +4175,7 @@ class CellService(ObjectService):
         )
 
     @require_pandas
+    @cache_result
     def execute_view_dataframe_pivot(
         self,
         cube_name: str,
@@ -3122,6 +4204,7 @@ class CellService(ObjectService):
         )
 
     @require_pandas
+    @cache_result
     def execute_mdx_dataframe_pivot(
         self, mdx: str, dropna: bool = False, fill_value: bool = None, sandbox_name: str = None
     ) -> "pd.DataFrame":
@@ -3138,6 +4221,7 @@ class CellService(ObjectService):
             cellset_id=cellset_id, dropna=dropna, fill_value=fill_value, sandbox_name=sandbox_name
         )
 
+    @cache_result
     def execute_mdx_cellcount(self, mdx: str, sandbox_name: str = None, **kwargs) -> int:
         """Execute MDX in order to understand how many cells are in a cellset.
         Only return number of cells in the cellset. FAST!
@@ -3149,6 +4233,7 @@ class CellService(ObjectService):
         cellset_id = self.create_cellset(mdx, sandbox_name=sandbox_name, **kwargs)
         return self.extract_cellset_cellcount(cellset_id, delete_cellset=True, sandbox_name=sandbox_name, **kwargs)
 
+    @cache_result
     def execute_view_elements_value_dict(
         self,
         cube_name: str,
@@ -3200,6 +4285,7 @@ class CellService(ObjectService):
         return elements_value_dict
 
     @require_pandas
+    @cache_result
     def execute_view_dataframe(
         self,
         cube_name: str,
@@ -3216,6 +4302,7 @@ class CellService(ObjectService):
         shaped: bool = False,
         arranged_axes: Tuple[List, List, List] = None,
         mdx_headers: bool = False,
+        use_vectorized: bool = False,
         **kwargs,
     ) -> "pd.DataFrame":
         """Optimized for performance. Get Pandas DataFrame from an existing Cube View
@@ -3245,6 +4332,8 @@ class CellService(ObjectService):
          Allows function to skip retrieval of cellset composition in use_blob mode.
          E.g.: axes=(["Year"], ["Region","Product"], ["Period", "Version"])
          :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param use_vectorized: build data frame directly from the cellset with categorical element columns,
+        instead of going through csv. Significantly faster and less memory on large cellsets.
         :return: Pandas Dataframe
         """
         # necessary to assure column order in line with cube view
@@ -3285,9 +4374,118 @@ class CellService(ObjectService):
             use_iterative_json=use_iterative_json,
             shaped=shaped,
             mdx_headers=mdx_headers,
+            use_vectorized=use_vectorized,
+            **kwargs,
+        )
+
+    @require_pyarrow
+    @cache_result
+    def execute_view_arrow(
+        self,
+        cube_name: str,
+        view_name: str,
+        private: bool = False,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        use_compact_json: bool = False,
+        mdx_headers: bool = False,
+        **kwargs,
+    ) -> "pa.Table":
+        """Get pyarrow Table from an existing Cube View. Element and attribute columns are dictionary encoded.
+        Context dimensions are omitted in the resulting Table !
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param private: True (private) or False (public)
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param use_compact_json: bool
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :return: pyarrow Table
+        """
+        cellset_id = self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        return self.extract_cellset_arrow(
+            cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            use_compact_json=use_compact_json,
+            mdx_headers=mdx_headers,
+            **kwargs,
+        )
+
+    @require_pyarrow
+    def execute_view_to_parquet(
+        self,
+        cube_name: str,
+        view_name: str,
+        path: str,
+        private: bool = False,
+        row_group_size: int = 100_000,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        mdx_headers: bool = False,
+        compression: str = "snappy",
+        **kwargs,
+    ) -> int:
+        """Write an existing Cube View to a parquet file. The cellset is streamed and written in row groups.
+        Context dimensions are omitted in the resulting file !
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param path: path of the parquet file
+        :param private: True (private) or False (public)
+        :param row_group_size: Int, number of cells per row group
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param compression: parquet compression codec. E.g. 'snappy', 'gzip', 'zstd' or None
+        :return: number of rows written
+        """
+        cellset_id = self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        return self.extract_cellset_to_parquet(
+            cellset_id,
+            path=path,
+            row_group_size=row_group_size,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            mdx_headers=mdx_headers,
+            compression=compression,
+            delete_cellset=True,
             **kwargs,
         )
 
+    @cache_result
     def execute_view_cellcount(
         self, cube_name: str, view_name: str, private: bool = False, sandbox_name: str = None, **kwargs
     ) -> int:
@@ -3633,6 +4831,39 @@ class CellService(ObjectService):
         :param include_hierarchies: retrieve Hierarchies property on Axes
         :return: Raw format from TM1.
         """
+        url = self._build_cellset_raw_url(
+            cellset_id=cellset_id,
+            cell_properties=cell_properties,
+            elem_properties=elem_properties,
+            member_properties=member_properties,
+            top=top,
+            skip=skip,
+            skip_contexts=skip_contexts,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_hierarchies=include_hierarchies,
+        )
+        response = self._rest.GET(url=url, **kwargs)
+        return response
+
+    @staticmethod
+    def _build_cellset_raw_url(
+        cellset_id: str,
+        cell_properties: Iterable[str] = None,
+        elem_properties: Iterable[str] = None,
+        member_properties: Iterable[str] = None,
+        top: int = None,
+        skip: int = None,
+        skip_contexts: bool = False,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_hierarchies: bool = False,
+    ) -> str:
+        """Build URL to retrieve cube, axes and cells of a cellset in one request"""
         if not cell_properties:
             cell_properties = ["Value"]
 
@@ -3701,9 +4932,7 @@ class CellService(ObjectService):
                 filter_cells=f";$filter={filter_cells}" if filter_cells else "",
             )
         )
-        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        response = self._rest.GET(url=url, **kwargs)
-        return response
+        return add_url_parameters(url, **{"!sandbox": sandbox_name})
 
     @tidy_cellset
     def extract_cellset_raw(
@@ -3854,6 +5083,7 @@ class CellService(ObjectService):
         skip_consolidated_cells: bool = False,
         skip_rule_derived_cells: bool = False,
         sandbox_name: str = None,
+        **kwargs,
     ) -> Dict:
         """
         Method to extract a cellset partition. Cellset partitions are a collection of cellset cells where they have
@@ -3907,7 +5137,7 @@ class CellService(ObjectService):
         )
 
         url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        response = self._rest.GET(url=url)
+        response = self._rest.GET(url=url, **kwargs)
         return response.json()["value"]
 
     @odata_compact_json(return_as_dict=True)
@@ -4057,7 +5287,7 @@ class CellService(ObjectService):
         # Extract non-asynchronous axis
         axes = _extract_cellset_axis_raw(axis=1 - async_axis)
         # Extract tuples for asynchronous axis
-        async_axis_tuples = asyncio.run(_extract_cellset_axes_raw_async())
+        async_axis_tuples = run_async(_extract_cellset_axes_raw_async())
         # Combine results
         axes["Axes"].insert(
             async_axis,
@@ -4152,43 +5382,162 @@ class CellService(ObjectService):
                 cells = {"@odata.context": result["@odata.context"], "ID": result["ID"], "Cells": result_list}
             return cells
 
-        cells = asyncio.run(_extract_cellset_cells_raw_async())
+        cells = run_async(_extract_cellset_cells_raw_async())
 
         return cells
 
-    @tidy_cellset
-    def extract_cellset_cube_with_dimensions(self, cellset_id: str, **kwargs):
-        url = format_url(
-            "/Cellsets('{}')?$expand=Cube($select=Dimensions;$expand=Dimensions($select=Name))", cellset_id
-        )
-
-        response = self._rest.GET(url=url, **kwargs)
-
-        return response.json()
-
-    @tidy_cellset
-    @odata_compact_json(return_as_dict=False)
-    def extract_cellset_values(
+    def extract_cellset_cells_raw_partitioned(
         self,
         cellset_id: str,
-        sandbox_name: str = None,
-        use_compact_json: bool = False,
+        partitions: int = 8,
+        max_workers: int = 8,
+        cell_properties: Iterable[str] = None,
         skip_zeros: bool = False,
         skip_consolidated_cells: bool = False,
         skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
         **kwargs,
-    ) -> List[Union[str, float]]:
-        """Extract cellset data and return only the cells and values
+    ) -> Dict:
+        """Extract the cells of a cellset in rectangular partitions (tm1.GetPartition) in parallel
 
         :param cellset_id: String; ID of existing cellset
+        :param partitions: Int, number of partitions the cellset is split into
+        :param max_workers: Int, number of threads to use in parallel
+        :param cell_properties: properties to be queried from the cell. Ordinal is always included
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
         :param sandbox_name: str
-        :param use_compact_json: bool
-        :param skip_zeros: bool
-        :param skip_consolidated_cells: bool
+        :return: Dictionary with the Cells of all partitions, in ordinal order
+        """
+        if partitions < 1:
+            raise ValueError("Argument 'partitions' must be greater than or equal to 1")
+
+        cell_properties = list(cell_properties) if cell_properties else ["Value"]
+        if "Ordinal" not in cell_properties:
+            cell_properties.append("Ordinal")
+
+        axes_cardinality = self.extract_cellset_axes_cardinality(cellset_id=cellset_id)
+        cardinalities = [axis["Cardinality"] for axis in axes_cardinality["Axes"]]
+        cell_partitions = self._build_cellset_partitions(cardinalities, partitions)
+
+        def _extract_cellset_partition(begin: int, end: int):
+            return self.extract_cellset_partition(
+                cellset_id=cellset_id,
+                partition_start_ordinal=begin,
+                partition_end_ordinal=end,
+                # list is modified in extract_cellset_partition
+                cell_properties=list(cell_properties),
+                skip_zeros=skip_zeros,
+                skip_consolidated_cells=skip_consolidated_cells,
+                skip_rule_derived_cells=skip_rule_derived_cells,
+                sandbox_name=sandbox_name,
+                **kwargs,
+            )
+
+        async def _extract_cellset_cells_raw_partitioned():
+            loop = asyncio.get_event_loop()
+            result_list = []
+            with ThreadPoolExecutor(max_workers) as executor:
+                futures = [
+                    loop.run_in_executor(executor, _extract_cellset_partition, begin, end)
+                    for begin, end in cell_partitions
+                ]
+                for future in futures:
+                    result_list.extend(await future)
+            return result_list
+
+        cells = run_async(_extract_cellset_cells_raw_partitioned()) if cell_partitions else []
+
+        # partitions that don't span entire rows overlap in their ordinal ranges
+        if len(cell_partitions) > 1 and any(begin % cardinalities[0] for begin, _ in cell_partitions):
+            cells.sort(key=lambda cell: cell["Ordinal"])
+
+        return {"ID": cellset_id, "Cells": cells}
+
+    @staticmethod
+    def _build_cellset_partitions(cardinalities: List[int], partitions: int) -> List[Tuple[int, int]]:
+        """Split the cell ordinal space of a cellset into rectangular partitions
+
+        The cellset is split into bands of rows first. If there are fewer rows than partitions, the columns are split
+        as well. Partitions are returned as (top left ordinal, bottom right ordinal) tuples in ordinal order.
+
+        :param cardinalities: cardinality of every axis of the cellset. Columns first, then rows, then titles
+        :param partitions: requested number of partitions
+        :return: list of (begin, end) tuples
+        """
+        columns = cardinalities[0] if cardinalities else 1
+        rows = functools.reduce(lambda x, y: x * y, cardinalities[1:], 1)
+        if not columns or not rows:
+            return []
+
+        row_bands = min(partitions, rows)
+        column_bands = min(max(1, partitions // row_bands), columns)
+
+        row_bounds = [round(rows * i / row_bands) for i in range(row_bands + 1)]
+        column_bounds = [round(columns * i / column_bands) for i in range(column_bands + 1)]
+
+        return [
+            (first_row * columns + first_column, (next_row - 1) * columns + next_column - 1)
+            for first_row, next_row in zip(row_bounds, row_bounds[1:])
+            for first_column, next_column in zip(column_bounds, column_bounds[1:])
+        ]
+
+    @tidy_cellset
+    def extract_cellset_cube_with_dimensions(self, cellset_id: str, **kwargs):
+        url = format_url(
+            "/Cellsets('{}')?$expand=Cube($select=Dimensions;$expand=Dimensions($select=Name))", cellset_id
+        )
+
+        response = self._rest.GET(url=url, **kwargs)
+
+        return response.json()
+
+    @tidy_cellset
+    @odata_compact_json(return_as_dict=False)
+    def extract_cellset_values(
+        self,
+        cellset_id: str,
+        sandbox_name: str = None,
+        use_compact_json: bool = False,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        **kwargs,
+    ) -> List[Union[str, float]]:
+        """Extract cellset data and return only the cells and values
+
+        :param cellset_id: String; ID of existing cellset
+        :param sandbox_name: str
+        :param use_compact_json: bool
+        :param skip_zeros: bool
+        :param skip_consolidated_cells: bool
         :param skip_rule_derived_cells: bool
         :return: Raw format from TM1.
         """
+        url = self._build_cellset_values_url(
+            cellset_id=cellset_id,
+            sandbox_name=sandbox_name,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+        )
+        response = self._rest.GET(url=url, **kwargs)
+
+        if not use_compact_json:
+            return [cell["Value"] for cell in response.json()["Cells"]]
+
+        return response.json()
 
+    @staticmethod
+    def _build_cellset_values_url(
+        cellset_id: str,
+        sandbox_name: str = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+    ) -> str:
+        """Build URL to retrieve only the cell values of a cellset"""
         filter_cells = ""
         if skip_zeros or skip_consolidated_cells or skip_rule_derived_cells:
             filters = []
@@ -4208,12 +5557,7 @@ class CellService(ObjectService):
         )
         if sandbox_name:
             url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        response = self._rest.GET(url=url, **kwargs)
-
-        if not use_compact_json:
-            return [cell["Value"] for cell in response.json()["Cells"]]
-
-        return response.json()
+        return url
 
     @tidy_cellset
     def extract_cellset_rows_and_values(
@@ -4431,6 +5775,7 @@ class CellService(ObjectService):
             delete_cellset=True,
             sandbox_name=sandbox_name,
             member_properties=["Name", "Attributes"] if include_attributes else ["Name"],
+            stream=True,
             **kwargs,
         )
 
@@ -4457,7 +5802,7 @@ class CellService(ObjectService):
         max_entries_per_row = 0
         least_entries_per_row = 1_000
 
-        parser = ijson.parse(cellset_response.content)
+        parser = ijson.parse(self._get_response_body_stream(cellset_response))
         prefixes_of_interest = [
             "Cells.item.Value",
             "Axes.item.Tuples.item.Members.item.Name",
@@ -4555,6 +5900,128 @@ class CellService(ObjectService):
         cellset_response.close()
         return csv_header.getvalue() + csv_body.getvalue().strip()
 
+    def extract_cellset_iter(
+        self,
+        cellset_id: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        element_unique_names: bool = False,
+        batch_size: int = None,
+        delete_cellset: bool = True,
+        **kwargs,
+    ) -> Generator:
+        """Stream cellset and yield the cells as (coordinates, value) tuples.
+        The HTTP response is streamed and parsed incrementally with ijson. Only the axes are kept in memory.
+
+        :param cellset_id: String; ID of existing cellset
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param batch_size: if provided, yield lists of up to batch_size (coordinates, value) tuples
+        :param delete_cellset: delete cellset after iteration
+        :return: Generator of (coordinates, value) tuples. Coordinates are row elements followed by column elements
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("'batch_size' must be a positive integer")
+
+        member_property = "UniqueName" if element_unique_names else "Name"
+        cellset_response = None
+        try:
+            cellset_response = self.extract_cellset_raw_response(
+                cellset_id,
+                cell_properties=["Value", "Ordinal"],
+                member_properties=[member_property],
+                top=top,
+                skip=skip,
+                skip_contexts=True,
+                skip_zeros=skip_zeros,
+                skip_consolidated_cells=skip_consolidated_cells,
+                skip_rule_derived_cells=skip_rule_derived_cells,
+                sandbox_name=sandbox_name,
+                stream=True,
+                **kwargs,
+            )
+            cells = self._iter_cells_from_cellset_stream(
+                self._get_response_body_stream(cellset_response), member_property
+            )
+
+            if not batch_size:
+                yield from cells
+                return
+
+            batch = list(itertools.islice(cells, batch_size))
+            while batch:
+                yield batch
+                batch = list(itertools.islice(cells, batch_size))
+
+        finally:
+            if cellset_response is not None:
+                cellset_response.close()
+            if delete_cellset:
+                try:
+                    self.delete_cellset(cellset_id=cellset_id, sandbox_name=sandbox_name)
+                except TM1pyRestException as ex:
+                    # Fail silently if cellset is already removed
+                    if not ex.status_code == 404:
+                        raise ex
+
+    @staticmethod
+    def _get_response_body_stream(response: Response, chunk_size: int = 65_536) -> "_ChunkReader":
+        """file-like access to the body of a response, without reading the body into memory if it is streamed.
+        Bodies that were read already (e.g. in async_requests_mode) are served from memory
+        """
+        return _ChunkReader(response.iter_content(chunk_size=chunk_size))
+
+    @staticmethod
+    def _iter_cells_from_cellset_stream(stream, member_property: str = "Name") -> Generator:
+        """parse cellset JSON (Axes before Cells) incrementally and yield (coordinates, value) tuples
+
+        :param stream: file-like object with the JSON body of a cellset response
+        :param member_property: 'Name' or 'UniqueName'
+        :return: Generator of (coordinates, value) tuples
+        """
+        member_prefix = "Axes.item.Tuples.item.Members.item." + member_property
+        axes = [[], []]
+        current_axis = 0
+        cell_ordinal = 0
+        cell_value = None
+
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if prefix == "Cells.item.Value":
+                cell_value = value
+
+            elif prefix == "Cells.item.Ordinal" and event == "number":
+                cell_ordinal = int(value)
+
+            # cell is complete. Order of properties within the cell is irrelevant
+            elif prefix == "Cells.item" and event == "end_map":
+                columns, rows = axes
+                row_index, column_index = divmod(cell_ordinal, len(columns))
+                if not rows:
+                    yield columns[column_index], cell_value
+                elif len(columns) == 1 and not columns[0]:
+                    yield rows[row_index], cell_value
+                else:
+                    yield rows[row_index] + columns[column_index], cell_value
+                cell_value = None
+
+            elif prefix == member_prefix and event == "string":
+                axes[current_axis][-1] += (value,)
+
+            elif prefix == "Axes.item.Tuples.item.Ordinal" and event == "number":
+                axes[current_axis].append(tuple())
+
+            elif prefix == "Axes.item.Ordinal" and event == "number":
+                current_axis = int(value)
+
     @require_pandas
     def extract_cellset_dataframe(
         self,
@@ -4574,6 +6041,7 @@ class CellService(ObjectService):
         fillna_numeric_attributes_value: Any = 0,
         fillna_string_attributes: bool = False,
         fillna_string_attributes_value: Any = "",
+        use_vectorized: bool = False,
         **kwargs,
     ) -> "pd.DataFrame":
         """Build pandas data frame from cellset_id
@@ -4589,12 +6057,42 @@ class CellService(ObjectService):
         :param use_iterative_json: use iterative json parsing to reduce memory consumption significantly.
         Comes at a cost of 3-5% performance.
         :param use_compact_json: bool
+        :param use_vectorized: build data frame directly from the cellset with categorical element columns,
+        instead of going through csv. Significantly faster and less memory on large cellsets.
         :param kwargs:
         :return:
         """
         if use_iterative_json and use_compact_json:
             raise ValueError("Iterative JSON parsing must not be used together with compact JSON")
 
+        if use_vectorized:
+            if use_iterative_json:
+                raise ValueError("Iterative JSON parsing must not be used together with 'use_vectorized'")
+            if fillna_numeric_attributes or fillna_string_attributes:
+                raise ValueError("fillna attributes' feature must not be used with use_vectorized as True")
+
+            rows, columns, cellset_dict = self._extract_cellset_composition_and_raw(
+                cellset_id,
+                top=top,
+                skip=skip,
+                skip_zeros=skip_zeros,
+                skip_consolidated_cells=skip_consolidated_cells,
+                skip_rule_derived_cells=skip_rule_derived_cells,
+                sandbox_name=sandbox_name,
+                include_attributes=include_attributes,
+                use_compact_json=use_compact_json,
+                **kwargs,
+            )
+            return build_dataframe_from_cellset_dict(
+                row_dimensions=rows,
+                column_dimensions=columns,
+                raw_cellset_as_dict=cellset_dict,
+                top=top,
+                include_attributes=include_attributes,
+                mdx_headers=mdx_headers,
+                shaped=shaped,
+            )
+
         if use_iterative_json:
             raw_csv = self.extract_cellset_csv_iter_json(
                 cellset_id=cellset_id,
@@ -4645,6 +6143,187 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    def _extract_cellset_composition_and_raw(
+        self,
+        cellset_id: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        use_compact_json: bool = False,
+        **kwargs,
+    ) -> Tuple[List[str], List[str], Dict]:
+        """Retrieve row and column dimensions and the raw cellset with element names (and attributes)"""
+        delete_cellset = kwargs.pop("delete_cellset", True)
+
+        _, _, rows, columns = self.extract_cellset_composition(
+            cellset_id, delete_cellset=False, sandbox_name=sandbox_name, **kwargs
+        )
+
+        cellset_dict = self.extract_cellset_raw(
+            cellset_id,
+            cell_properties=["Value"],
+            top=top,
+            skip=skip,
+            skip_contexts=True,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=delete_cellset,
+            sandbox_name=sandbox_name,
+            elem_properties=["Name"],
+            member_properties=["Name", "Attributes"] if include_attributes else None,
+            use_compact_json=use_compact_json,
+            **kwargs,
+        )
+        return rows, columns, cellset_dict
+
+    @require_pyarrow
+    def extract_cellset_arrow(
+        self,
+        cellset_id: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        use_compact_json: bool = False,
+        mdx_headers: bool = False,
+        **kwargs,
+    ) -> "pa.Table":
+        """Build pyarrow Table from cellset_id. Element and attribute columns are dictionary encoded
+
+        :param cellset_id:
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param use_compact_json: bool
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :return: pyarrow Table
+        """
+        rows, columns, cellset_dict = self._extract_cellset_composition_and_raw(
+            cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            use_compact_json=use_compact_json,
+            **kwargs,
+        )
+        return build_arrow_table_from_cellset_dict(
+            row_dimensions=rows,
+            column_dimensions=columns,
+            raw_cellset_as_dict=cellset_dict,
+            top=top,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+        )
+
+    @require_pyarrow
+    def extract_cellset_to_parquet(
+        self,
+        cellset_id: str,
+        path: str,
+        row_group_size: int = 100_000,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        mdx_headers: bool = False,
+        compression: str = "snappy",
+        delete_cellset: bool = True,
+        **kwargs,
+    ) -> int:
+        """Stream cellset into a parquet file. Row groups are written as the cellset is parsed,
+        so no more than row_group_size cells are held in memory at a time.
+
+        :param cellset_id:
+        :param path: path of the parquet file
+        :param row_group_size: Int, number of cells per row group
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param compression: parquet compression codec. E.g. 'snappy', 'gzip', 'zstd' or None
+        :param delete_cellset: delete cellset after extraction
+        :return: number of rows written
+        """
+        try:
+            cube, _, rows, columns = self.extract_cellset_composition(
+                cellset_id, delete_cellset=False, sandbox_name=sandbox_name, **kwargs
+            )
+            # value type must be fixed before the first row group is written
+            value_type = self._get_arrow_value_type(cube)
+        except Exception:
+            if delete_cellset:
+                with suppress(TM1pyRestException):
+                    self.delete_cellset(cellset_id=cellset_id, sandbox_name=sandbox_name)
+            raise
+
+        headers = [
+            dimension if mdx_headers else dimension_name_from_element_unique_name(dimension)
+            for dimension in rows + columns
+        ] + ["Value"]
+
+        cells = self.extract_cellset_iter(
+            cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            element_unique_names=False,
+            batch_size=row_group_size,
+            delete_cellset=delete_cellset,
+            **kwargs,
+        )
+
+        writer = None
+        number_rows = 0
+        try:
+            for batch in cells:
+                table = build_arrow_table_from_cells(headers, batch, value_type)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema, compression=compression)
+                writer.write_table(table, row_group_size=row_group_size)
+                number_rows += table.num_rows
+
+            if writer is None:
+                table = build_arrow_table_from_cells(headers, [], value_type)
+                writer = pq.ParquetWriter(path, table.schema, compression=compression)
+                writer.write_table(table)
+        finally:
+            cells.close()
+            if writer is not None:
+                writer.close()
+
+        return number_rows
+
+    def _get_arrow_value_type(self, cube_name: str) -> "pa.DataType":
+        # cubes with string elements in the measure dimension hold mixed values. Represent as strings like in the csv
+        element_types = self.metadata_cache.get_measure_element_types(cube_name)
+        if any(element_type == "String" for element_type in element_types.values()):
+            return pa.string()
+        return pa.float64()
+
     def _extract_attribute_types_by_dimension(self, cellset_id: str, sandbox_name: str, delete_cellset: bool, **kwargs):
         attribute_types_by_dimension = {}
 
@@ -4675,11 +6354,9 @@ class CellService(ObjectService):
                 ],
             )
         )
-        element_service = self.get_element_service()
         for dimension in rows + columns:
-            attribute_types_by_dimension[dimension] = element_service.get_element_types(
-                "}ElementAttributes_" + dimension.split("].[")[0][1:],
-                "}ElementAttributes_" + dimension.split("].[")[0][1:],
+            attribute_types_by_dimension[dimension] = self.metadata_cache.get_attribute_types(
+                dimension.split("].[")[0][1:]
             )
 
             attribute_types_by_dimension[dimension] = {
@@ -4969,6 +6646,86 @@ class CellService(ObjectService):
             skip_sandbox_dimension=skip_sandbox_dimension,
         )
 
+    def extract_cellset_partitioned(
+        self,
+        cellset_id: str,
+        partitions: int = 8,
+        max_workers: int = 8,
+        cell_properties: Iterable[str] = None,
+        delete_cellset: bool = True,
+        skip_contexts: bool = False,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        element_unique_names: bool = True,
+        skip_cell_properties: bool = False,
+        skip_sandbox_dimension: bool = False,
+        **kwargs,
+    ) -> CaseAndSpaceInsensitiveTuplesDict:
+        """Extract cellset in rectangular partitions in parallel and return the cells with their properties
+
+        :param cellset_id:
+        :param partitions: Int, number of partitions the cellset is split into
+        :param max_workers: Int, number of threads to use in parallel
+        :param cell_properties: properties to be queried from the cell. E.g. Value, Ordinal, RuleDerived, ...
+        :param delete_cellset:
+        :param skip_contexts:
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param skip_cell_properties: cell values in result dictionary, instead of cell_properties dictionary
+        :param skip_sandbox_dimension: skip sandbox dimension
+        :return: Content in sweet concise structure, in ordinal order.
+        """
+        try:
+            cells = self.extract_cellset_cells_raw_partitioned(
+                cellset_id=cellset_id,
+                partitions=partitions,
+                max_workers=max_workers,
+                cell_properties=cell_properties,
+                skip_zeros=skip_zeros,
+                skip_consolidated_cells=skip_consolidated_cells,
+                skip_rule_derived_cells=skip_rule_derived_cells,
+                sandbox_name=sandbox_name,
+                **kwargs,
+            )
+
+            # retrieve rows asynchronously. Columns, if MDX has no rows
+            axes_cardinality = self.extract_cellset_axes_cardinality(cellset_id=cellset_id)
+            axes = self.extract_cellset_axes_raw_async(
+                cellset_id=cellset_id,
+                async_axis=1 if len(axes_cardinality["Axes"]) > 1 else 0,
+                max_workers=max_workers,
+                elem_properties=["UniqueName"],
+                member_properties=["UniqueName"],
+                skip_contexts=skip_contexts,
+                sandbox_name=sandbox_name,
+                **kwargs,
+            )
+
+        except Exception:
+            if delete_cellset:
+                with suppress(TM1pyRestException):
+                    self.delete_cellset(cellset_id=cellset_id, sandbox_name=sandbox_name)
+            raise
+
+        # cube with dimension names is required from transformation later on
+        cube_dimensions = self.extract_cellset_cube_with_dimensions(
+            cellset_id=cellset_id, delete_cellset=delete_cellset
+        )
+
+        raw_cellset = {**cube_dimensions, **axes, **cells}
+
+        return Utils.build_content_from_cellset_dict(
+            raw_cellset_as_dict=raw_cellset,
+            element_unique_names=element_unique_names,
+            skip_cell_properties=skip_cell_properties,
+            skip_sandbox_dimension=skip_sandbox_dimension,
+        )
+
     def create_cellset(self, mdx: Union[str, MdxBuilder], sandbox_name: str = None, **kwargs) -> str:
         """Execute MDX in order to create cellset at server. return the cellset-id
 
@@ -5151,6 +6908,7 @@ class CellService(ObjectService):
         quote_character: str = '"',
         arranged_axes: Tuple[List, List, List] = None,
         mdx_headers=False,
+        compression: str = None,
         **kwargs,
     ):
         """Execute existing view and retrieve result as csv, using blobs.
@@ -5173,6 +6931,7 @@ class CellService(ObjectService):
          Allows function to skip retrieval of cellset composition.
          E.g.: axes=(["Year"], ["Region","Product"], ["Period", "Version"])
         :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param compression: 'gzip' or 'zstd' to download the blob compressed
 
         """
         file_service, process_service, view_service = self._prepare_blob_services()
@@ -5193,6 +6952,7 @@ class CellService(ObjectService):
                 quote_character=quote_character,
                 arranged_axes=arranged_axes,
                 mdx_headers=mdx_headers,
+                compression=compression,
             )
 
         if arranged_axes:
@@ -5280,7 +7040,8 @@ class CellService(ObjectService):
             if not success:
                 raise RuntimeError(f"Failed writing to blob with TI. " f"Status: '{status}' log: '{error_log_file}'")
 
-            return file_service.get(file_name).decode("UTF-8-sig")
+            # decode while streaming to not hold the whole file as bytes and str at the same time
+            return "".join(codecs.iterdecode(file_service.get_stream(file_name, compression=compression), "UTF-8-sig"))
 
         finally:
             with suppress(Exception):
@@ -5305,6 +7066,8 @@ class CellService(ObjectService):
         quote_character='"',
         arranged_axes: Tuple[List, List, List] = None,
         mdx_headers: bool = False,
+        compression: str = None,
+        partitions: int = 1,
         **kwargs,
     ):
         """Execute MDX and retrieve result as csv, using blobs.
@@ -5323,9 +7086,15 @@ class CellService(ObjectService):
         :param sandbox_name: str
         :param arranged_axes: Tuple
         :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param compression: 'gzip' or 'zstd' to download the blob compressed
+        :param partitions: number of slices of the row set that are exported by concurrent processes.
+        Requires mdx as MdxBuilder and must not be used with top or skip
         :include_headers: include header line in csv result
 
         """
+        if partitions > 1 and (top is not None or skip is not None):
+            raise ValueError("'top' and 'skip' must not be used in conjunction with 'partitions'")
+
         file_service, process_service, view_service = self._prepare_blob_services()
 
         try:
@@ -5355,16 +7124,28 @@ class CellService(ObjectService):
 
         unique_name = self.suggest_unique_object_name()
 
-        # dimension properties must be skipped as they produce extra variableS in TI data source
-        # and tear up the variable definition
-        if isinstance(mdx, MdxBuilder):
-            mdx = mdx.to_mdx(skip_dimension_properties=True)
+        # every slice is exported through its own view, process and file. All slices have the same axes
+        mdx_slices = self._split_mdx_row_axis(mdx, parts=partitions) if partitions > 1 else [mdx]
+        if len(mdx_slices) == 1:
+            names = [unique_name]
         else:
-            mdx = drop_dimension_properties(mdx)
-
-        view = MDXView(cube_name=cube, view_name=unique_name, MDX=mdx)
+            names = [f"{unique_name}_{i}" for i in range(len(mdx_slices))]
 
-        file_name = f"{unique_name}.csv"
+        # dimension properties must be skipped as they produce extra variableS in TI data source
+        # and tear up the variable definition
+        views = [
+            MDXView(
+                cube_name=cube,
+                view_name=name,
+                MDX=(
+                    mdx_slice.to_mdx(skip_dimension_properties=True)
+                    if isinstance(mdx_slice, MdxBuilder)
+                    else drop_dimension_properties(mdx_slice)
+                ),
+            )
+            for name, mdx_slice in zip(names, mdx_slices)
+        ]
+        file_names = [f"{name}.csv" for name in names]
         header_line = ""
         if include_headers:
             if mdx_headers:
@@ -5386,9 +7167,9 @@ class CellService(ObjectService):
                     + ["'Value'"]
                 )
 
-        try:
-            file_service.create(file_name=file_name, file_content="".encode("utf-8"))
-            view_service.update_or_create(view=view, private=False)
+        def export_slice(index: int):
+            file_service.create(file_name=file_names[index], file_content="".encode("utf-8"))
+            view_service.update_or_create(view=views[index], private=False)
             process = self._build_cube_to_blob_process(
                 cube=cube,
                 variables=variables,
@@ -5400,10 +7181,11 @@ class CellService(ObjectService):
                 skip_rule_derived_cells=skip_rule_derived_cells,
                 value_separator=value_separator,
                 sandbox_name=sandbox_name,
-                process_name=unique_name,
-                view_name=unique_name,
-                file_name=file_name,
-                header_line=header_line,
+                process_name=names[index],
+                view_name=names[index],
+                file_name=file_names[index],
+                # header only in the first file
+                header_line=header_line if index == 0 else "",
                 quote_character=quote_character,
             )
 
@@ -5411,13 +7193,32 @@ class CellService(ObjectService):
             if not success:
                 raise RuntimeError(f"Failed writing to blob with TI. " f"Status: '{status}' log: '{error_log_file}'")
 
-            return file_service.get(file_name).decode("UTF-8-sig")
+        async def export_slices_async():
+            loop = asyncio.get_event_loop()
+            with ThreadPoolExecutor(len(names)) as executor:
+                futures = [loop.run_in_executor(executor, export_slice, index) for index in range(len(names))]
+                await asyncio.gather(*futures)
+
+        try:
+            if len(names) == 1:
+                export_slice(0)
+            else:
+                run_async(export_slices_async())
+
+            # decode while streaming to not hold the whole files as bytes and str at the same time
+            return "".join(
+                text
+                for file_name in file_names
+                for text in codecs.iterdecode(file_service.get_stream(file_name, compression=compression), "UTF-8-sig")
+            )
 
         finally:
-            with suppress(Exception):
-                view_service.delete(cube_name=cube, view_name=unique_name, private=False)
-            with suppress(Exception):
-                file_service.delete(file_name)
+            # the executor waits for all slices, also if one of them failed, so nothing is created after the cleanup
+            for view, file_name in zip(views, file_names):
+                with suppress(Exception):
+                    view_service.delete(cube_name=cube, view_name=view.name, private=False)
+                with suppress(Exception):
+                    file_service.delete(file_name)
 
     def _prepare_blob_services(self):
         file_service = FileService(self._rest)
@@ -5425,6 +7226,56 @@ class CellService(ObjectService):
         process_service = ProcessService(self._rest)
         return file_service, process_service, view_service
 
+    def _split_mdx_row_axis(self, mdx: Union[str, MdxBuilder], parts: int, **kwargs) -> List[MdxBuilder]:
+        """Split the row set of the MDX into disjoint slices of the members of one row hierarchy.
+        Hierarchies are considered in the order of their element count, the first whose set evaluates to more
+        than one member is sliced
+
+        :param mdx: MdxBuilder
+        :param parts: max number of slices
+        :return: list of MdxBuilder. Only the original MDX if it can't be split
+        """
+        if not isinstance(mdx, MdxBuilder):
+            raise ValueError("Argument 'mdx' must be of type MdxBuilder to be split into slices")
+
+        if len(mdx.axes) < 2:
+            return [mdx]
+
+        _, _, rows, _ = self._attempt_derive_cellset_composition_from_mdx(mdx)
+        if not rows or mdx.axes[1].tuples:
+            return [mdx]
+
+        element_service = self.get_element_service()
+        row_sets = mdx.axes[1].dim_sets
+        element_counts = [
+            element_service.get_number_of_elements(row_set.dimension, row_set.hierarchy, **kwargs)
+            for row_set in row_sets
+        ]
+
+        for index in sorted(range(len(row_sets)), key=lambda i: element_counts[i], reverse=True):
+            members = element_service.execute_set_mdx(
+                row_sets[index].to_mdx(),
+                member_properties=["UniqueName"],
+                parent_properties=None,
+                element_properties=None,
+                **kwargs,
+            )
+            if len(members) < 2:
+                continue
+
+            unique_names = [member[0]["UniqueName"] for member in members]
+            slice_size = math.ceil(len(unique_names) / parts)
+            mdx_slices = []
+            for start in range(0, len(unique_names), slice_size):
+                mdx_slice = copy.deepcopy(mdx)
+                mdx_slice.axes[1].dim_sets[index] = MdxHierarchySet.members(
+                    [Member.from_unique_name(unique_name) for unique_name in unique_names[start : start + slice_size]]
+                )
+                mdx_slices.append(mdx_slice)
+            return mdx_slices
+
+        return [mdx]
+
     def _attempt_derive_cellset_composition_from_mdx(
         self, mdx: MdxBuilder
     ) -> Tuple[str, List[str], List[str], List[str]]:
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from TM1py.Exceptions.Exceptions import TM1pyWritePartialFailureException
+from TM1py.Services.CellService import CellService
+from TM1py.Utils.Utils import (
+    CaseAndSpaceInsensitiveDict,
+    CaseAndSpaceInsensitiveTuplesDict,
+)
+
+
+class CellWriter:
+    """Write-behind buffer on top of `CellService.write`
+
+    Cell updates are collected per cube and written in batches. Duplicate intersections are merged:
+    the last write wins, or numeric values are summed when `increment` is True.
+    A cube is flushed when its buffer reaches `max_cells`, when its oldest pending update is older than
+    `max_age` seconds, on `flush()` and when leaving the context manager. Aged buffers are flushed by a daemon
+    timer, started when the first update is buffered for a cube. If such a flush fails, the updates stay
+    buffered until the next flush and the exception is raised on the next call to `write` or `flush`.
+
+    The write method is chosen per batch: blob for batches with at least `blob_threshold` cells,
+    unbound TI for batches with at least `ti_threshold` cells, cellset otherwise.
+    Both blob and TI require admin permissions. Pass None to disable a method.
+
+    If a batch fails, the batch and all batches not yet written stay buffered and the exception is raised.
+    Batches that failed with minor errors are committed by TM1 and are not buffered again.
+    Buffered updates are not written when the with block is left through an exception and pending timers are
+    cancelled. Call `flush()` explicitly to write them anyway.
+
+        with CellWriter(tm1.cells, max_cells=5_000, max_age=2) as writer:
+            for cube, elements, value in updates:
+                writer.write_value(value, cube, elements)
+    """
+
+    def __init__(
+        self,
+        cell_service: CellService,
+        increment: bool = False,
+        max_cells: int = 10_000,
+        max_age: float = None,
+        blob_threshold: Optional[int] = 50_000,
+        ti_threshold: Optional[int] = 1_000,
+        sandbox_name: str = None,
+        **kwargs,
+    ):
+        """
+
+        :param cell_service: instance of CellService
+        :param increment: increment or update cell values. With increment numeric values of duplicates are summed
+        :param max_cells: flush a cube once this many distinct cells are buffered for it
+        :param max_age: flush a cube once its oldest buffered update is older than this many seconds.
+        None to flush only by size
+        :param blob_threshold: min number of cells in a batch to write with use_blob. None to never use blob
+        :param ti_threshold: min number of cells in a batch to write with use_ti. None to never use TI
+        :param sandbox_name: str
+        :param kwargs: additional arguments passed to `CellService.write`
+        """
+        if max_cells < 1:
+            raise ValueError("argument 'max_cells' must be a positive integer")
+
+        self._cells = cell_service
+        self.increment = increment
+        self.max_cells = max_cells
+        self.max_age = max_age
+        self.blob_threshold = blob_threshold
+        self.ti_threshold = ti_threshold
+        self.sandbox_name = sandbox_name
+        self._write_kwargs = kwargs
+
+        self._buffers = CaseAndSpaceInsensitiveDict()
+        self._first_update = CaseAndSpaceInsensitiveDict()
+        self._dimensions = CaseAndSpaceInsensitiveDict()
+        self._measure_dimension_elements = CaseAndSpaceInsensitiveDict()
+        self._timers: Dict[str, threading.Timer] = CaseAndSpaceInsensitiveDict()
+        # exception of a flush done by a timer. Raised on the next call to write or flush
+        self._timer_exception: Optional[Exception] = None
+        self._lock = threading.Lock()
+        # batches are written one at a time to keep the order of updates
+        self._flush_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        try:
+            if exception_type is None:
+                self.flush()
+        finally:
+            self.cancel_timers()
+
+    def __len__(self) -> int:
+        """number of buffered cells across all cubes"""
+        with self._lock:
+            return sum(len(cells) for cells in self._buffers.values())
+
+    def write_value(self, value: Union[str, float], cube_name: str, element_tuple: Iterable):
+        """Buffer a single cell update
+
+        :param value: the value to write
+        :param cube_name: name of the cube
+        :param element_tuple: element names in the natural order of the cube dimensions
+        :return:
+        """
+        self.write(cube_name, {tuple(element_tuple): value})
+
+    def write(self, cube_name: str, cellset_as_dict: Dict):
+        """Buffer cell updates
+
+        :param cube_name: name of the cube
+        :param cellset_as_dict: {(elem_a, elem_b, elem_c): 243, (elem_d, elem_e, elem_f) : 109}
+        :return:
+        """
+        self._raise_timer_exception()
+        with self._lock:
+            if cube_name not in self._buffers:
+                self._buffers[cube_name] = CaseAndSpaceInsensitiveTuplesDict()
+                self._first_update[cube_name] = time.monotonic()
+                self._start_timer(cube_name)
+            self._merge(self._buffers[cube_name], cellset_as_dict)
+
+            due = [name for name in self._buffers if self._is_due(name)]
+
+        for name in due:
+            self._flush(name)
+
+    def flush(self, cube_name: str = None):
+        """Write buffered updates to TM1
+
+        :param cube_name: flush only this cube. All cubes if None
+        :return:
+        """
+        self._raise_timer_exception()
+        self._flush(cube_name)
+
+    def cancel_timers(self):
+        """Stop the timers of all buffered cubes. Buffered updates are kept until the next `flush`"""
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+
+    def _flush(self, cube_name: str = None):
+        with self._flush_lock:
+            with self._lock:
+                cube_names = [cube_name] if cube_name else list(self._buffers)
+                batches = [
+                    (name, self._buffers.pop(name), self._first_update.pop(name))
+                    for name in cube_names
+                    if name in self._buffers
+                ]
+                for name, _, _ in batches:
+                    if name in self._timers:
+                        self._timers.pop(name).cancel()
+
+            for n, (name, cells, _) in enumerate(batches):
+                if not cells:
+                    continue
+                try:
+                    self._write_batch(name, cells)
+                except TM1pyWritePartialFailureException:
+                    # cells without errors are committed. Writing them again would repeat increments
+                    self._restore(batches[n + 1 :])
+                    raise
+                except Exception:
+                    self._restore(batches[n:])
+                    raise
+
+    def pending_cubes(self) -> List[str]:
+        """names of the cubes with buffered updates"""
+        with self._lock:
+            return list(self._buffers)
+
+    def _merge(self, buffer: CaseAndSpaceInsensitiveTuplesDict, cellset_as_dict: Dict):
+        for elements, value in cellset_as_dict.items():
+            elements = tuple(elements)
+            if self.increment and not isinstance(value, str) and elements in buffer:
+                previous = buffer[elements]
+                if not isinstance(previous, str):
+                    value = previous + value
+            buffer[elements] = value
+
+    def _restore(self, batches: List[Tuple[str, CaseAndSpaceInsensitiveTuplesDict, float]]):
+        # put unwritten batches back in front of updates that were buffered in the meantime
+        with self._lock:
+            for name, cells, first_update in batches:
+                if name in self._buffers:
+                    self._merge(cells, self._buffers[name])
+                self._buffers[name] = cells
+                self._first_update[name] = first_update
+
+    def _start_timer(self, cube_name: str):
+        if self.max_age is None:
+            return
+        timer = threading.Timer(self.max_age, self._flush_aged, args=(cube_name, self._first_update[cube_name]))
+        timer.daemon = True
+        self._timers[cube_name] = timer
+        timer.start()
+
+    def _flush_aged(self, cube_name: str, first_update: float):
+        with self._lock:
+            # the buffer the timer was started for was flushed in the meantime
+            if self._first_update.get(cube_name) != first_update:
+                return
+        try:
+            self._flush(cube_name)
+        except Exception as e:
+            self._timer_exception = e
+
+    def _raise_timer_exception(self):
+        exception, self._timer_exception = self._timer_exception, None
+        if exception is not None:
+            raise exception
+
+    def _is_due(self, cube_name: str) -> bool:
+        if len(self._buffers[cube_name]) >= self.max_cells:
+            return True
+        if self.max_age is not None and time.monotonic() - self._first_update[cube_name] >= self.max_age:
+            return True
+        return False
+
+    def _write_batch(self, cube_name: str, cells: CaseAndSpaceInsensitiveTuplesDict):
+        if cube_name not in self._dimensions:
+            self._dimensions[cube_name] = self._cells.get_dimension_names_for_writing(cube_name=cube_name)
+
+        use_blob = self.blob_threshold is not None and len(cells) >= self.blob_threshold
+        use_ti = not use_blob and self.ti_threshold is not None and len(cells) >= self.ti_threshold
+
+        kwargs = dict(self._write_kwargs)
+        if use_ti and "measure_dimension_elements" not in kwargs:
+            if cube_name not in self._measure_dimension_elements:
+                self._measure_dimension_elements[cube_name] = self._cells.get_elements_from_all_measure_hierarchies(
+                    cube_name=cube_name
+                )
+            kwargs["measure_dimension_elements"] = self._measure_dimension_elements[cube_name]
+
+        self._cells.write(
+            cube_name=cube_name,
+            cellset_as_dict=cells,
+            dimensions=self._dimensions[cube_name],
+            increment=self.increment,
+            sandbox_name=self.sandbox_name,
+            use_blob=use_blob,
+            use_ti=use_ti,
+            **kwargs,
+        )
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+from TM1py.Utils import CaseAndSpaceInsensitiveDict, lower_and_drop_spaces
+
+
+class _CubeMetadataCacheEntry:
+    def __init__(self, value, fetched_at: float):
+        self.value = value
+        self.fetched_at = fetched_at
+
+
+class CubeMetadataCache:
+    """Connection-scoped cache of the cube metadata that reads and writes need on every call:
+    dimension order, measure dimension, element types of the measure dimension and attribute types
+
+    Entries are served from memory for `ttl` seconds. Changes to cubes, dimensions, hierarchies, elements and
+    element attributes done through the services of the same connection invalidate the affected entries.
+    Changes done elsewhere (e.g. by a TI process or another client) are only picked up after `ttl`
+    or through `invalidate`. Pass ttl=0 to disable the cache.
+
+    There is one cache per RestService, shared by all services of the connection:
+
+        tm1.cells.metadata_cache.invalidate("Sales")
+    """
+
+    def __init__(self, rest, ttl: float = 300):
+        """
+
+        :param rest: instance of RestService
+        :param ttl: seconds an entry is served from memory before it is fetched again. 0 to disable the cache
+        """
+        self._rest = rest
+        self.ttl = ttl
+        # keys: ("dimensions", cube), ("measure_element_types", cube), ("attribute_types", dimension)
+        self._entries: Dict[Tuple[str, str], _CubeMetadataCacheEntry] = dict()
+        # incremented on every invalidation
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_dimension_names(self, cube_name: str, skip_sandbox_dimension: bool = True, **kwargs) -> List[str]:
+        """Names of the dimensions of a cube in their natural order
+
+        :param cube_name: name of the cube
+        :param skip_sandbox_dimension: skip the '}Sandboxes' dimension of cubes with sandbox support
+        :return: List : [dim1, dim2, dim3, etc.]
+        """
+        from TM1py.Services.CellService import CellService
+        from TM1py.Services.CubeService import CubeService
+
+        dimension_names = self._get(
+            ("dimensions", cube_name),
+            lambda: CubeService(self._rest).get_dimension_names(cube_name, skip_sandbox_dimension=False, **kwargs),
+        )
+        if skip_sandbox_dimension and dimension_names[0] == CellService.SANDBOX_DIMENSION:
+            return dimension_names[1:]
+        return list(dimension_names)
+
+    def get_measure_dimension(self, cube_name: str, **kwargs) -> str:
+        """Name of the last dimension of a cube
+
+        :param cube_name: name of the cube
+        :return: str
+        """
+        return self.get_dimension_names(cube_name, **kwargs)[-1]
+
+    def get_measure_element_types(self, cube_name: str, **kwargs) -> CaseAndSpaceInsensitiveDict:
+        """Types of the elements of all hierarchies of the measure dimension of a cube
+
+        :param cube_name: name of the cube
+        :return: CaseAndSpaceInsensitiveDict {'Sales': 'Numeric', 'Comment': 'String'}
+        """
+        from TM1py.Services.ElementService import ElementService
+
+        measure_dimension = self.get_measure_dimension(cube_name, **kwargs)
+        element_types = self._get(
+            ("measure_element_types", cube_name),
+            lambda: ElementService(self._rest).get_element_types_from_all_hierarchies(
+                dimension_name=measure_dimension, **kwargs
+            ),
+        )
+        return CaseAndSpaceInsensitiveDict(element_types)
+
+    def get_attribute_types(self, dimension_name: str, **kwargs) -> CaseAndSpaceInsensitiveDict:
+        """Types of the element attributes of a dimension
+
+        :param dimension_name: name of the dimension
+        :return: CaseAndSpaceInsensitiveDict {'Description': 'String', 'Weight': 'Numeric', 'Code': 'Alias'}
+        """
+        from TM1py.Services.ElementService import ElementService
+
+        attribute_dimension = ElementService.ELEMENT_ATTRIBUTES_PREFIX + dimension_name
+        attribute_types = self._get(
+            ("attribute_types", dimension_name),
+            lambda: ElementService(self._rest).get_element_types(attribute_dimension, attribute_dimension, **kwargs),
+        )
+        return CaseAndSpaceInsensitiveDict(attribute_types)
+
+    def invalidate(self, cube_name: str = None):
+        """Drop cached metadata
+
+        :param cube_name: drop only the metadata of this cube. Everything if None
+        :return:
+        """
+        with self._lock:
+            self._generation += 1
+            if cube_name is None:
+                self._entries.clear()
+                return
+
+            cube_key = lower_and_drop_spaces(cube_name)
+            for key in [("dimensions", cube_key), ("measure_element_types", cube_key)]:
+                self._entries.pop(key, None)
+
+    def invalidate_dimension(self, dimension_name: str):
+        """Drop cached metadata that depends on a dimension: attribute types of the dimension,
+        element types of cubes that use it as measure dimension and the dimensions of cubes that contain it
+
+        :param dimension_name: name of the dimension or of its element attributes dimension
+        :return:
+        """
+        from TM1py.Services.ElementService import ElementService
+
+        dimension_key = lower_and_drop_spaces(dimension_name)
+        prefix = lower_and_drop_spaces(ElementService.ELEMENT_ATTRIBUTES_PREFIX)
+        if dimension_key.startswith(prefix):
+            dimension_key = dimension_key[len(prefix) :]
+
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(("attribute_types", dimension_key), None)
+            for (kind, cube_key), entry in list(self._entries.items()):
+                if kind != "dimensions" or dimension_key not in map(lower_and_drop_spaces, entry.value):
+                    continue
+                self._entries.pop(("dimensions", cube_key), None)
+                self._entries.pop(("measure_element_types", cube_key), None)
+
+    def _get(self, key: Tuple[str, str], fetch: Callable):
+        key = (key[0], lower_and_drop_spaces(key[1]))
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry and now - entry.fetched_at < self.ttl:
+                return entry.value
+            generation = self._generation
+
+        # fetch without holding the lock, so that hits for other keys aren't blocked by the request.
+        # Concurrent misses for the same key may fetch twice
+        value = fetch()
+        if self.ttl > 0:
+            with self._lock:
+                # don't store values fetched before an invalidation
+                if generation == self._generation:
+                    self._entries[key] = _CubeMetadataCacheEntry(value, now)
+        return value
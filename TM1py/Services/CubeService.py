@@ -37,6 +37,7 @@ class CubeService(ObjectService):
         :param cube: instance of TM1py.Cube
         :return: response
         """
+        self._rest.metadata_cache.invalidate(cube.name)
         url = "/Cubes"
         return self._rest.POST(url=url, data=cube.body, **kwargs)
 
@@ -112,6 +113,7 @@ class CubeService(ObjectService):
         :param cube: instance of TM1py.Cube
         :return: response
         """
+        self._rest.metadata_cache.invalidate(cube.name)
         url = format_url("/Cubes('{}')", cube.name)
         return self._rest.PATCH(url, cube.body, **kwargs)
 
@@ -161,6 +163,7 @@ class CubeService(ObjectService):
         :param cube_name:
         :return: response
         """
+        self._rest.metadata_cache.invalidate(cube_name)
         url = format_url("/Cubes('{}')", cube_name)
         return self._rest.DELETE(url, **kwargs)
 
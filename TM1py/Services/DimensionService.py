@@ -121,6 +121,7 @@ class DimensionService(ObjectService):
         :param dimension_name: Name of the dimension
         :return:
         """
+        self._rest.metadata_cache.invalidate_dimension(dimension_name)
         url = format_url("/Dimensions('{}')", dimension_name)
         return self._rest.DELETE(url, **kwargs)
 
@@ -26,8 +26,9 @@ from TM1py.Exceptions.Exceptions import (
     TM1pyWriteFailureException,
     TM1pyWritePartialFailureException,
 )
-from TM1py.Objects import Element, ElementAttribute
+from TM1py.Objects import Element, ElementAttribute, Hierarchy
 from TM1py.Services.FileService import FileService
+from TM1py.Services.HierarchyCache import HierarchyCache
 from TM1py.Services.ObjectService import ObjectService
 from TM1py.Services.ProcessService import ProcessService
 from TM1py.Services.RestService import RestService
@@ -56,6 +57,32 @@ class ElementService(ObjectService):
 
     def __init__(self, rest: RestService):
         super().__init__(rest)
+        self._cache: Optional[HierarchyCache] = None
+
+    @property
+    def cache(self) -> Optional[HierarchyCache]:
+        return self._cache
+
+    def enable_cache(self, cache: HierarchyCache = None, ttl: float = 300, max_age: float = 3600) -> HierarchyCache:
+        """Answer element name, level and parent / ancestor queries from a local `HierarchyCache`
+        instead of querying TM1 on every call
+
+        :param cache: existing HierarchyCache to share between services. A new one is created if None
+        :param ttl: seconds a cached hierarchy is served before it is checked for changes. Ignored if cache is passed
+        :param max_age: seconds after which a cached hierarchy is fetched again, even if it appears unchanged.
+        Ignored if cache is passed
+        :return: the HierarchyCache in use
+        """
+        self._cache = cache or HierarchyCache(self._rest, ttl=ttl, max_age=max_age)
+        return self._cache
+
+    def disable_cache(self):
+        self._cache = None
+
+    def _invalidate_cache(self, dimension_name: str, hierarchy_name: str = None):
+        self._rest.metadata_cache.invalidate_dimension(dimension_name)
+        if self._cache is not None:
+            self._cache.invalidate(dimension_name, hierarchy_name)
 
     def get(self, dimension_name: str, hierarchy_name: str, element_name: str, **kwargs) -> Element:
         url = format_url(
@@ -65,10 +92,12 @@ class ElementService(ObjectService):
         return Element.from_dict(response.json())
 
     def create(self, dimension_name: str, hierarchy_name: str, element: Element, **kwargs) -> Response:
+        self._invalidate_cache(dimension_name, hierarchy_name)
         url = format_url("/Dimensions('{}')/Hierarchies('{}')/Elements", dimension_name, hierarchy_name)
         return self._rest.POST(url, element.body, **kwargs)
 
     def update(self, dimension_name: str, hierarchy_name: str, element: Element, **kwargs) -> Response:
+        self._invalidate_cache(dimension_name, hierarchy_name)
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Elements('{}')", dimension_name, hierarchy_name, element.name
         )
@@ -89,6 +118,7 @@ class ElementService(ObjectService):
         return self.create(dimension_name=dimension_name, hierarchy_name=hierarchy_name, element=element, **kwargs)
 
     def delete(self, dimension_name: str, hierarchy_name: str, element_name: str, **kwargs) -> Response:
+        self._invalidate_cache(dimension_name, hierarchy_name)
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Elements('{}')", dimension_name, hierarchy_name, element_name
         )
@@ -98,6 +128,7 @@ class ElementService(ObjectService):
     def delete_elements(
         self, dimension_name: str, hierarchy_name: str, element_names: List[str] = None, use_ti: bool = False, **kwargs
     ):
+        self._invalidate_cache(dimension_name, hierarchy_name)
         if use_ti:
             return self.delete_elements_use_ti(dimension_name, hierarchy_name, element_names, **kwargs)
 
@@ -110,6 +141,7 @@ class ElementService(ObjectService):
     def delete_elements_use_ti(
         self, dimension_name: str, hierarchy_name: str, element_names: List[str] = None, **kwargs
     ):
+        self._invalidate_cache(dimension_name, hierarchy_name)
         subset_service = self._get_subset_service()
         unbound_process_name = subset_name = self.suggest_unique_object_name()
         subset = Subset(subset_name, dimension_name, hierarchy_name, elements=element_names)
@@ -138,6 +170,7 @@ class ElementService(ObjectService):
         remove_blob: bool = True,
         **kwargs,
     ):
+        self._invalidate_cache(dimension_name, hierarchy_name)
         if use_ti:
             return self.delete_edges_use_ti(dimension_name, hierarchy_name, edges, **kwargs)
 
@@ -151,6 +184,7 @@ class ElementService(ObjectService):
         h_service.update(h, **kwargs)
 
     def delete_edges_use_ti(self, dimension_name: str, hierarchy_name: str, edges: List[str] = None, **kwargs):
+        self._invalidate_cache(dimension_name, hierarchy_name)
         if not edges:
             return
 
@@ -186,6 +220,7 @@ class ElementService(ObjectService):
         :param kwargs: Additional arguments for the process execution.
         :return: None
         """
+        self._invalidate_cache(dimension_name, hierarchy_name)
         if not edges:
             return
 
@@ -568,6 +603,9 @@ class ElementService(ObjectService):
         return pd.merge(df, df_data, on=dimension_name).drop_duplicates()
 
     def get_edges(self, dimension_name: str, hierarchy_name: str, **kwargs) -> Dict[Tuple[str, str], int]:
+        if self._cache is not None:
+            return self._cache.get_edges(dimension_name, hierarchy_name)
+
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Edges?select=ParentName,ComponentName,Weight",
             dimension_name,
@@ -585,6 +623,9 @@ class ElementService(ObjectService):
         return [Element.from_dict(element) for element in response.json()["value"]]
 
     def get_leaf_element_names(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[str]:
+        if self._cache is not None:
+            return self._cache.get_leaf_element_names(dimension_name, hierarchy_name)
+
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name&$filter=Type ne 3",
             dimension_name,
@@ -601,6 +642,9 @@ class ElementService(ObjectService):
         return [Element.from_dict(element) for element in response.json()["value"]]
 
     def get_consolidated_element_names(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[str]:
+        if self._cache is not None:
+            return self._cache.get_element_names_by_type(dimension_name, hierarchy_name, Element.Types.CONSOLIDATED)
+
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name&$filter=Type eq 3",
             dimension_name,
@@ -617,6 +661,9 @@ class ElementService(ObjectService):
         return [Element.from_dict(element) for element in response.json()["value"]]
 
     def get_numeric_element_names(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[str]:
+        if self._cache is not None:
+            return self._cache.get_element_names_by_type(dimension_name, hierarchy_name, Element.Types.NUMERIC)
+
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name&$filter=Type eq 1",
             dimension_name,
@@ -633,6 +680,9 @@ class ElementService(ObjectService):
         return [Element.from_dict(element) for element in response.json()["value"]]
 
     def get_string_element_names(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[str]:
+        if self._cache is not None:
+            return self._cache.get_element_names_by_type(dimension_name, hierarchy_name, Element.Types.STRING)
+
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name&$filter=Type eq 2",
             dimension_name,
@@ -648,11 +698,17 @@ class ElementService(ObjectService):
         :param hierarchy_name:
         :return: Generator of element-names
         """
+        if self._cache is not None:
+            return self._cache.get_element_names(dimension_name, hierarchy_name)
+
         url = format_url("/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name", dimension_name, hierarchy_name)
         response = self._rest.GET(url, **kwargs)
         return [e["Name"] for e in response.json()["value"]]
 
     def get_number_of_elements(self, dimension_name: str, hierarchy_name: str, **kwargs) -> int:
+        if self._cache is not None:
+            return len(self._cache.get(dimension_name, hierarchy_name))
+
         url = format_url("/Dimensions('{}')/Hierarchies('{}')/Elements/$count", dimension_name, hierarchy_name)
         response = self._rest.GET(url, **kwargs)
         return int(response.text)
@@ -705,6 +761,9 @@ class ElementService(ObjectService):
         :param level: Level to filter
         :return: List of element names
         """
+        if self._cache is not None:
+            return self._cache.get_elements_by_level(dimension_name, hierarchy_name, level)
+
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name&$filter=Level eq {}",
             dimension_name,
@@ -1020,6 +1079,7 @@ class ElementService(ObjectService):
         :param element_attribute: instance of TM1py.ElementAttribute
         :return:
         """
+        self._invalidate_cache(dimension_name, hierarchy_name)
         url = format_url("/Dimensions('{}')/Hierarchies('{}')/ElementAttributes", dimension_name, hierarchy_name)
         return self._rest.POST(url, element_attribute.body, **kwargs)
 
@@ -1033,6 +1093,7 @@ class ElementService(ObjectService):
         :param element_attribute: instance of TM1py.ElementAttribute
         :return:
         """
+        self._invalidate_cache(dimension_name, hierarchy_name)
         url = format_url(
             "/Dimensions('}}ElementAttributes_{}')/Hierarchies('}}ElementAttributes_{}')/Elements('{}')",
             dimension_name,
@@ -1155,6 +1216,82 @@ class ElementService(ObjectService):
         get_members(consolidation_tree)
         return members
 
+    def get_ancestors_bulk(
+        self, dimension_name: str, hierarchy_name: str, elements: Iterable[str], recursive: bool = True, **kwargs
+    ) -> CaseAndSpaceInsensitiveDict:
+        """Get the ancestors of many elements with a single request
+
+        Elements and edges of the hierarchy are retrieved once (or taken from the cache, if enabled)
+        and all elements are resolved locally.
+
+        :param dimension_name: name of dimension
+        :param hierarchy_name: name of hierarchy
+        :param elements: names of the elements
+        :param recursive: all ancestors if True, only direct parents otherwise
+        :return: CaseAndSpaceInsensitiveDict {element: [ancestor, ...]}. Empty list for elements that don't exist
+        """
+        hierarchy = self._get_hierarchy_structure(dimension_name, hierarchy_name, **kwargs)
+
+        ancestors = CaseAndSpaceInsensitiveDict()
+        for element_name in elements:
+            if element_name in ancestors:
+                continue
+            # edges are in the order of traversal. Parents repeat for elements with multiple paths
+            edges = hierarchy.get_ancestor_edges(element_name, recursive=recursive)
+            ancestors[element_name] = list(dict.fromkeys(parent for parent, _ in edges))
+        return ancestors
+
+    def get_leaves_bulk(
+        self, dimension_name: str, hierarchy_name: str, consolidations: Iterable[str], **kwargs
+    ) -> CaseAndSpaceInsensitiveDict:
+        """Get the leaves under many consolidations with a single request.
+        Like `get_leaves_under_consolidation` only numeric elements are considered leaves.
+
+        Elements and edges of the hierarchy are retrieved once (or taken from the cache, if enabled)
+        and all consolidations are resolved locally.
+
+        :param dimension_name: name of dimension
+        :param hierarchy_name: name of hierarchy
+        :param consolidations: names of the consolidated elements
+        :return: CaseAndSpaceInsensitiveDict {consolidation: [leaf, ...]}. Empty list for elements that don't exist
+        """
+        hierarchy = self._get_hierarchy_structure(dimension_name, hierarchy_name, **kwargs)
+
+        leaves = CaseAndSpaceInsensitiveDict()
+        for consolidation in consolidations:
+            if consolidation in leaves:
+                continue
+            if not hierarchy.contains_element(consolidation):
+                leaves[consolidation] = []
+                continue
+
+            element = hierarchy.get_element(consolidation)
+            if element.element_type == Element.Types.NUMERIC:
+                leaves[consolidation] = [element.name]
+                continue
+
+            edges = hierarchy.get_descendant_edges(consolidation, recursive=True)
+            leaves[consolidation] = [
+                component
+                for component in dict.fromkeys(component for _, component in edges)
+                if hierarchy.get_element(component).element_type == Element.Types.NUMERIC
+            ]
+        return leaves
+
+    def _get_hierarchy_structure(self, dimension_name: str, hierarchy_name: str, **kwargs) -> Hierarchy:
+        """Hierarchy with elements and edges. Retrieved with a single request, or taken from the cache if enabled"""
+        if self._cache is not None:
+            return self._cache.get(dimension_name, hierarchy_name)
+
+        url = format_url(
+            "/Dimensions('{}')/Hierarchies('{}')?$select=Name"
+            "&$expand=Edges($select=ParentName,ComponentName,Weight),Elements($select=Name,Type)",
+            dimension_name,
+            hierarchy_name,
+        )
+        response = self._rest.GET(url, **kwargs)
+        return Hierarchy.from_dict(response.json(), dimension_name=dimension_name)
+
     def execute_set_mdx_element_names(self, mdx: str, top_records: Optional[int] = None, **kwargs) -> List:
         """
         :method to execute an MDX statement against a dimension and get a list with element names back
@@ -1255,7 +1392,7 @@ class ElementService(ObjectService):
         :param component:
         :return:
         """
-
+        self._invalidate_cache(dimension_name, hierarchy_name)
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Elements('{}')/Edges(ParentName='{}',ComponentName='{}')",
             dimension_name,
@@ -1268,17 +1405,30 @@ class ElementService(ObjectService):
         return self._rest.DELETE(url=url, **kwargs)
 
     def add_edges(
-        self, dimension_name: str, hierarchy_name: str = None, edges: Dict[Tuple[str, str], int] = None, **kwargs
+        self,
+        dimension_name: str,
+        hierarchy_name: str = None,
+        edges: Dict[Tuple[str, str], int] = None,
+        use_blob: bool = False,
+        remove_blob: bool = True,
+        **kwargs,
     ) -> Response:
         """Add Edges to hierarchy. Fails if one edge already exists.
 
         :param dimension_name:
         :param hierarchy_name:
         :param edges:
+        :param use_blob: add edges through an unbound TI process with an uploaded CSV as data source.
+            Requires admin permissions. Existing edges don't fail, their weight is updated
+        :param remove_blob: remove the uploaded CSV after use. Only relevant with use_blob
         :return:
         """
         if not hierarchy_name:
             hierarchy_name = dimension_name
+        if use_blob:
+            return self.add_edges_use_blob(dimension_name, hierarchy_name, edges, remove_blob, **kwargs)
+
+        self._invalidate_cache(dimension_name, hierarchy_name)
 
         url = format_url("/Dimensions('{}')/Hierarchies('{}')/Edges", dimension_name, hierarchy_name)
         body = [
@@ -1288,19 +1438,149 @@ class ElementService(ObjectService):
 
         return self._rest.POST(url=url, data=json.dumps(body), **kwargs)
 
-    def add_elements(self, dimension_name: str, hierarchy_name: str, elements: Iterable[Element], **kwargs):
+    def add_elements(
+        self,
+        dimension_name: str,
+        hierarchy_name: str,
+        elements: Iterable[Element],
+        use_blob: bool = False,
+        remove_blob: bool = True,
+        **kwargs,
+    ):
         """Add elements to hierarchy. Fails if one element already exists.
 
         :param dimension_name:
         :param hierarchy_name:
         :param elements:
+        :param use_blob: add elements through an unbound TI process with an uploaded CSV as data source.
+            Requires admin permissions. Existing elements don't fail
+        :param remove_blob: remove the uploaded CSV after use. Only relevant with use_blob
         :return:
         """
+        if use_blob:
+            return self.add_elements_use_blob(dimension_name, hierarchy_name, elements, remove_blob, **kwargs)
+
+        self._invalidate_cache(dimension_name, hierarchy_name)
         url = format_url("/Dimensions('{}')/Hierarchies('{}')/Elements", dimension_name, hierarchy_name)
         body = [element.body_as_dict for element in elements]
 
         return self._rest.POST(url=url, data=json.dumps(body), **kwargs)
 
+    def add_elements_use_blob(
+        self,
+        dimension_name: str,
+        hierarchy_name: str,
+        elements: Iterable[Element],
+        remove_blob: bool = True,
+        **kwargs,
+    ):
+        """Add elements in TM1 via an unbound TI process having an uploaded CSV as the data source.
+
+        :param dimension_name: The name of the dimension.
+        :param hierarchy_name: The name of the hierarchy.
+        :param elements: The elements to add.
+        :param remove_blob: A boolean indicating whether to remove the CSV file after use (default: True).
+        :param kwargs: Additional arguments for the process execution.
+        :return: None
+        """
+        records = (("E", element.name, str(element.element_type)[0], "") for element in elements)
+        self._add_to_hierarchy_use_blob(dimension_name, hierarchy_name, records, remove_blob, **kwargs)
+
+    def add_edges_use_blob(
+        self,
+        dimension_name: str,
+        hierarchy_name: str,
+        edges: Dict[Tuple[str, str], float],
+        remove_blob: bool = True,
+        **kwargs,
+    ):
+        """Add edges in TM1 via an unbound TI process having an uploaded CSV as the data source.
+
+        :param dimension_name: The name of the dimension.
+        :param hierarchy_name: The name of the hierarchy.
+        :param edges: A dictionary of (parent, child) tuples and weights.
+        :param remove_blob: A boolean indicating whether to remove the CSV file after use (default: True).
+        :param kwargs: Additional arguments for the process execution.
+        :return: None
+        """
+        records = (("C", parent, component, repr(float(weight))) for (parent, component), weight in edges.items())
+        self._add_to_hierarchy_use_blob(dimension_name, hierarchy_name, records, remove_blob, **kwargs)
+
+    @require_data_admin
+    @require_ops_admin
+    def _add_to_hierarchy_use_blob(
+        self, dimension_name: str, hierarchy_name: str, records: Iterable[Tuple], remove_blob: bool = True, **kwargs
+    ):
+        self._invalidate_cache(dimension_name, hierarchy_name)
+
+        csv_content = StringIO()
+        csv_writer = csv.writer(csv_content, delimiter=",", quoting=csv.QUOTE_ALL)
+        csv_writer.writerows(records)
+        if not csv_content.tell():
+            return
+
+        process_service = ProcessService(self._rest)
+        file_service = FileService(self._rest)
+
+        unique_name = self.suggest_unique_object_name()
+        file_name = f"{unique_name}.csv"
+        file_service.create(file_name=file_name, file_content=csv_content.getvalue().encode("utf-8"), **kwargs)
+
+        try:
+            process = self._build_add_to_hierarchy_from_blob_process(
+                dimension_name=dimension_name,
+                hierarchy_name=hierarchy_name,
+                process_name=unique_name,
+                blob_filename=file_name,
+            )
+
+            success, status, log_file = process_service.execute_process_with_return(process=process, **kwargs)
+            if not success:
+                if status in ["HasMinorErrors"]:
+                    raise TM1pyWritePartialFailureException([status], [log_file], 1)
+                else:
+                    raise TM1pyWriteFailureException([status], [log_file])
+
+        finally:
+            if remove_blob:
+                file_service.delete(file_name=file_name)
+
+    def _build_add_to_hierarchy_from_blob_process(
+        self, dimension_name: str, hierarchy_name: str, process_name: str, blob_filename: str
+    ) -> Process:
+
+        # v11 automatically adds blb file extensions to documents created via the contents api
+        if not verify_version(required_version="12", version=self.version):
+            blob_filename += ".blb"
+        process = Process(
+            name=process_name,
+            datasource_type="ASCII",
+            datasource_ascii_header_records=0,
+            datasource_data_source_name_for_server=f"{blob_filename}",
+            datasource_data_source_name_for_client=f"{blob_filename}",
+            datasource_ascii_delimiter_char=",",
+            datasource_ascii_decimal_separator=".",
+            datasource_ascii_thousand_separator="",
+            datasource_ascii_quote_character='"',
+        )
+
+        # Define encoding in Prolog section
+        process.prolog_procedure = """
+        SetInputCharacterSet('TM1CS_UTF8');
+         """
+        # records are either elements: E, name, type or edges: C, parent, component, weight
+        for variable in ("vRecord", "vFirst", "vSecond", "vWeight"):
+            process.add_variable(name=variable, variable_type="String")
+
+        process.metadata_procedure = f"""
+IF(vRecord @= 'E');
+  HierarchyElementInsert('{dimension_name}', '{hierarchy_name}', '', vFirst, vSecond);
+ELSE;
+  HierarchyElementComponentAdd('{dimension_name}', '{hierarchy_name}', vFirst, vSecond, StringToNumber(vWeight));
+ENDIF;
+"""
+        return process
+
     def add_element_attributes(
         self, dimension_name: str, hierarchy_name: str, element_attributes: List[ElementAttribute], **kwargs
     ):
@@ -1311,12 +1591,16 @@ class ElementService(ObjectService):
         :param element_attributes:
         :return:
         """
+        self._invalidate_cache(dimension_name, hierarchy_name)
         url = format_url("/Dimensions('{}')/Hierarchies('{}')/ElementAttributes", dimension_name, hierarchy_name)
         body = [element_attribute.body_as_dict for element_attribute in element_attributes]
 
         return self._rest.POST(url=url, data=json.dumps(body), **kwargs)
 
     def get_parents(self, dimension_name: str, hierarchy_name: str, element_name: str, **kwargs) -> List[str]:
+        if self._cache is not None:
+            return self._cache.get_parents(dimension_name, hierarchy_name, element_name)
+
         url = format_url(
             "/Dimensions('{dimension_name}')/Hierarchies('{hierarchy_name}')/Elements('{element_name}')/Parents"
             "?$select=Name",
@@ -1329,6 +1613,9 @@ class ElementService(ObjectService):
         return [record["Name"] for record in response.json()["value"]]
 
     def get_parents_of_all_elements(self, dimension_name: str, hierarchy_name: str, **kwargs) -> Dict[str, List[str]]:
+        if self._cache is not None:
+            return self._cache.get_parents_of_all_elements(dimension_name, hierarchy_name)
+
         url = format_url(
             f"/Dimensions('{dimension_name}')/Hierarchies('{hierarchy_name}')/Elements?$select=Name"
             f"&$expand=Parents($select=Name)",
@@ -1380,6 +1667,9 @@ class ElementService(ObjectService):
         :if an invalid element is passed;
         :but will raise an exception if an invalid dimension, or hierarchy is passed
         """
+        if self._cache is not None:
+            return self._cache.element_is_parent(dimension_name, hierarchy_name, parent_name, element_name)
+
         mdx = self._build_drill_intersection_mdx(
             dimension_name=dimension_name,
             hierarchy_name=hierarchy_name,
@@ -1406,8 +1696,12 @@ class ElementService(ObjectService):
         Value 'Descendants' performs well when `ancestor_name` and `element_name` are Consolidations.
 
         If no value is passed, function defaults to 'TI' for user with admin permissions
-        and 'TM1DrillDownMember' for users without admin permissions
+        and 'TM1DrillDownMember' for users without admin permissions.
+        If the cache is enabled and no value is passed, the function is answered from the cache
         """
+        if not method and self._cache is not None:
+            return self._cache.element_is_ancestor(dimension_name, hierarchy_name, ancestor_name, element_name)
+
         if not method:
             method = "TI" if self.is_admin else "TM1DrillDownMember"
 
@@ -1,22 +1,35 @@
 # -*- coding: utf-8 -*-
 import concurrent.futures
+import itertools
 import json
 import time
 import warnings
+import zlib
 from io import BytesIO
 from pathlib import Path
-from typing import Iterable, List, Tuple, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
-from TM1py.Exceptions import TM1pyVersionException
+from urllib3.util.request import ACCEPT_ENCODING
+
+from TM1py.Exceptions import TM1pyException, TM1pyVersionException
 from TM1py.Services import RestService
 from TM1py.Services.ObjectService import ObjectService
 from TM1py.Utils import format_url
 from TM1py.Utils.Utils import require_version, verify_version
 
+try:
+    import zstandard
+
+    _has_zstandard = True
+except ImportError:
+    _has_zstandard = False
+
 
 class FileService(ObjectService):
     SUBFOLDER_REQUIRED_VERSION = "12"
     MPU_REQUIRED_VERSION = "12"
+    COMPRESSIONS = ("gzip", "zstd")
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
     def __init__(self, tm1_rest: RestService):
         """
@@ -55,18 +68,155 @@ class FileService(ObjectService):
         return [file["Name"] for file in json.loads(response)["value"]]
 
     @require_version(version="11.4")
-    def get(self, file_name: str, **kwargs) -> bytes:
+    def get(self, file_name: str, compression: str = None, **kwargs) -> bytes:
         """Get file
 
         :param file_name: file name in root or path to file
+        :param compression: 'gzip' or 'zstd'. Ask the server to compress the transfer with only this encoding.
+        gzip is offered by default anyway. zstd requires urllib3 >= 2 with zstandard to decode the response.
+        The content is decompressed transparently. Servers that don't support it send the file uncompressed
         """
         path = Path(file_name)
         self._check_subfolder_support(path=path, function="FileService.get")
 
         url = self._construct_content_url(path=path, exclude_path_end=False, extension="Content")
 
+        if compression:
+            self._check_compression(compression, decode=True)
+            kwargs["headers"] = {**kwargs.get("headers", {}), "Accept-Encoding": compression}
+
         return self._rest.GET(url, **kwargs).content
 
+    @require_version(version="11.4")
+    def get_stream(
+        self, file_name: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE, compression: str = None, **kwargs
+    ) -> Iterator[bytes]:
+        """Get file as a stream of chunks. The file is never held in memory as a whole
+
+        The request is sent when the function is called. The connection is released once the stream is
+        exhausted or closed.
+
+        :param file_name: file name in root or path to file
+        :param chunk_size: max size of the chunks in bytes
+        :param compression: 'gzip' or 'zstd'. Ask the server to compress the transfer with only this encoding.
+        gzip is offered by default anyway. zstd requires urllib3 >= 2 with zstandard to decode the response.
+        The chunks are decompressed transparently. Servers that don't support it send the file uncompressed
+        :return: generator of bytes
+        """
+        path = Path(file_name)
+        self._check_subfolder_support(path=path, function="FileService.get_stream")
+
+        url = self._construct_content_url(path=path, exclude_path_end=False, extension="Content")
+
+        if compression:
+            self._check_compression(compression, decode=True)
+            kwargs["headers"] = {**kwargs.get("headers", {}), "Accept-Encoding": compression}
+
+        response = self._rest.GET(url, stream=True, async_requests_mode=False, **kwargs)
+        return self._iter_response_content(response=response, chunk_size=chunk_size)
+
+    @require_version(version="11.4")
+    def download(
+        self,
+        file_name: str,
+        path: Union[str, Path],
+        parts: int = 1,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        compression: str = None,
+        **kwargs,
+    ) -> Path:
+        """Download file to disk without holding it in memory
+
+        With `parts` > 1 the file is split into byte ranges that are fetched in parallel (HTTP Range requests).
+        If the server doesn't support ranges, the file is downloaded with one streamed request.
+
+        :param file_name: file name in root or path to file
+        :param path: local target path. Existing files are overwritten
+        :param parts: number of byte ranges that are downloaded in parallel
+        :param chunk_size: max size in bytes of the chunks written to disk
+        :param compression: 'gzip' or 'zstd'. Ask the server to compress the transfer with only this encoding.
+        See `get_stream`. Can only be used with `parts` = 1
+        :return: the local target path
+        """
+        if parts < 1:
+            raise ValueError("argument 'parts' must be a positive integer")
+        if compression and parts > 1:
+            raise ValueError("'compression' can not be used in conjunction with 'parts' > 1")
+
+        target = Path(path)
+        if parts == 1:
+            with open(target, "wb") as file:
+                for chunk in self.get_stream(file_name, chunk_size=chunk_size, compression=compression, **kwargs):
+                    file.write(chunk)
+            return target
+
+        source = Path(file_name)
+        self._check_subfolder_support(path=source, function="FileService.download")
+        url = self._construct_content_url(path=source, exclude_path_end=False, extension="Content")
+
+        # probe for range support. Servers that ignore the Range header respond with the whole file
+        response = self._get_range(url, start=0, end=0, verify_response=False, **kwargs)
+        file_size = self._parse_content_range_size(response)
+        if file_size is None:
+            if response.status_code == 200:
+                chunks = self._iter_response_content(response=response, chunk_size=chunk_size)
+            else:
+                # e.g. 416 for empty files. Errors are raised by the regular request
+                response.close()
+                chunks = self.get_stream(file_name, chunk_size=chunk_size, **kwargs)
+
+            with open(target, "wb") as file:
+                for chunk in chunks:
+                    file.write(chunk)
+            return target
+        response.close()
+
+        with open(target, "wb") as file:
+            file.truncate(file_size)
+
+        def download_range(start: int, end: int):
+            range_response = self._get_range(url, start=start, end=end, **kwargs)
+            if range_response.status_code != 206:
+                range_response.close()
+                raise TM1pyException(f"Server did not respond with the requested byte range of '{file_name}'")
+
+            with open(target, "r+b") as range_file:
+                range_file.seek(start)
+                for range_chunk in self._iter_response_content(response=range_response, chunk_size=chunk_size):
+                    range_file.write(range_chunk)
+
+        part_size = -(-file_size // parts)
+        ranges = [(start, min(start + part_size, file_size) - 1) for start in range(0, file_size, part_size)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=parts) as executor:
+            futures = [executor.submit(download_range, start, end) for start, end in ranges]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+
+        return target
+
+    def _get_range(self, url: str, start: int, end: int, **kwargs):
+        headers = {**kwargs.pop("headers", {}), "Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+        return self._rest.GET(url, headers=headers, stream=True, async_requests_mode=False, **kwargs)
+
+    @staticmethod
+    def _parse_content_range_size(response) -> Optional[int]:
+        """total size from a 'Content-Range: bytes 0-0/12345' header. None if the range was not served"""
+        if response.status_code != 206:
+            return None
+
+        content_range = response.headers.get("Content-Range", "")
+        _, _, size = content_range.rpartition("/")
+        if not size.isdigit():
+            return None
+        return int(size)
+
+    @staticmethod
+    def _iter_response_content(response, chunk_size: int) -> Iterator[bytes]:
+        try:
+            yield from response.iter_content(chunk_size=chunk_size)
+        finally:
+            response.close()
+
     def _create_folder(self, folder_name: Union[str, Path], **kwargs):
         """Create folder
 
@@ -118,6 +268,47 @@ class FileService(ObjectService):
                 function=function, required_version=self.SUBFOLDER_REQUIRED_VERSION, feature="Subfolder"
             )
 
+    def _check_compression(self, compression: str, decode: bool = False) -> None:
+        """
+        :param compression: 'gzip' or 'zstd'
+        :param decode: compressed responses are decoded by urllib3, compressed uploads are encoded by TM1py
+        """
+        if compression not in self.COMPRESSIONS:
+            raise ValueError(f"'compression' must be one of {self.COMPRESSIONS}, not '{compression}'")
+
+        if compression != "zstd":
+            return
+
+        if decode and "zstd" not in ACCEPT_ENCODING:
+            raise ImportError("Decoding 'zstd' responses requires urllib3 >= 2 with zstandard")
+        if not decode and not _has_zstandard:
+            raise ImportError("Compression 'zstd' requires zstandard")
+
+    def _upload_http_header(self, compression: str = None) -> dict:
+        if not compression:
+            return self.binary_http_header
+
+        return {**self.binary_http_header, "Content-Encoding": compression}
+
+    @staticmethod
+    def _compress_chunks(chunks: Iterable[bytes], compression: str) -> Iterator[bytes]:
+        if compression == "zstd":
+            compressor = zstandard.ZstdCompressor().compressobj()
+        else:
+            compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+
+        for chunk in chunks:
+            compressed_chunk = compressor.compress(chunk)
+            if compressed_chunk:
+                yield compressed_chunk
+        yield compressor.flush()
+
+    @staticmethod
+    def _read_bytes(file_content: Union[bytes, BytesIO]) -> bytes:
+        if isinstance(file_content, BytesIO):
+            return file_content.getvalue()
+        return file_content
+
     def _check_mpu_support(self, function: str) -> None:
         if not verify_version(required_version=self.MPU_REQUIRED_VERSION, version=self.version):
             raise TM1pyVersionException(
@@ -127,44 +318,70 @@ class FileService(ObjectService):
     def _upload_file_content(
         self,
         path: Path,
-        file_content: Union[bytes, BytesIO],
+        file_content: Union[bytes, BytesIO, Iterable[bytes]],
         multi_part_upload: bool = None,
         max_mb_per_part: float = 200,
         max_workers: int = 1,
+        compression: str = None,
         **kwargs,
     ):
         """
         :param path: file name in root or path to file
-        :param file_content: file_content as bytes or BytesIO
+        :param file_content: file_content as bytes, BytesIO or iterable of bytes chunks
         :param multi_part_upload: boolean use multipart upload or not (only available from TM1 12 onwards)
         By default, multi_part_upload is used for TM1 v12 and not used for TM1 v11
         :param max_mb_per_part: max megabyte per part in multipart upload (only available from TM1 12 onwards)
         :param max_workers: max parallel workers for multipart upload (only available from TM1 12 onwards)
+        :param compression: 'gzip' or 'zstd'. Compress each request body and send it with Content-Encoding header
         """
 
         url = self._construct_content_url(path, exclude_path_end=False, extension="Content")
 
+        chunked = not isinstance(file_content, (bytes, BytesIO))
+        if chunked:
+            chunks = filter(None, file_content)
+            first_chunk = next(chunks, None)
+            if first_chunk is None:
+                chunked, file_content = False, b""
+            else:
+                file_content = itertools.chain([first_chunk], chunks)
+
         # empty files must be created without MPU
-        if self._file_content_is_empty(file_content):
+        if not chunked and self._file_content_is_empty(file_content):
             return self._upload_file_content_without_mpu(url, file_content, **kwargs)
 
         if multi_part_upload is None:
             multi_part_upload = self.version.startswith("12.")
 
         if multi_part_upload:
-            return self._upload_file_content_with_mpu(url, file_content, max_mb_per_part, max_workers, **kwargs)
+            return self._upload_file_content_with_mpu(
+                url, file_content, max_mb_per_part, max_workers, compression=compression, **kwargs
+            )
+
+        # without multipart upload the content is sent in one request
+        if compression:
+            chunks = file_content if chunked else [self._read_bytes(file_content)]
+            return self._upload_file_content_without_mpu(
+                url, b"".join(self._compress_chunks(chunks, compression)), compression=compression, **kwargs
+            )
+
+        if chunked:
+            file_content = b"".join(file_content)
 
         return self._upload_file_content_without_mpu(url, file_content, **kwargs)
 
-    def _upload_file_content_without_mpu(self, url, file_content, **kwargs):
-        return self._rest.PUT(url=url, data=file_content, headers=self.binary_http_header, **kwargs)
+    def _upload_file_content_without_mpu(self, url, file_content, compression: str = None, **kwargs):
+        return self._rest.PUT(
+            url=url, data=file_content, headers=self._upload_http_header(compression=compression), **kwargs
+        )
 
     def _upload_file_content_with_mpu(
         self,
         content_url: str,
-        file_content: Union[bytes, BytesIO],
+        file_content: Union[bytes, BytesIO, Iterable[bytes]],
         max_mb_per_part: float,
         max_workers: int = 1,
+        compression: str = None,
         **kwargs,
     ):
 
@@ -174,19 +391,29 @@ class FileService(ObjectService):
         )
         upload_id = response.json()["UploadID"]
 
-        # Split the file content into parts
-        parts_to_upload = self._split_into_parts(data=file_content, max_chunk_size=int(max_mb_per_part * 1024 * 1024))
+        # Split the file content into parts. Chunked content is split lazily while it is uploaded
+        max_chunk_size = int(max_mb_per_part * 1024 * 1024)
+        if isinstance(file_content, (bytes, BytesIO)):
+            parts_to_upload = self._split_into_parts(data=file_content, max_chunk_size=max_chunk_size)
+        else:
+            parts_to_upload = self._join_into_parts(chunks=file_content, max_chunk_size=max_chunk_size)
 
         part_numbers_and_etags = []
 
         # helper function for uploading each part
         def upload_part_with_retry(index: int, data: bytes, retries: int = 3) -> Tuple[int, int, str]:
+            if compression:
+                data = b"".join(self._compress_chunks([data], compression))
+
             for attempt in range(retries):
                 try:
                     part_response = self._rest.POST(
                         url=content_url + f"/!uploads('{upload_id}')/Parts",
                         data=data,
-                        headers={**self.binary_http_header, "Accept": "application/json,text/plain"},
+                        headers={
+                            **self._upload_http_header(compression=compression),
+                            "Accept": "application/json,text/plain",
+                        },
                         async_requests_mode=False,
                         **kwargs,
                     )
@@ -198,12 +425,14 @@ class FileService(ObjectService):
                         raise e from None
 
         if max_workers > 1:
-            # upload parts concurrently
+            # upload parts concurrently. At most max_workers parts are held in memory at a time
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-
-                futures = {
-                    executor.submit(upload_part_with_retry, i, part, 3): i for i, part in enumerate(parts_to_upload)
-                }
+                futures = set()
+                for i, part in enumerate(parts_to_upload):
+                    if len(futures) >= max_workers:
+                        done, futures = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                        part_numbers_and_etags.extend(future.result() for future in done)
+                    futures.add(executor.submit(upload_part_with_retry, i, part, 3))
 
                 for future in concurrent.futures.as_completed(futures):
                     part_index, part_number, odata_etag = future.result()
@@ -232,10 +461,11 @@ class FileService(ObjectService):
     def create(
         self,
         file_name: Union[str, Path],
-        file_content: Union[bytes, BytesIO],
+        file_content: Union[bytes, BytesIO, Iterable[bytes]],
         multi_part_upload: bool = None,
         max_mb_per_part: float = 200,
         max_workers: int = 1,
+        compression: str = None,
         **kwargs,
     ):
         """Create file
@@ -243,16 +473,21 @@ class FileService(ObjectService):
         Folders in file_name (e.g. folderA/folderB/file.csv) will be created implicitly
 
         :param file_name: file name in root or path to file
-        :param file_content: file_content as bytes or BytesIO
+        :param file_content: file_content as bytes, BytesIO or iterable of bytes chunks (e.g. a generator).
+        Chunks are uploaded part by part with multipart upload, so the file is never held in memory at once
         :param multi_part_upload: boolean use multipart upload or not (only available from TM1 12 onwards)
         By default, multi_part_upload is used for TM1 v12 and not used for TM1 v11
         :param max_mb_per_part: max megabyte per part in multipart upload (only available from TM1 12 onwards)
         :param max_workers: max parallel workers for multipart upload (only available from TM1 12 onwards)
+        :param compression: 'gzip' or 'zstd'. Upload compressed with Content-Encoding header.
+        Requires a server that accepts compressed request bodies
         """
         path = Path(file_name)
         self._check_subfolder_support(path=path, function="FileService.create")
         if multi_part_upload:
             self._check_mpu_support(function="FileService.create")
+        if compression:
+            self._check_compression(compression)
 
         # Create folder structure iteratively
         if path.parents:
@@ -265,57 +500,75 @@ class FileService(ObjectService):
         body = {"@odata.type": "#ibm.tm1.api.v1.Document", "ID": path.name, "Name": path.name}
         self._rest.POST(url, json.dumps(body), **kwargs)
 
-        return self._upload_file_content(path, file_content, multi_part_upload, max_mb_per_part, max_workers, **kwargs)
+        return self._upload_file_content(
+            path, file_content, multi_part_upload, max_mb_per_part, max_workers, compression, **kwargs
+        )
 
     @require_version(version="11.4")
     def update(
         self,
         file_name: Union[str, Path],
-        file_content: Union[bytes, BytesIO],
+        file_content: Union[bytes, BytesIO, Iterable[bytes]],
         multi_part_upload: bool = None,
         max_mb_per_part: float = 200,
         max_workers: int = 1,
+        compression: str = None,
         **kwargs,
     ):
         """Update existing file
 
         :param file_name: file name in root or path to file
-        :param file_content: file_content as bytes or BytesIO
+        :param file_content: file_content as bytes, BytesIO or iterable of bytes chunks (e.g. a generator).
+        Chunks are uploaded part by part with multipart upload, so the file is never held in memory at once
         :param multi_part_upload: boolean use multipart upload or not (only available from TM1 12 onwards)
         By default, multi_part_upload is used for TM1 v12 and not used for TM1 v11
         :param max_mb_per_part: max megabyte per part in multipart upload (only available from TM1 12 onwards)
         :param max_workers: max parallel workers for multipart upload (only available from TM1 12 onwards)
+        :param compression: 'gzip' or 'zstd'. Upload compressed with Content-Encoding header.
+        Requires a server that accepts compressed request bodies
         """
         path = Path(file_name)
         self._check_subfolder_support(path=path, function="FileService.update")
         if multi_part_upload:
             self._check_mpu_support(function="FileService.create")
+        if compression:
+            self._check_compression(compression)
 
-        return self._upload_file_content(path, file_content, multi_part_upload, max_mb_per_part, max_workers, **kwargs)
+        return self._upload_file_content(
+            path, file_content, multi_part_upload, max_mb_per_part, max_workers, compression, **kwargs
+        )
 
     @require_version(version="11.4")
     def update_or_create(
         self,
         file_name: Union[str, Path],
-        file_content: bytes,
+        file_content: Union[bytes, BytesIO, Iterable[bytes]],
         multi_part_upload: bool = None,
         max_mb_per_part: float = 200,
         max_workers: int = 1,
+        compression: str = None,
         **kwargs,
     ):
         """Create file or update file if it already exists
 
         :param file_name: file name in root or path to file
-        :param file_content: file_content as bytes or BytesIO
+        :param file_content: file_content as bytes, BytesIO or iterable of bytes chunks (e.g. a generator).
+        Chunks are uploaded part by part with multipart upload, so the file is never held in memory at once
         :param multi_part_upload: boolean use multipart upload or not (only available from TM1 12 onwards).
         By default, multi_part_upload is used for TM1 v12 and not used for TM1 v11
         :param max_mb_per_part: max megabyte per part in multipart upload (only available from TM1 12 onwards)
         :param max_workers: max parallel workers for multipart upload (only available from TM1 12 onwards)
+        :param compression: 'gzip' or 'zstd'. Upload compressed with Content-Encoding header.
+        Requires a server that accepts compressed request bodies
         """
         if self.exists(file_name, **kwargs):
-            return self.update(file_name, file_content, multi_part_upload, max_mb_per_part, max_workers, **kwargs)
+            return self.update(
+                file_name, file_content, multi_part_upload, max_mb_per_part, max_workers, compression, **kwargs
+            )
 
-        return self.create(file_name, file_content, multi_part_upload, max_mb_per_part, max_workers, **kwargs)
+        return self.create(
+            file_name, file_content, multi_part_upload, max_mb_per_part, max_workers, compression, **kwargs
+        )
 
     @require_version(version="11.4")
     def exists(self, file_name: Union[str, Path], **kwargs):
@@ -407,6 +660,20 @@ class FileService(ObjectService):
 
         return parts
 
+    @staticmethod
+    def _join_into_parts(chunks: Iterable[bytes], max_chunk_size: int = 200 * 1024 * 1024) -> Iterator[bytes]:
+        part = bytearray()
+        for chunk in chunks:
+            part += chunk
+            while len(part) >= max_chunk_size:
+                with memoryview(part) as view:
+                    next_part = bytes(view[:max_chunk_size])
+                del part[:max_chunk_size]
+                yield next_part
+
+        if part:
+            yield bytes(part)
+
     @staticmethod
     def _file_content_is_empty(file_content: Union[bytes, BytesIO]):
         if isinstance(file_content, bytes):
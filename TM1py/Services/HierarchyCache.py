@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+from TM1py.Objects import Element, Hierarchy
+from TM1py.Services.RestService import RestService
+from TM1py.Utils import CaseAndSpaceInsensitiveDict, format_url, lower_and_drop_spaces
+
+
+class _HierarchyCacheEntry:
+    def __init__(self, hierarchy: Hierarchy, fingerprint: Tuple, fetched_at: float):
+        self.hierarchy = hierarchy
+        self.fingerprint = fingerprint
+        self.fetched_at = fetched_at
+        self.checked_at = fetched_at
+
+
+class HierarchyCache:
+    """In-memory copy of hierarchies (elements, edges, attributes and levels) to answer
+    element and traversal queries without a round trip to TM1
+
+    An entry is served from memory for `ttl` seconds. After that the cache asks TM1 for the number of
+    elements, edges and element attributes of the hierarchy (a single lightweight request).
+    If these counts are unchanged the entry is kept for another `ttl` seconds, otherwise the hierarchy is refetched.
+    Changes that don't alter any of these counts (e.g. a moved or renamed element or a changed weight) are
+    picked up once the entry is older than `max_age` seconds, when it is refetched regardless of the counts,
+    or through `invalidate`. Updates done through the services the cache is enabled on invalidate it.
+
+    Hierarchies returned by the cache are shared. Don't modify them.
+
+        tm1.elements.enable_cache(ttl=600)
+        tm1.elements.element_is_ancestor("Region", "Region", "World", "Germany")
+    """
+
+    def __init__(self, rest: RestService, ttl: float = 300, max_age: float = 3600):
+        """
+
+        :param rest: instance of RestService
+        :param ttl: seconds an entry is served from memory before it is checked for changes
+        :param max_age: seconds after which an entry is fetched again, even if its counts are unchanged
+        """
+        self._rest = rest
+        self.ttl = ttl
+        self.max_age = max_age
+        self._entries: Dict[Tuple[str, str], _HierarchyCacheEntry] = dict()
+        # incremented on every invalidation
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item: Tuple[str, str]) -> bool:
+        dimension_name, hierarchy_name = item
+        return self._key(dimension_name, hierarchy_name) in self._entries
+
+    def get(self, dimension_name: str, hierarchy_name: str) -> Hierarchy:
+        """Get the cached hierarchy. Fetches it from TM1 if it is not cached or has changed
+
+        :param dimension_name: name of the dimension
+        :param hierarchy_name: name of the hierarchy
+        :return: instance of TM1py.Hierarchy
+        """
+        key = self._key(dimension_name, hierarchy_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry and now - entry.checked_at < self.ttl:
+                return entry.hierarchy
+            if entry and now - entry.fetched_at >= self.max_age:
+                entry = None
+            generation = self._generation
+
+        # requests run without holding the lock, so that hits for other hierarchies aren't blocked.
+        # Concurrent misses for the same hierarchy may fetch twice
+        fingerprint = self._get_fingerprint(dimension_name, hierarchy_name)
+        if entry and entry.fingerprint == fingerprint:
+            with self._lock:
+                entry.checked_at = now
+            return entry.hierarchy
+
+        hierarchy = self._get_hierarchy(dimension_name, hierarchy_name)
+        with self._lock:
+            # don't store hierarchies fetched before an invalidation
+            if generation == self._generation:
+                self._entries[key] = _HierarchyCacheEntry(hierarchy, fingerprint, now)
+        return hierarchy
+
+    def invalidate(self, dimension_name: str = None, hierarchy_name: str = None):
+        """Drop cached hierarchies
+
+        :param dimension_name: drop only hierarchies of this dimension. All hierarchies if None
+        :param hierarchy_name: drop only this hierarchy. All hierarchies of the dimension if None
+        :return:
+        """
+        with self._lock:
+            self._generation += 1
+            if dimension_name is None:
+                self._entries.clear()
+                return
+
+            dimension_key = lower_and_drop_spaces(dimension_name)
+            hierarchy_key = lower_and_drop_spaces(hierarchy_name) if hierarchy_name else None
+            for key in list(self._entries):
+                if key[0] == dimension_key and hierarchy_key in (None, key[1]):
+                    del self._entries[key]
+
+    def get_element_names(self, dimension_name: str, hierarchy_name: str) -> List[str]:
+        return [element.name for element in self.get(dimension_name, hierarchy_name)]
+
+    def get_elements(self, dimension_name: str, hierarchy_name: str) -> List[Element]:
+        return list(self.get(dimension_name, hierarchy_name))
+
+    def get_element_names_by_type(
+        self, dimension_name: str, hierarchy_name: str, element_type: Element.Types, negate: bool = False
+    ) -> List[str]:
+        return [
+            element.name
+            for element in self.get(dimension_name, hierarchy_name)
+            if (element.element_type == element_type) != negate
+        ]
+
+    def get_leaf_element_names(self, dimension_name: str, hierarchy_name: str) -> List[str]:
+        """numeric and string elements, in line with `ElementService.get_leaf_element_names`"""
+        return self.get_element_names_by_type(dimension_name, hierarchy_name, Element.Types.CONSOLIDATED, negate=True)
+
+    def get_elements_by_level(self, dimension_name: str, hierarchy_name: str, level: int) -> List[str]:
+        hierarchy = self.get(dimension_name, hierarchy_name)
+        return [element.name for element in hierarchy if hierarchy.get_level(element.name) == level]
+
+    def get_edges(self, dimension_name: str, hierarchy_name: str) -> Dict[Tuple[str, str], float]:
+        return dict(self.get(dimension_name, hierarchy_name).edges.items())
+
+    def get_parents(self, dimension_name: str, hierarchy_name: str, element_name: str) -> List[str]:
+        hierarchy = self.get(dimension_name, hierarchy_name)
+        hierarchy.get_element(element_name)
+        return [parent for (parent, _) in hierarchy.get_ancestor_edges(element_name)]
+
+    def get_parents_of_all_elements(self, dimension_name: str, hierarchy_name: str) -> Dict[str, List[str]]:
+        hierarchy = self.get(dimension_name, hierarchy_name)
+        parents = {element.name: [] for element in hierarchy}
+        names = {lower_and_drop_spaces(name): name for name in parents}
+        for parent, component in hierarchy.edges:
+            parents[names[lower_and_drop_spaces(component)]].append(parent)
+        return parents
+
+    def get_attribute_of_elements(
+        self, dimension_name: str, hierarchy_name: str, attribute: str, elements: List[str] = None
+    ) -> Dict[str, Optional[Union[str, float]]]:
+        """Attribute values as of the last fetch of the hierarchy.
+        Attribute values are cube data: writing them doesn't change the fingerprint of the hierarchy
+
+        :param dimension_name: name of the dimension
+        :param hierarchy_name: name of the hierarchy
+        :param attribute: name of the attribute
+        :param elements: element names. All elements if None
+        :return: Dict {'01':'Jan', '02':'Feb'}
+        """
+        hierarchy = self.get(dimension_name, hierarchy_name)
+        if elements is None:
+            elements = [element.name for element in hierarchy]
+
+        values = dict()
+        for element_name in elements:
+            attributes = CaseAndSpaceInsensitiveDict(hierarchy.get_element(element_name).element_attributes or {})
+            values[element_name] = attributes.get(attribute)
+        return values
+
+    def element_is_parent(self, dimension_name: str, hierarchy_name: str, parent_name: str, element_name: str) -> bool:
+        hierarchy = self.get(dimension_name, hierarchy_name)
+        return (parent_name, element_name) in hierarchy.edges
+
+    def element_is_ancestor(
+        self, dimension_name: str, hierarchy_name: str, ancestor_name: str, element_name: str
+    ) -> bool:
+        hierarchy = self.get(dimension_name, hierarchy_name)
+        if not hierarchy.contains_element(element_name) or not hierarchy.contains_element(ancestor_name):
+            return False
+
+        ancestor_key = lower_and_drop_spaces(ancestor_name)
+        return any(
+            lower_and_drop_spaces(parent) == ancestor_key
+            for (parent, _) in hierarchy.get_ancestor_edges(element_name, recursive=True)
+        )
+
+    def _get_fingerprint(self, dimension_name: str, hierarchy_name: str) -> Tuple:
+        url = format_url(
+            "/Dimensions('{}')/Hierarchies('{}')?$select=Name"
+            "&$expand=Elements/$count,Edges/$count,ElementAttributes/$count",
+            dimension_name,
+            hierarchy_name,
+        )
+        response = self._rest.GET(url)
+        summary = response.json()
+        return tuple(summary[key + "@odata.count"] for key in ("Elements", "Edges", "ElementAttributes"))
+
+    def _get_hierarchy(self, dimension_name: str, hierarchy_name: str) -> Hierarchy:
+        url = format_url(
+            "/Dimensions('{}')/Hierarchies('{}')?$select=Name"
+            "&$expand=Edges($select=ParentName,ComponentName,Weight),"
+            "Elements($select=Name,Type,Attributes),"
+            "ElementAttributes",
+            dimension_name,
+            hierarchy_name,
+        )
+        response = self._rest.GET(url)
+        return Hierarchy.from_dict(response.json(), dimension_name=dimension_name)
+
+    @staticmethod
+    def _key(dimension_name: str, hierarchy_name: str) -> Tuple[str, str]:
+        return lower_and_drop_spaces(dimension_name), lower_and_drop_spaces(hierarchy_name)
@@ -8,7 +8,7 @@ except ImportError:
 
 import json
 import math
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 try:
     import networkx as nx
@@ -22,6 +22,7 @@ from requests import Response
 from TM1py.Exceptions import TM1pyRestException
 from TM1py.Objects import Dimension, Element, ElementAttribute, Hierarchy, Process
 from TM1py.Services.ElementService import ElementService
+from TM1py.Services.HierarchyCache import HierarchyCache
 from TM1py.Services.ObjectService import ObjectService
 from TM1py.Services.RestService import RestService
 from TM1py.Services.SubsetService import SubsetService
@@ -60,6 +61,28 @@ class HierarchyService(ObjectService):
         self.subsets = SubsetService(rest)
         self.elements = ElementService(rest)
 
+    @property
+    def cache(self) -> Optional[HierarchyCache]:
+        return self.elements.cache
+
+    def enable_cache(self, cache: HierarchyCache = None, ttl: float = 300) -> HierarchyCache:
+        """Enable the `HierarchyCache` on the element service of this service.
+        Hierarchy updates done through this service invalidate the cache
+
+        :param cache: existing HierarchyCache to share between services. A new one is created if None
+        :param ttl: seconds a cached hierarchy is served before it is checked for changes. Ignored if cache is passed
+        :return: the HierarchyCache in use
+        """
+        return self.elements.enable_cache(cache=cache, ttl=ttl)
+
+    def disable_cache(self):
+        self.elements.disable_cache()
+
+    def _invalidate_cache(self, dimension_name: str, hierarchy_name: str = None):
+        self._rest.metadata_cache.invalidate_dimension(dimension_name)
+        if self.cache is not None:
+            self.cache.invalidate(dimension_name, hierarchy_name)
+
     @staticmethod
     @require_networkx
     def _validate_edges(df: "pd.DataFrame"):
@@ -108,6 +131,7 @@ class HierarchyService(ObjectService):
         :param hierarchy:
         :return:
         """
+        self._invalidate_cache(hierarchy.dimension_name, hierarchy.name)
         url = format_url("/Dimensions('{}')/Hierarchies", hierarchy.dimension_name)
         response = self._rest.POST(url, hierarchy.body, **kwargs)
 
@@ -152,6 +176,7 @@ class HierarchyService(ObjectService):
         :param keep_existing_attributes: True to make sure existing attributes are not removed
         :return: list of responses
         """
+        self._invalidate_cache(hierarchy.dimension_name, hierarchy.name)
         # functions returns multiple responses
         responses = list()
         # 1. Update Hierarchy
@@ -194,6 +219,413 @@ class HierarchyService(ObjectService):
         else:
             self.create(hierarchy=hierarchy, **kwargs)
 
+    def write_in_batches(
+        self,
+        hierarchy: Hierarchy,
+        batch_size: int = 50_000,
+        use_blob: bool = False,
+        write_attribute_values: bool = True,
+        progress_callback: Callable[[str, int, int], None] = None,
+        **kwargs,
+    ) -> Dict[str, int]:
+        """Write a large hierarchy in batches instead of one request with all elements and edges
+
+        Creates the hierarchy and missing element attributes, then adds the elements and edges that don't exist
+        in TM1 yet and writes the attribute values of the elements. Every request carries at most `batch_size`
+        elements, edges or attribute values.
+        Existing elements and edges are left untouched and nothing is deleted. Use `update` to replace a hierarchy.
+
+        If the function fails it can be called again with the same hierarchy. It resumes
+        with the elements and edges that were not added in the previous run.
+
+        :param hierarchy: instance of TM1py.Hierarchy
+        :param batch_size: max number of elements, edges or attribute values per request
+        :param use_blob: add elements and edges and write attribute values through unbound TI processes
+            with uploaded CSV files as data source. Requires admin permissions
+        :param write_attribute_values: write the attribute values of the elements
+        :param progress_callback: function called after each batch with the stage ('elements', 'edges' or
+            'attribute_values'), the number of processed and the total number of items in the stage.
+            Attribute values are counted in elements
+        :return: number of added elements, added edges and written attribute values
+        """
+        if batch_size < 1:
+            raise ValueError("argument 'batch_size' must be a positive integer")
+
+        dimension_name, hierarchy_name = hierarchy.dimension_name, hierarchy.name
+
+        if self.exists(dimension_name, hierarchy_name, **kwargs):
+            self.update_element_attributes(hierarchy, keep_existing_attributes=True, **kwargs)
+        else:
+            self.create(
+                Hierarchy(hierarchy_name, dimension_name, element_attributes=hierarchy.element_attributes), **kwargs
+            )
+
+        existing_elements = CaseAndSpaceInsensitiveSet(
+            self.elements.get_element_names(dimension_name, hierarchy_name, **kwargs)
+        )
+        elements = [element for element in hierarchy if element.name not in existing_elements]
+
+        def add_elements(batch: List[Element]):
+            self.elements.add_elements(dimension_name, hierarchy_name, batch, use_blob=use_blob, **kwargs)
+
+        self._write_in_batches(elements, batch_size, add_elements, "elements", progress_callback)
+
+        existing_edges = CaseAndSpaceInsensitiveTuplesDict(
+            self.elements.get_edges(dimension_name, hierarchy_name, **kwargs)
+        )
+        edges = [(edge, weight) for edge, weight in hierarchy.edges.items() if edge not in existing_edges]
+
+        def add_edges(batch: List[Tuple[Tuple[str, str], float]]):
+            self.elements.add_edges(dimension_name, hierarchy_name, dict(batch), use_blob=use_blob, **kwargs)
+
+        self._write_in_batches(edges, batch_size, add_edges, "edges", progress_callback)
+
+        attribute_values = 0
+        if write_attribute_values and hierarchy.element_attributes:
+
+            def write_values(batch: List[Element]):
+                nonlocal attribute_values
+                cells = CaseAndSpaceInsensitiveTuplesDict()
+                for element in batch:
+                    for attribute, value in (element.element_attributes or {}).items():
+                        if value is not None:
+                            cells[element.name, attribute] = value
+                if cells:
+                    self._write_attribute_values(dimension_name, hierarchy_name, cells, use_blob, **kwargs)
+                    attribute_values += len(cells)
+
+            elements_per_batch = max(1, batch_size // len(hierarchy.element_attributes))
+            self._write_in_batches(
+                list(hierarchy), elements_per_batch, write_values, "attribute_values", progress_callback
+            )
+
+        return {"elements": len(elements), "edges": len(edges), "attribute_values": attribute_values}
+
+    def sync(
+        self,
+        hierarchy: Union[Hierarchy, "pd.DataFrame"],
+        dimension_name: str = None,
+        hierarchy_name: str = None,
+        element_column: str = None,
+        element_type_column: str = "ElementType",
+        delete_elements: bool = True,
+        delete_edges: bool = True,
+        dry_run: bool = False,
+        batch_size: int = 50_000,
+        use_blob: bool = False,
+        use_ti: bool = False,
+        **kwargs,
+    ) -> Dict:
+        """Bring a hierarchy in TM1 to the desired state by applying only the differences
+
+        Retrieves elements, edges, weights, element attributes and attribute values of the hierarchy in one request,
+        compares them with the desired state and applies the changes in batches:
+        element attributes are created (or recreated on type changes), obsolete edges and elements are deleted,
+        element types are updated, new elements and edges are added and differing attribute values are written.
+        Attribute values are only compared for the attributes present on the desired elements.
+        Elements of TM1 that are not part of the desired state are deleted, unless `delete_elements` is False.
+        The dimension and the hierarchy are created if they don't exist.
+
+        :param hierarchy: desired state as instance of TM1py.Hierarchy or as data frame in the format
+            of `update_or_create_hierarchy_from_dataframe`
+        :param dimension_name: name of the dimension. Only required with a data frame
+        :param hierarchy_name: name of the hierarchy. Only required with a data frame. Defaults to dimension_name
+        :param element_column: column with the element names. Defaults to the first column. Only for data frames
+        :param element_type_column: column with the element types. All Numeric if missing. Only for data frames
+        :param delete_elements: delete elements that are not part of the desired state
+        :param delete_edges: delete edges that are not part of the desired state
+        :param dry_run: only compute and return the changes, don't apply them
+        :param batch_size: max number of elements, edges or attribute values per request.
+            Without use_blob or use_ti, each batch of edges or elements is deleted by updating the hierarchy
+            (one request per edge or element before TM1 11.4).
+            Element type changes are always applied with one request per element
+        :param use_blob: apply changes through unbound TI processes with uploaded CSV files as data source.
+            Requires admin permissions
+        :param use_ti: delete edges and elements in batches through unbound TI processes.
+            Requires admin permissions
+        :return: dictionary with the changes
+        """
+        if batch_size < 1:
+            raise ValueError("argument 'batch_size' must be a positive integer")
+
+        if not isinstance(hierarchy, Hierarchy):
+            hierarchy = self._hierarchy_from_dataframe(
+                dimension_name=dimension_name,
+                hierarchy_name=hierarchy_name or dimension_name,
+                df=hierarchy,
+                element_column=element_column,
+                element_type_column=element_type_column,
+            )
+        dimension_name, hierarchy_name = hierarchy.dimension_name, hierarchy.name
+
+        hierarchy_exists = self.exists(dimension_name, hierarchy_name, **kwargs)
+        if hierarchy_exists:
+            current = self._get_hierarchy_with_attribute_values(dimension_name, hierarchy_name, **kwargs)
+        else:
+            current = Hierarchy(hierarchy_name, dimension_name)
+
+        changes = self._compute_hierarchy_changes(current, hierarchy, delete_elements, delete_edges)
+        if dry_run:
+            return changes
+
+        if not hierarchy_exists:
+            empty_hierarchy = Hierarchy(hierarchy_name, dimension_name, element_attributes=hierarchy.element_attributes)
+            dimension_service = self.get_dimension_service()
+            if not dimension_service.exists(dimension_name, **kwargs):
+                dimension_service.create(Dimension(dimension_name, hierarchies=[empty_hierarchy]), **kwargs)
+            else:
+                self.create(empty_hierarchy, **kwargs)
+        elif changes["element_attributes_to_add"] or changes["element_attributes_to_update"]:
+            self.update_element_attributes(hierarchy, keep_existing_attributes=True, **kwargs)
+
+        edges_to_delete = changes["edges_to_delete"] + list(changes["edges_to_update"])
+        if use_blob:
+
+            def remove_edges(batch: List[Tuple[str, str]]):
+                self.elements.delete_edges(dimension_name, hierarchy_name, batch, use_blob=True, **kwargs)
+
+            def remove_elements(batch: List[str]):
+                self.elements.delete_elements(dimension_name, hierarchy_name, batch, use_ti=True, **kwargs)
+
+        elif use_ti:
+
+            def remove_edges(batch: List[Tuple[str, str]]):
+                self.elements.delete_edges(dimension_name, hierarchy_name, batch, use_ti=True, **kwargs)
+
+            def remove_elements(batch: List[str]):
+                self.elements.delete_elements(dimension_name, hierarchy_name, batch, use_ti=True, **kwargs)
+
+        elif verify_version(required_version="11.4", version=self.version):
+
+            def remove_edges(batch: List[Tuple[str, str]]):
+                self.elements.delete_edges(dimension_name, hierarchy_name, batch, **kwargs)
+
+            def remove_elements(batch: List[str]):
+                self.elements.delete_elements(dimension_name, hierarchy_name, batch, **kwargs)
+
+        else:
+
+            def remove_edges(batch: List[Tuple[str, str]]):
+                for parent, component in batch:
+                    self.elements.remove_edge(dimension_name, hierarchy_name, parent, component, **kwargs)
+
+            def remove_elements(batch: List[str]):
+                for element_name in batch:
+                    self.elements.delete(dimension_name, hierarchy_name, element_name, **kwargs)
+
+        self._write_in_batches(edges_to_delete, batch_size, remove_edges, "edges_to_delete")
+        self._write_in_batches(changes["elements_to_delete"], batch_size, remove_elements, "elements_to_delete")
+
+        for element_name in changes["elements_to_update"]:
+            element = hierarchy.get_element(element_name)
+            self.elements.update(dimension_name, hierarchy_name, Element(element.name, element.element_type), **kwargs)
+
+        def add_elements(batch: List[str]):
+            elements = [hierarchy.get_element(element_name) for element_name in batch]
+            self.elements.add_elements(dimension_name, hierarchy_name, elements, use_blob=use_blob, **kwargs)
+
+        def add_edges(batch: List[Tuple[Tuple[str, str], float]]):
+            self.elements.add_edges(dimension_name, hierarchy_name, dict(batch), use_blob=use_blob, **kwargs)
+
+        def write_values(batch: List[Tuple[Tuple[str, str], Union[str, float]]]):
+            cells = CaseAndSpaceInsensitiveTuplesDict(dict(batch))
+            self._write_attribute_values(dimension_name, hierarchy_name, cells, use_blob, **kwargs)
+
+        edges_to_add = list(changes["edges_to_add"].items()) + list(changes["edges_to_update"].items())
+        self._write_in_batches(changes["elements_to_add"], batch_size, add_elements, "elements_to_add")
+        self._write_in_batches(edges_to_add, batch_size, add_edges, "edges_to_add")
+        attribute_values = list(changes["attribute_values_to_update"].items())
+        self._write_in_batches(attribute_values, batch_size, write_values, "attribute_values_to_update")
+
+        return changes
+
+    @staticmethod
+    def _compute_hierarchy_changes(
+        current: Hierarchy, desired: Hierarchy, delete_elements: bool = True, delete_edges: bool = True
+    ) -> Dict:
+        current_attributes = CaseAndSpaceInsensitiveDict({ea.name: ea for ea in current.element_attributes})
+        element_attributes_to_add = []
+        element_attributes_to_update = []
+        for element_attribute in desired.element_attributes:
+            if element_attribute.name not in current_attributes:
+                element_attributes_to_add.append(element_attribute.name)
+            elif current_attributes[element_attribute.name].attribute_type != element_attribute.attribute_type:
+                element_attributes_to_update.append(element_attribute.name)
+
+        recreated_attributes = CaseAndSpaceInsensitiveSet(element_attributes_to_update)
+
+        elements_to_add = []
+        elements_to_update = []
+        attribute_values_to_update = CaseAndSpaceInsensitiveTuplesDict()
+        for element in desired:
+            if not current.contains_element(element.name):
+                elements_to_add.append(element.name)
+                current_element = None
+            else:
+                current_element = current.get_element(element.name)
+                if current_element.element_type != element.element_type:
+                    elements_to_update.append(element.name)
+
+            current_values = CaseAndSpaceInsensitiveDict(
+                current_element.element_attributes if current_element and current_element.element_attributes else {}
+            )
+            for attribute, value in (element.element_attributes or {}).items():
+                if value is None:
+                    continue
+                # values of recreated attributes are lost and must be written
+                if attribute not in recreated_attributes:
+                    current_value = current_values.get(attribute)
+                    if isinstance(value, str) and value == (current_value or ""):
+                        continue
+                    if not isinstance(value, str) and value == (current_value or 0):
+                        continue
+                attribute_values_to_update[element.name, attribute] = value
+
+        elements_to_delete = []
+        if delete_elements:
+            elements_to_delete = [element.name for element in current if not desired.contains_element(element.name)]
+        deleted_elements = CaseAndSpaceInsensitiveSet(elements_to_delete)
+
+        edges_to_add = dict()
+        edges_to_update = dict()
+        for edge, weight in desired.edges.items():
+            if edge not in current.edges:
+                edges_to_add[edge] = weight
+            elif current.edges[edge] != weight:
+                edges_to_update[edge] = weight
+
+        edges_to_delete = []
+        if delete_edges:
+            # edges of deleted elements are removed with the elements
+            edges_to_delete = [
+                (parent, component)
+                for parent, component in current.edges
+                if (parent, component) not in desired.edges
+                and parent not in deleted_elements
+                and component not in deleted_elements
+            ]
+
+        return {
+            "element_attributes_to_add": element_attributes_to_add,
+            "element_attributes_to_update": element_attributes_to_update,
+            "elements_to_add": elements_to_add,
+            "elements_to_update": elements_to_update,
+            "elements_to_delete": elements_to_delete,
+            "edges_to_add": edges_to_add,
+            "edges_to_update": edges_to_update,
+            "edges_to_delete": edges_to_delete,
+            "attribute_values_to_update": attribute_values_to_update,
+        }
+
+    def _get_hierarchy_with_attribute_values(self, dimension_name: str, hierarchy_name: str, **kwargs) -> Hierarchy:
+        url = format_url(
+            "/Dimensions('{}')/Hierarchies('{}')?$select=Name"
+            "&$expand=Edges($select=ParentName,ComponentName,Weight),"
+            "Elements($select=Name,Type,Attributes),"
+            "ElementAttributes",
+            dimension_name,
+            hierarchy_name,
+        )
+        response = self._rest.GET(url, **kwargs)
+        return Hierarchy.from_dict(response.json(), dimension_name=dimension_name)
+
+    @require_pandas
+    def _hierarchy_from_dataframe(
+        self,
+        dimension_name: str,
+        hierarchy_name: str,
+        df: "pd.DataFrame",
+        element_column: str = None,
+        element_type_column: str = "ElementType",
+    ) -> Hierarchy:
+        """build a Hierarchy from a data frame in the format of `update_or_create_hierarchy_from_dataframe`"""
+        element_column = df.columns[0] if not element_column else element_column
+        level_columns, level_weight_columns = self._identify_level_columns(df)
+        if level_weight_columns and not len(level_columns) == len(level_weight_columns):
+            raise ValueError("Number of level columns must be equal to number of level weight columns")
+
+        attribute_columns = df.columns.drop(
+            labels=[element_column] + [element_type_column] + level_columns + level_weight_columns, errors="ignore"
+        )
+        element_attributes = []
+        for attribute_column in attribute_columns:
+            if ":" in attribute_column:
+                attribute_name, attribute_type = attribute_column.rsplit(":", maxsplit=1)
+                attribute_type = self._attribute_type_from_code(attribute_type)
+            else:
+                attribute_name, attribute_type = attribute_column, ElementAttribute.Types.STRING
+            element_attributes.append(ElementAttribute(attribute_name, attribute_type))
+
+        elements = CaseAndSpaceInsensitiveDict()
+        edges = CaseAndSpaceInsensitiveTuplesDict()
+        for record in df.to_dict(orient="records"):
+            element_name = str(record[element_column])
+            attributes = dict()
+            for attribute_column, element_attribute in zip(attribute_columns, element_attributes):
+                value = record[attribute_column]
+                if value is None or (not isinstance(value, str) and math.isnan(value)):
+                    continue
+                if ElementAttribute.Types(element_attribute.attribute_type) == ElementAttribute.Types.NUMERIC:
+                    attributes[element_attribute.name] = float(value)
+                else:
+                    attributes[element_attribute.name] = str(value)
+            element_type = record.get(element_type_column, "Numeric")
+            elements[element_name] = Element(element_name, element_type, attributes=attributes)
+
+            previous_level = element_name
+            for position, level_column in enumerate(level_columns):
+                level = record[level_column]
+                if not level:
+                    continue
+                if not isinstance(level, str) and math.isnan(level):
+                    continue
+                if level == previous_level:
+                    continue
+                weight = record[level_weight_columns[position]] if level_weight_columns else 1
+                edges[level, previous_level] = weight
+                previous_level = level
+
+        for parent, _ in edges:
+            if parent not in elements:
+                elements[parent] = Element(parent, Element.Types.CONSOLIDATED)
+            elif elements[parent].element_type != Element.Types.CONSOLIDATED:
+                raise ValueError(f"Inconsistent Type for element: '{parent}' in hierarchy '{hierarchy_name}'")
+
+        return Hierarchy(
+            name=hierarchy_name,
+            dimension_name=dimension_name,
+            elements=elements.values(),
+            element_attributes=element_attributes,
+            edges=edges,
+        )
+
+    def _write_attribute_values(
+        self,
+        dimension_name: str,
+        hierarchy_name: str,
+        cells: CaseAndSpaceInsensitiveTuplesDict,
+        use_blob: bool = False,
+        **kwargs,
+    ):
+        """write {(element, attribute): value} to the element attributes cube of the dimension"""
+        cube_name = "}ElementAttributes_" + dimension_name
+        # explicitly reference hierarchy if dimension_name != hierarchy_name
+        if not case_and_space_insensitive_equals(dimension_name, hierarchy_name):
+            cells = CaseAndSpaceInsensitiveTuplesDict(
+                {(hierarchy_name + ":" + element, attribute): value for (element, attribute), value in cells.items()}
+            )
+        cell_service = self.get_cell_service()
+        cell_service.write(cube_name, cells, dimensions=[dimension_name, cube_name], use_blob=use_blob, **kwargs)
+
+    @staticmethod
+    def _write_in_batches(
+        items: List, batch_size: int, write: Callable, stage: str, progress_callback: Callable = None
+    ):
+        for start in range(0, len(items), batch_size):
+            write(items[start : start + batch_size])
+            if progress_callback:
+                progress_callback(stage, min(start + batch_size, len(items)), len(items))
+
     def exists(self, dimension_name: str, hierarchy_name: str, **kwargs) -> bool:
         """
 
@@ -214,6 +646,7 @@ class HierarchyService(ObjectService):
         return hierarchy_name in existing_hierarchies
 
     def delete(self, dimension_name: str, hierarchy_name: str, **kwargs) -> Response:
+        self._invalidate_cache(dimension_name, hierarchy_name)
         url = format_url("/Dimensions('{}')/Hierarchies('{}')", dimension_name, hierarchy_name)
         return self._rest.DELETE(url, **kwargs)
 
@@ -239,6 +672,7 @@ class HierarchyService(ObjectService):
         :param keep_existing_attributes: True to make sure existing attributes are not removed
         :return:
         """
+        self._invalidate_cache(hierarchy.dimension_name, hierarchy.name)
         # get existing attributes first
         existing_element_attributes = self.elements.get_element_attributes(
             dimension_name=hierarchy.dimension_name, hierarchy_name=hierarchy.name, **kwargs
@@ -369,6 +803,7 @@ class HierarchyService(ObjectService):
     def remove_all_edges(self, dimension_name: str, hierarchy_name: str = None, **kwargs) -> Response:
         if not hierarchy_name:
             hierarchy_name = dimension_name
+        self._invalidate_cache(dimension_name, hierarchy_name)
         url = format_url("/Dimensions('{}')/Hierarchies('{}')", dimension_name, hierarchy_name)
         body = {"Edges": []}
         return self._rest.PATCH(url=url, data=json.dumps(body), **kwargs)
@@ -512,6 +947,7 @@ class HierarchyService(ObjectService):
         :return:
 
         """
+        self._invalidate_cache(dimension_name, hierarchy_name)
         if hierarchy_sort_order:
             self._validate_hierarchy_sort_order_arguments(hierarchy_sort_order)
 
@@ -547,21 +983,7 @@ class HierarchyService(ObjectService):
                     f"but received: '{unwind_consolidations}' of type {type(unwind_consolidations).__name__}"
                 )
 
-        # identify and sort level columns
-        level_columns = []
-        level_weight_columns = []
-        # sort to assure right order of levels (e.g. Level003 -> level002 -> LEVEL001)
-        sorted_level_columns = sorted(
-            [col for col in df.columns if any(char.isdigit() for char in col)],  # Filter columns with digits
-            key=lambda x: int("".join(filter(str.isdigit, x))),  # Sort based on numeric part
-            reverse=True,  # Descending order
-        )
-        for column in sorted_level_columns:
-            if column.lower().startswith("level") and column[5:8].isdigit():
-                if len(column) == 8:  # "LevelXXX"
-                    level_columns.append(column)
-                elif len(column) == 15 and column.lower().endswith("_weight"):  # "LevelXXX_weight"
-                    level_weight_columns.append(column)
+        level_columns, level_weight_columns = self._identify_level_columns(df)
 
         # case: no level weight columns. All weights are 1
         if len(level_weight_columns) == 0:
@@ -770,6 +1192,7 @@ class HierarchyService(ObjectService):
 
         if hierarchy_sort_order:
             self._implement_hierarchy_sort_order(dimension_name, hierarchy_name, hierarchy_sort_order)
+            self._invalidate_cache(dimension_name, hierarchy_name)
 
         if delete_orphaned_consolidations:
             all_edges = self.elements.get_edges(dimension_name=dimension_name, hierarchy_name=hierarchy_name)
@@ -793,6 +1216,25 @@ class HierarchyService(ObjectService):
                     use_ti=self.is_admin,
                 )
 
+    @staticmethod
+    def _identify_level_columns(df: "pd.DataFrame") -> Tuple[List[str], List[str]]:
+        """identify and sort level columns and level weight columns"""
+        level_columns = []
+        level_weight_columns = []
+        # sort to assure right order of levels (e.g. Level003 -> level002 -> LEVEL001)
+        sorted_level_columns = sorted(
+            [col for col in df.columns if any(char.isdigit() for char in col)],  # Filter columns with digits
+            key=lambda x: int("".join(filter(str.isdigit, x))),  # Sort based on numeric part
+            reverse=True,  # Descending order
+        )
+        for column in sorted_level_columns:
+            if column.lower().startswith("level") and column[5:8].isdigit():
+                if len(column) == 8:  # "LevelXXX"
+                    level_columns.append(column)
+                elif len(column) == 15 and column.lower().endswith("_weight"):  # "LevelXXX_weight"
+                    level_weight_columns.append(column)
+        return level_columns, level_weight_columns
+
     def get_dimension_service(self):
         from TM1py import DimensionService
 
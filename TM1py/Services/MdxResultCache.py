@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import pickle
+import re
+import stat
+import threading
+from collections import OrderedDict
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+
+
+class MdxResultCache:
+    """Read-through cache for the results of `CellService.execute_mdx*` and `CellService.execute_view*`
+
+    Results are keyed on the function, the normalised MDX (resp. cube and view name), the sandbox
+    and all other arguments. Before a result is served, the last data update of the cube is requested from TM1
+    (one lightweight request). The result is only served if the cube hasn't changed since the result was stored.
+
+    Changes that don't alter the last data update of the queried cube are not detected. E.g. rules that pull data
+    from other cubes, changed dimensions or changed view definitions. Use `invalidate` in these cases.
+
+    Results are kept in memory, or on disk if `path` is provided. Either way the least recently used results are
+    evicted once more than `max_entries` results are stored. Results are stored pickled, so every hit returns
+    a fresh copy. Since unpickling can execute code, the directory must be owned by the current user and must not
+    be writable by other users. Files that other users could have written are ignored.
+
+        tm1.cells.enable_result_cache(max_entries=256)
+        tm1.cells.execute_mdx_dataframe(mdx)  # executes the MDX
+        tm1.cells.execute_mdx_dataframe(mdx)  # served from the cache, if the cube is unchanged
+    """
+
+    # whitespace outside of quoted strings and square brackets is insignificant in MDX
+    _MDX_TOKENS = re.compile(r"(\"[^\"]*\"|'[^']*'|\[[^\]]*\])|\s*([{}(),])\s*|\s+")
+    # cross cube references in calculated members and sets, e.g. [Cube].([Dimension].[Element])
+    _CUBE_REFERENCE = re.compile(r"\[((?:[^\]]|\]\])+)\]\s*\.\s*\(")
+
+    def __init__(self, max_entries: int = 128, path: Union[str, Path] = None):
+        """
+
+        :param max_entries: max number of results to keep. Least recently used results are evicted
+        :param path: directory to store the results in. Results are kept in memory if None.
+        Created with permissions for the current user only, if it doesn't exist
+        """
+        if max_entries < 1:
+            raise ValueError("argument 'max_entries' must be a positive integer")
+
+        self.max_entries = max_entries
+        self.path = Path(path) if path else None
+        if self.path:
+            self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self._is_private(self.path.stat()):
+                raise PermissionError(
+                    f"Directory '{self.path}' must be owned by the current user and not be writable by other users"
+                )
+
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[Tuple, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        if self.path:
+            return len(list(self.path.glob("*.pkl")))
+        return len(self._entries)
+
+    @classmethod
+    def normalize_mdx(cls, mdx: str) -> str:
+        """collapse whitespace outside of quoted strings and square brackets"""
+        return cls._MDX_TOKENS.sub(lambda match: match.group(1) or match.group(2) or " ", mdx).strip()
+
+    @classmethod
+    def referenced_cubes(cls, mdx: str) -> List[str]:
+        """names of the cubes referenced in expressions of the MDX, e.g. in WITH MEMBER or WITH SET"""
+        names = (match.group(1).replace("]]", "]") for match in cls._CUBE_REFERENCE.finditer(mdx))
+        return list(dict.fromkeys(names))
+
+    @staticmethod
+    def build_key(*parts: Any) -> str:
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str, markers: Tuple) -> Tuple[bool, Any]:
+        """Get a stored result
+
+        :param key: as returned by `build_key`
+        :param markers: last data updates of the cubes involved. A result stored with other markers is discarded
+        :return: (True, result) if the result is stored and valid. (False, None) otherwise
+        """
+        with self._lock:
+            entry = self._read(key)
+            if entry is None or entry[0] != markers:
+                self.misses += 1
+                return False, None
+
+            self.hits += 1
+            return True, pickle.loads(entry[1])
+
+    def put(self, key: str, markers: Tuple, result: Any):
+        """Store a result
+
+        :param key: as returned by `build_key`
+        :param markers: last data updates of the cubes involved at the time the result was queried
+        :param result: the result
+        :return:
+        """
+        entry = (markers, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._write(key, entry)
+            self._evict()
+
+    def invalidate(self):
+        """Drop all stored results"""
+        with self._lock:
+            self._entries.clear()
+            if self.path:
+                for file in self.path.glob("*.pkl"):
+                    with suppress(FileNotFoundError):
+                        file.unlink()
+
+    def _read(self, key: str) -> Optional[Tuple[Tuple, bytes]]:
+        if not self.path:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+        file = self.path / f"{key}.pkl"
+        try:
+            with open(file, "rb") as f:
+                # never unpickle files that other users could have written
+                if not self._is_private(os.fstat(f.fileno())):
+                    return None
+                entry = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        # modification time is the recency for the LRU eviction
+        with suppress(FileNotFoundError):
+            os.utime(file)
+        return entry
+
+    def _write(self, key: str, entry: Tuple[Tuple, bytes]):
+        if not self.path:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            return
+
+        # write to a temporary file first, so that readers never see a partial file
+        temporary_file = self.path / f"{key}.{threading.get_ident()}.tmp"
+        with open(os.open(temporary_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file, self.path / f"{key}.pkl")
+
+    def _evict(self):
+        if not self.path:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return
+
+        files = sorted(self.path.glob("*.pkl"), key=self._modification_time)
+        for file in files[: max(len(files) - self.max_entries, 0)]:
+            with suppress(FileNotFoundError):
+                file.unlink()
+
+    @staticmethod
+    def _is_private(file_stat: os.stat_result) -> bool:
+        # ownership and permission bits are not meaningful on Windows
+        if not hasattr(os, "getuid"):
+            return True
+        return file_stat.st_uid == os.getuid() and not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    @staticmethod
+    def _modification_time(file: Path) -> float:
+        # files may be removed concurrently by other processes that share the directory
+        try:
+            return file.stat().st_mtime
+        except FileNotFoundError:
+            return 0
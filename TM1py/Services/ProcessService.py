@@ -3,6 +3,7 @@
 import json
 import time
 import uuid
+from concurrent.futures import Future
 from typing import Dict, Iterable, List, Tuple
 
 from requests import Response
@@ -377,6 +378,44 @@ class ProcessService(ObjectService):
 
         return self._execute_with_return_parse_response(response)
 
+    def execute_with_return_future(
+        self,
+        process_name: str = None,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        **kwargs,
+    ) -> Future:
+        """Ask TM1 Server to execute a process without blocking the calling thread.
+        The execution is tracked by the poller shared by all futures of the RestService.
+        pass process parameters as keyword arguments to this function. E.g:
+
+        future = self.tm1.processes.execute_with_return_future(
+            process_name="Bedrock.Server.Wait",
+            pWaitSec=2)
+        success, status, error_log_file = future.result()
+
+        :param process_name: name of the TI process
+        :param timeout: Number of seconds until the future fails with TM1pyTimeout
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param kwargs: dictionary of process parameters and values
+        :return: Future resolved with success (boolean), status (String), error_log_file (String)
+        """
+        url = format_url("/Processes('{}')/tm1.ExecuteWithReturn?$expand=*", process_name)
+        parameters = dict()
+        if kwargs:
+            parameters = {"Parameters": []}
+            for parameter_name, parameter_value in kwargs.items():
+                parameters["Parameters"].append({"Name": parameter_name, "Value": parameter_value})
+
+        return self._rest.request_future(
+            method="POST",
+            url=url,
+            data=json.dumps(parameters, ensure_ascii=False),
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            transform=self._execute_with_return_parse_response,
+        )
+
     def poll_execute_with_return(self, async_id: str):
 
         response = self._rest.retrieve_async_response(async_id=async_id)
@@ -1,17 +1,22 @@
 # -*- coding: utf-8 -*-
 import json
+import random
 import re
 import socket
+import threading
 import time
 import warnings
 from ast import literal_eval
 from base64 import b64decode, b64encode
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from enum import Enum
 from http.client import HTTPResponse
 from http.cookies import SimpleCookie
 from io import BytesIO
 from json import JSONDecodeError
-from typing import Dict, Optional, Tuple, Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
 import requests
 import urllib3
@@ -21,6 +26,7 @@ from requests.auth import HTTPBasicAuth
 from urllib3._collections import HTTPHeaderDict
 
 from TM1py.Exceptions.Exceptions import TM1pyTimeout, TM1pyVersionDeprecationException
+from TM1py.Services.CubeMetadataCache import CubeMetadataCache
 from TM1py.Utils import (
     CaseAndSpaceInsensitiveSet,
     HTTPAdapterWithSocketOptions,
@@ -57,6 +63,233 @@ class AuthenticationMode(Enum):
         return True
 
 
+class PollingStrategy:
+    """Wait times between polls of an async operation.
+    Exponential back-off with jitter, capped at `max_wait`. A `Retry-After` header sent by the server is honoured.
+    Subclass and override `wait_time` for a custom strategy.
+    """
+
+    def __init__(
+        self,
+        initial_wait: float = 0.1,
+        factor: float = 2.0,
+        max_wait: float = 1.0,
+        jitter: float = 0.1,
+        honour_retry_after: bool = True,
+    ):
+        """
+
+        :param initial_wait: seconds to wait before the second poll
+        :param factor: multiplier applied to the wait time after each poll
+        :param max_wait: upper bound for the wait time in seconds (excluding Retry-After)
+        :param jitter: max relative deviation applied randomly to each wait time, e.g. 0.1 for +/- 10%
+        :param honour_retry_after: wait as long as the server asks for through the Retry-After header
+        """
+        if initial_wait <= 0 or factor < 1 or max_wait < initial_wait:
+            raise ValueError("'initial_wait' must be positive, 'factor' >= 1 and 'max_wait' >= 'initial_wait'")
+        if not 0 <= jitter < 1:
+            raise ValueError("'jitter' must be between 0 and 1")
+
+        self.initial_wait = initial_wait
+        self.factor = factor
+        self.max_wait = max_wait
+        self.jitter = jitter
+        self.honour_retry_after = honour_retry_after
+
+    def wait_time(self, attempt: int, response: Response = None) -> float:
+        """Seconds to wait after the poll number `attempt` (starting at 0)
+
+        :param attempt: number of polls executed before
+        :param response: response of the last poll
+        :return: seconds
+        """
+        if self.honour_retry_after and response is not None:
+            retry_after = self.parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+
+        wait = min(self.initial_wait * self.factor**attempt, self.max_wait)
+        if self.jitter:
+            wait *= 1 + random.uniform(-self.jitter, self.jitter)
+        return wait
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After header is either a number of seconds or an HTTP date
+
+        :param value: value of the Retry-After header
+        :return: seconds or None
+        """
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class _AsyncOperation:
+    """outstanding async operation tracked by the AsyncOperationPoller"""
+
+    def __init__(
+        self,
+        async_id: str,
+        future: Future,
+        timeout: Optional[float],
+        cancel_at_timeout: bool,
+        method: str,
+        url: str,
+        transform: Callable,
+    ):
+        self.async_id = async_id
+        self.future = future
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.cancel_at_timeout = cancel_at_timeout
+        self.method = method
+        self.url = url
+        self.transform = transform
+        self.attempt = 0
+        self.next_poll = time.monotonic()
+
+
+class AsyncOperationPoller:
+    """Resolve many outstanding async operations from one background thread.
+
+    Each submitted async id is polled according to the PollingStrategy of the RestService and a
+    `concurrent.futures.Future` is resolved with the response. The thread is started on demand
+    and ends when no operations are outstanding.
+    """
+
+    def __init__(self, rest: "RestService", polling_strategy: PollingStrategy = None):
+        """
+
+        :param rest: instance of RestService
+        :param polling_strategy: defaults to the PollingStrategy of the RestService
+        """
+        self._rest = rest
+        self._polling_strategy = polling_strategy
+        self._operations: Dict[str, _AsyncOperation] = dict()
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def __len__(self) -> int:
+        """number of outstanding operations"""
+        with self._condition:
+            return len(self._operations)
+
+    @property
+    def polling_strategy(self) -> PollingStrategy:
+        return self._polling_strategy or self._rest.polling_strategy
+
+    def submit(
+        self,
+        async_id: str,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        method: str = "GET",
+        url: str = "",
+        transform: Callable = None,
+    ) -> Future:
+        """Track an async operation
+
+        :param async_id: id of the async operation, as returned with `return_async_id=True`
+        :param timeout: seconds until the future fails with TM1pyTimeout
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param method: HTTP method of the original request. Used in the TM1pyTimeout
+        :param url: url of the original request. Used in the TM1pyTimeout
+        :param transform: function applied to the verified response. Its return value is the result of the future
+        :return: Future resolved with the response of the operation (or the return value of transform)
+        """
+        future = Future()
+        operation = _AsyncOperation(async_id, future, timeout, cancel_at_timeout, method, url, transform)
+
+        with self._condition:
+            self._operations[async_id] = operation
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="TM1py-AsyncOperationPoller", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+        return future
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._operations:
+                    self._thread = None
+                    return
+
+                now = time.monotonic()
+                due = [operation for operation in self._operations.values() if operation.next_poll <= now]
+                if not due:
+                    next_poll = min(operation.next_poll for operation in self._operations.values())
+                    self._condition.wait(timeout=next_poll - now)
+                    continue
+
+            for operation in due:
+                self._poll(operation)
+
+    def _poll(self, operation: _AsyncOperation):
+        """poll operation once. Finished operations are removed and their future is resolved"""
+        try:
+            if operation.future.cancelled():
+                self._rest.cancel_async_operation(operation.async_id)
+                self._finish(operation)
+                return
+
+            response = self._rest.retrieve_async_response(operation.async_id)
+            if response.status_code in [200, 201]:
+                response = self._rest._transform_async_response(response)
+                self._rest.verify_response(response=response)
+                response.encoding = "utf-8"
+                result = operation.transform(response) if operation.transform else response
+                self._finish(operation, result=result)
+                return
+
+            wait = self.polling_strategy.wait_time(operation.attempt, response)
+            operation.attempt += 1
+            operation.next_poll = time.monotonic() + wait
+
+            if operation.deadline is not None and operation.next_poll > operation.deadline:
+                if operation.cancel_at_timeout:
+                    self._rest.cancel_async_operation(operation.async_id)
+                self._finish(
+                    operation,
+                    exception=TM1pyTimeout(method=operation.method, url=operation.url, timeout=operation.timeout),
+                )
+
+        except Exception as exception:
+            self._finish(operation, exception=exception)
+
+    def _finish(self, operation: _AsyncOperation, result=None, exception: BaseException = None):
+        # remove before resolving, so that no operation with a resolved future is counted as outstanding
+        with self._condition:
+            self._operations.pop(operation.async_id, None)
+
+        if exception is not None:
+            self._set_exception(operation.future, exception)
+        else:
+            self._set_result(operation.future, result)
+
+    @staticmethod
+    def _set_result(future: Future, result):
+        if not future.done():
+            future.set_result(result)
+
+    @staticmethod
+    def _set_exception(future: Future, exception: BaseException):
+        if not future.done():
+            future.set_exception(exception)
+
+
 class RestService:
     """Low level communication with TM1 instance through HTTP.
     Allows to execute HTTP Methods
@@ -115,6 +348,8 @@ class RestService:
         - **timeout** (float): Number of seconds that the client will wait to receive the first byte.
         - **cancel_at_timeout** (bool): Abort operation in TM1 when timeout is reached.
         - **async_requests_mode** (bool): Changes internal REST execution mode to avoid 60s timeout on IBM cloud.
+        - **polling_strategy** (PollingStrategy): Wait times between polls of async operations. Default: PollingStrategy().
+        - **metadata_cache_ttl** (float): Seconds cube metadata (e.g. dimension order) is cached. 0 to disable. Default: 300.
         - **connection_pool_size** (int): Maximum number of connections to save in the pool (default: 10). In a multi-threaded environment, set higher.
         - **pool_connections** (int): Number of connection pools to cache (default: 1 for a single TM1 instance).
         - **integrated_login** (bool): True for IntegratedSecurityMode3.
@@ -154,6 +389,9 @@ class RestService:
         self._timeout = None if kwargs.get("timeout", None) is None else float(kwargs.get("timeout"))
         self._cancel_at_timeout = kwargs.get("cancel_at_timeout", False)
         self._async_requests_mode = self.translate_to_boolean(kwargs.get("async_requests_mode", False))
+        self._polling_strategy = kwargs.get("polling_strategy", None) or PollingStrategy()
+        self._async_poller = AsyncOperationPoller(self)
+        self._metadata_cache = CubeMetadataCache(self, ttl=float(kwargs.get("metadata_cache_ttl", 300)))
         self._connection_pool_size = int(kwargs.get("connection_pool_size", self.DEFAULT_CONNECTION_POOL_SIZE))
         self._pool_connections = int(kwargs.get("pool_connections", self.DEFAULT_POOL_CONNECTIONS))
         self._re_connect_on_session_timeout = kwargs.get("re_connect_on_session_timeout", True)
@@ -390,10 +628,17 @@ class RestService:
         """
         Poll for async operation completion
         """
-        for wait in RestService.wait_time_generator(timeout):
+        deadline = time.monotonic() + timeout if timeout else None
+        attempt = 0
+        while True:
             response = self.retrieve_async_response(async_id)
             if response.status_code in [200, 201]:
                 return response
+
+            wait = self._polling_strategy.wait_time(attempt, response)
+            attempt += 1
+            if deadline is not None and time.monotonic() + wait > deadline:
+                break
             time.sleep(wait)
 
         # Timeout reached
@@ -640,6 +885,7 @@ class RestService:
         encoding: str = "utf-8",
         idempotent: bool = True,
         verify_response: bool = True,
+        stream: bool = False,
         **kwargs,
     ):
         """Perform a GET request against TM1 instance
@@ -651,6 +897,7 @@ class RestService:
         :param timeout: Number of seconds that the client will wait to receive the first byte.
         :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
         :param encoding:
+        :param stream: If True, response body is not downloaded immediately. Read from response.raw and close response
         :return: response object or async_id
         """
 
@@ -666,6 +913,7 @@ class RestService:
             encoding=encoding,
             idempotent=idempotent,
             verify_response=verify_response,
+            stream=stream,
         )
 
     def POST(
@@ -1081,6 +1329,11 @@ class RestService:
         except KeyError:
             return self._s.cookies["paSession"]
 
+    @property
+    def connection_arguments(self) -> Dict:
+        """copy of the arguments the connection was created with, e.g. to open another session"""
+        return dict(self._kwargs)
+
     @staticmethod
     def translate_to_boolean(value) -> bool:
         """Takes a boolean or string (eg. true, True, FALSE, etc.) value and returns (boolean) True or False
@@ -1209,6 +1462,64 @@ class RestService:
         response = self.DELETE(url, async_requests_mode=False, **kwargs)
         self.verify_response(response)
 
+    @property
+    def polling_strategy(self) -> PollingStrategy:
+        return self._polling_strategy
+
+    @polling_strategy.setter
+    def polling_strategy(self, value: PollingStrategy):
+        self._polling_strategy = value
+
+    @property
+    def async_poller(self) -> AsyncOperationPoller:
+        """poller shared by all requests of this RestService that are executed through `request_future`"""
+        return self._async_poller
+
+    @property
+    def metadata_cache(self) -> CubeMetadataCache:
+        """cube metadata shared by all services of this RestService"""
+        return self._metadata_cache
+
+    def request_future(
+        self,
+        method: str,
+        url: str,
+        data: str = "",
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        transform: Callable = None,
+        **kwargs,
+    ) -> Future:
+        """Start a request in TM1 async mode and return a Future instead of blocking the calling thread.
+        All outstanding requests are polled from the one background thread of the `async_poller`.
+
+        :param method: HTTP method
+        :param url: url of the request
+        :param data: body of the request
+        :param timeout: seconds until the future fails with TM1pyTimeout
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param transform: function applied to the response. Its return value is the result of the future
+        :return: Future resolved with the response (or the return value of transform)
+        """
+        response = self.request(method=method, url=url, data=data, return_async_id=True, **kwargs)
+        if isinstance(response, str):
+            return self._async_poller.submit(
+                async_id=response,
+                timeout=timeout,
+                cancel_at_timeout=cancel_at_timeout,
+                method=method,
+                url=url,
+                transform=transform,
+            )
+
+        # TM1 answered synchronously
+        future = Future()
+        try:
+            future.set_result(transform(response) if transform else response)
+        except Exception as exception:
+            future.set_exception(exception)
+        return future
+
     def cancel_running_operation(self):
         monitoring_service = self.get_monitoring_service()
         threads = monitoring_service.get_active_session_threads(exclude_idle=True)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+import warnings
+from contextlib import contextmanager, suppress
+from typing import TYPE_CHECKING, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from TM1py.Services.TM1Service import TM1Service
+
+
+class SessionPool:
+    """Pool of independent TM1 sessions, logged in lazily with the same credentials
+
+    All services of a `TM1Service` share one `RestService` and therefore one TM1 session. Requests that run
+    in parallel on one session are subject to the locking of that session. The pool hands out a separate
+    `TM1Service`, with its own TM1 session, to every worker.
+
+    Sessions that were idle for more than `health_check_interval` seconds are checked before they are handed out
+    and re-authenticated, or replaced, if they are no longer connected. All sessions are logged out on `close`.
+
+        with SessionPool(size=4, **config["tm1srv01"]) as pool:
+            df = tm1.cells.execute_mdx_dataframe_async(mdx_list, max_workers=4, session_pool=pool)
+
+            with pool.session() as tm1_session:
+                tm1_session.cells.execute_mdx(mdx)
+    """
+
+    def __init__(self, size: int = 4, health_check_interval: float = 60, **kwargs):
+        """
+
+        :param size: max number of sessions logged in at the same time
+        :param health_check_interval: seconds a session can be idle before it is checked on hand out.
+        0 to check every time
+        :param kwargs: arguments to create a `TM1Service`, e.g. address, port, user, password, ssl
+        """
+        if size < 1:
+            raise ValueError("argument 'size' must be a positive integer")
+        if "session_id" in kwargs:
+            raise ValueError("argument 'session_id' must not be used with SessionPool, as sessions must be independent")
+
+        self.size = size
+        self.health_check_interval = health_check_interval
+        self._kwargs = kwargs
+
+        # idle sessions with the time they were released
+        self._idle: List[Tuple["TM1Service", float]] = []
+        self._logged_in = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @classmethod
+    def from_service(cls, tm1: "TM1Service", size: int = 4, health_check_interval: float = 60) -> "SessionPool":
+        """Create a pool with the same connection arguments as an existing `TM1Service`
+
+        :param tm1: instance of TM1Service. Must not be connected through a session_id
+        :param size: max number of sessions logged in at the same time
+        :param health_check_interval: seconds a session can be idle before it is checked on hand out
+        :return: SessionPool
+        """
+        return cls(size=size, health_check_interval=health_check_interval, **tm1.connection.connection_arguments)
+
+    def __len__(self) -> int:
+        """number of sessions currently logged in"""
+        return self._logged_in
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @contextmanager
+    def session(self, timeout: float = None) -> Iterator["TM1Service"]:
+        """Borrow a session from the pool for the duration of the with block
+
+        :param timeout: seconds to wait for a session, if all sessions are in use. Wait indefinitely if None
+        :return: TM1Service
+        """
+        tm1 = self.acquire(timeout=timeout)
+        try:
+            yield tm1
+        finally:
+            self.release(tm1)
+
+    def acquire(self, timeout: float = None) -> "TM1Service":
+        """Take a session from the pool. Logs in a new session if none is idle and the pool is not exhausted.
+        Must be returned through `release`
+
+        :param timeout: seconds to wait for a session, if all sessions are in use. Wait indefinitely if None
+        :return: TM1Service
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("SessionPool is closed")
+                if self._idle:
+                    tm1, released_at = self._idle.pop()
+                    break
+                if self._logged_in < self.size:
+                    # reserve the slot, log in outside of the lock
+                    self._logged_in += 1
+                    tm1, released_at = None, None
+                    break
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No session available in SessionPool after {timeout} seconds")
+                self._condition.wait(remaining)
+
+        try:
+            if tm1 is None:
+                return self._login()
+            if time.monotonic() - released_at >= self.health_check_interval:
+                return self._check_health(tm1)
+            return tm1
+
+        except Exception:
+            with self._condition:
+                self._logged_in -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, tm1: "TM1Service"):
+        """Return a session to the pool
+
+        :param tm1: TM1Service as returned by `acquire`
+        :return:
+        """
+        with self._condition:
+            if not self._closed:
+                self._idle.append((tm1, time.monotonic()))
+                self._condition.notify()
+                return
+
+            self._logged_in -= 1
+
+        # released after close
+        self._logout(tm1)
+
+    def close(self):
+        """Log out all idle sessions. Sessions still in use are logged out when they are released"""
+        with self._condition:
+            self._closed = True
+            idle_sessions = [tm1 for tm1, _ in self._idle]
+            self._idle.clear()
+            self._logged_in -= len(idle_sessions)
+            self._condition.notify_all()
+
+        for tm1 in idle_sessions:
+            self._logout(tm1)
+
+    def _login(self) -> "TM1Service":
+        from TM1py.Services.TM1Service import TM1Service
+
+        return TM1Service(**self._kwargs)
+
+    def _check_health(self, tm1: "TM1Service") -> "TM1Service":
+        if tm1.connection.is_connected():
+            return tm1
+
+        # re-authenticate on the same session object
+        try:
+            tm1.connection.connect()
+            if tm1.connection.is_connected():
+                return tm1
+        except Exception:
+            pass
+
+        # replace with a fresh session
+        with suppress(Exception):
+            tm1.logout()
+        return self._login()
+
+    @staticmethod
+    def _logout(tm1: "TM1Service"):
+        try:
+            tm1.logout()
+        except Exception as e:
+            warnings.warn(f"Logout Failed due to Exception: {e}")
@@ -71,6 +71,7 @@ class TM1Service:
         - **timeout** (float): Number of seconds to wait for a response.
         - **cancel_at_timeout** (bool): Abort operation in TM1 when timeout is reached.
         - **async_requests_mode** (bool): Enable asynchronous request mode.
+        - **metadata_cache_ttl** (float): Seconds cube metadata (e.g. dimension order) is cached. 0 to disable.
         - **connection_pool_size** (int): Maximum number of connections in the pool.
         - **pool_connections** (int): Number of connection pools to cache.
         - **integrated_login** (bool): True for IntegratedSecurityMode3.
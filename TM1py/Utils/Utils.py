@@ -1,3 +1,4 @@
+import asyncio
 import collections
 import csv
 import functools
@@ -7,11 +8,13 @@ import math
 import re
 import ssl
 import urllib.parse as urlparse
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, unique
 from io import StringIO
 from typing import (
     Any,
     Callable,
+    Coroutine,
     Dict,
     Generator,
     Iterable,
@@ -44,6 +47,14 @@ try:
 except ImportError:
     _has_pandas = False
 
+try:
+    import numpy as np
+    import pyarrow as pa
+
+    _has_pyarrow = True
+except ImportError:
+    _has_pyarrow = False
+
 
 def decohints(decorator: Callable) -> Callable:
     """
@@ -165,6 +176,20 @@ def require_pandas(func):
     return wrapper
 
 
+@decohints
+def require_pyarrow(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            import pyarrow  # noqa: F401
+
+            return func(*args, **kwargs)
+        except ImportError:
+            raise ImportError(f"Function '{func.__name__}' requires pyarrow")
+
+    return wrapper
+
+
 @decohints
 def require_networkx(func):
     @functools.wraps(func)
@@ -320,6 +345,23 @@ def verify_version(required_version: str, version: str) -> bool:
     return actual >= expected
 
 
+def run_async(coroutine: Coroutine) -> Any:
+    """Run coroutine to completion from synchronous code.
+    Unlike asyncio.run, it also works when called from a thread with a running event loop (e.g. Jupyter)
+
+    :param coroutine: coroutine to execute
+    :return: result of the coroutine
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    # event loop is already running in this thread: run coroutine in a separate thread with its own loop
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
 def case_and_space_insensitive_equals(item1: str, item2: str) -> bool:
     return lower_and_drop_spaces(item1) == lower_and_drop_spaces(item2)
 
@@ -385,6 +427,7 @@ def build_content_from_cellset_dict(
     element_unique_names: bool = True,
     skip_cell_properties: bool = False,
     skip_sandbox_dimension: bool = False,
+    compact_keys: bool = False,
 ) -> "CaseAndSpaceInsensitiveTuplesDict":
     """transform raw cellset data into concise dictionary
     :param raw_cellset_as_dict:
@@ -392,6 +435,7 @@ def build_content_from_cellset_dict(
     :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
     :param skip_cell_properties: cell values in result dictionary, instead of cell_properties dictionary
     :param skip_sandbox_dimension: skip sandbox dimension
+    :param compact_keys: return a CompactCaseAndSpaceInsensitiveTuplesDict. Lower memory footprint on large cellsets
     :return:
     """
     cube_dimensions = [dim["Name"] for dim in raw_cellset_as_dict["Cube"]["Dimensions"]]
@@ -401,7 +445,9 @@ def build_content_from_cellset_dict(
     cells = raw_cellset_as_dict["Cells"]
     axes = extract_axes_from_cellset(raw_cellset_as_dict=raw_cellset_as_dict)
 
-    content_as_dict = CaseAndSpaceInsensitiveTuplesDict()
+    content_as_dict = (
+        CompactCaseAndSpaceInsensitiveTuplesDict() if compact_keys else CaseAndSpaceInsensitiveTuplesDict()
+    )
     for cell_ordinal, cell in enumerate(cells[: top or len(cells)]):
         # if skip is used in execution we must use the original ordinal from the cell, if not we can simply enumerate
         cell_ordinal = cell.get("Ordinal", cell_ordinal)
@@ -630,6 +676,10 @@ def build_dataframe_from_csv(
     if not shaped:
         return df
 
+    return _shape_dataframe(df)
+
+
+def _shape_dataframe(df: "pd.DataFrame") -> "pd.DataFrame":
     # due to csv creation logic, last column is bottom dimension from the column selection
     df = df.pivot_table(
         index=tuple(df.columns[:-2]),
@@ -644,6 +694,208 @@ def build_dataframe_from_csv(
     return df.rename_axis(None, axis=1)
 
 
+def _factorize(items: Iterable[str]) -> Tuple["np.ndarray", List[str]]:
+    positions = {}
+    codes = np.fromiter((positions.setdefault(item, len(positions)) for item in items), dtype=np.int32)
+    return codes, list(positions)
+
+
+def _build_encoded_columns_from_cellset_dict(
+    row_dimensions: List[str],
+    column_dimensions: List[str],
+    raw_cellset_as_dict: Dict,
+    top: Optional[int] = None,
+    include_attributes: bool = False,
+    mdx_headers: bool = False,
+) -> Tuple[List[str], List[Tuple["np.ndarray", List[str]]], List]:
+    """transform raw cellset data into dictionary encoded element / attribute columns and a list of values
+
+    Every axis tuple is processed only once. Cell ordinals are mapped to tuple indices with vectorized numpy divmod.
+
+    :return: headers, (codes, dictionary) for every element / attribute column, cell values
+    """
+    cells = raw_cellset_as_dict["Cells"][: top or len(raw_cellset_as_dict["Cells"])]
+
+    axes = extract_axes_from_cellset(raw_cellset_as_dict=raw_cellset_as_dict)
+    column_axis = axes[0]
+    if len(axes) > 1:
+        row_axis = axes[1]
+    else:
+        row_axis = list()
+
+    headers = _build_headers_for_csv(
+        row_axis=row_axis,
+        column_axis=column_axis,
+        row_dimensions=row_dimensions,
+        column_dimensions=column_dimensions,
+        include_attributes=include_attributes,
+        mdx_headers=mdx_headers,
+    )
+
+    # if skip is used in execution we must use the original ordinal from the cell, if not we can simply enumerate
+    if "Ordinal" in cells[0]:
+        ordinals = np.fromiter((cell["Ordinal"] for cell in cells), dtype=np.int64, count=len(cells))
+    else:
+        ordinals = np.arange(len(cells), dtype=np.int64)
+
+    tuple_indices_by_axis = []
+    if row_axis:
+        row_indices, column_indices = np.divmod(ordinals, column_axis["Cardinality"])
+        tuple_indices_by_axis.append((row_axis, row_indices % row_axis["Cardinality"]))
+        tuple_indices_by_axis.append((column_axis, column_indices))
+    elif column_axis:
+        tuple_indices_by_axis.append((column_axis, ordinals % column_axis["Cardinality"]))
+
+    columns = []
+    for axis, tuple_indices in tuple_indices_by_axis:
+        line_items_by_tuple = [
+            _build_csv_line_items_from_axis_tuple(members=tupl["Members"], include_attributes=include_attributes)
+            for tupl in axis["Tuples"]
+        ]
+        # one column per element / attribute position in the axis tuples
+        for line_items in zip(*line_items_by_tuple):
+            codes, dictionary = _factorize(line_items)
+            columns.append((codes[tuple_indices], dictionary))
+
+    if include_attributes and not len(columns) + 1 == len(headers):
+        raise ValueError(
+            "Invalid response. With 'include_attributes' as True,"
+            " Attributes must be requested explicitly as PROPERTIES in the MDX"
+        )
+
+    return headers, columns, [cell["Value"] for cell in cells]
+
+
+@require_pandas
+def build_dataframe_from_cellset_dict(
+    row_dimensions: List[str],
+    column_dimensions: List[str],
+    raw_cellset_as_dict: Dict,
+    top: Optional[int] = None,
+    include_attributes: bool = False,
+    mdx_headers: bool = False,
+    shaped: bool = False,
+) -> "pd.DataFrame":
+    """transform raw cellset data into a DataFrame without a csv round trip
+
+    Columns and values are the same as in the DataFrame from `build_csv_from_cellset_dict` and
+    `build_dataframe_from_csv`. Element and attribute columns are categorical.
+
+    :param row_dimensions:
+    :param column_dimensions:
+    :param raw_cellset_as_dict:
+    :param top: Maximum Number of cells
+    :param include_attributes: include attribute columns
+    :param mdx_headers: boolean. Fully qualified hierarchy name as header instead of simple dimension name
+    :param shaped: preserve shape of view/mdx in data frame
+    :return: Pandas Dataframe
+    """
+    if len(raw_cellset_as_dict["Cells"]) == 0:
+        return pd.DataFrame()
+
+    headers, encoded_columns, values = _build_encoded_columns_from_cellset_dict(
+        row_dimensions=row_dimensions,
+        column_dimensions=column_dimensions,
+        raw_cellset_as_dict=raw_cellset_as_dict,
+        top=top,
+        include_attributes=include_attributes,
+        mdx_headers=mdx_headers,
+    )
+
+    columns = [pd.Categorical.from_codes(codes, categories=dictionary) for codes, dictionary in encoded_columns]
+    try:
+        columns.append(np.array(values, dtype=float))
+    except (TypeError, ValueError):
+        # mixed value column. Represent as strings like in the csv
+        columns.append(np.array([str(value or "") for value in values], dtype=object))
+
+    if shaped:
+        columns = [np.asarray(column) for column in columns]
+
+    df = pd.DataFrame(dict(enumerate(columns)), copy=False)
+    df.columns = headers
+
+    if not shaped:
+        return df
+
+    return _shape_dataframe(df)
+
+
+def _build_arrow_value_array(values: List, value_type: "pa.DataType" = None) -> "pa.Array":
+    if value_type is None:
+        try:
+            return pa.array(values, type=pa.float64())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # mixed value column. Represent as strings like in the csv
+            value_type = pa.string()
+
+    if pa.types.is_string(value_type):
+        return pa.array([None if value is None else str(value) for value in values], type=value_type)
+
+    try:
+        return pa.array(values, type=value_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        raise ValueError(f"Cell values can not be converted to {value_type}. Cellset contains string values")
+
+
+@require_pyarrow
+def build_arrow_table_from_cellset_dict(
+    row_dimensions: List[str],
+    column_dimensions: List[str],
+    raw_cellset_as_dict: Dict,
+    top: Optional[int] = None,
+    include_attributes: bool = False,
+    mdx_headers: bool = False,
+) -> "pa.Table":
+    """transform raw cellset data into a pyarrow Table with dictionary encoded element / attribute columns
+
+    :param row_dimensions:
+    :param column_dimensions:
+    :param raw_cellset_as_dict:
+    :param top: Maximum Number of cells
+    :param include_attributes: include attribute columns
+    :param mdx_headers: boolean. Fully qualified hierarchy name as header instead of simple dimension name
+    :return: pyarrow Table
+    """
+    if len(raw_cellset_as_dict["Cells"]) == 0:
+        return pa.table({})
+
+    headers, encoded_columns, values = _build_encoded_columns_from_cellset_dict(
+        row_dimensions=row_dimensions,
+        column_dimensions=column_dimensions,
+        raw_cellset_as_dict=raw_cellset_as_dict,
+        top=top,
+        include_attributes=include_attributes,
+        mdx_headers=mdx_headers,
+    )
+
+    columns = [
+        pa.DictionaryArray.from_arrays(pa.array(codes, type=pa.int32()), pa.array(dictionary, type=pa.string()))
+        for codes, dictionary in encoded_columns
+    ]
+    columns.append(_build_arrow_value_array(values))
+    return pa.Table.from_arrays(columns, names=headers)
+
+
+@require_pyarrow
+def build_arrow_table_from_cells(
+    headers: List[str], cells: List[Tuple[Tuple[str, ...], Any]], value_type: "pa.DataType" = None
+) -> "pa.Table":
+    """transform (coordinates, value) tuples into a pyarrow Table with dictionary encoded element columns
+
+    :param headers: names of the element columns followed by the name of the value column
+    :param cells: (coordinates, value) tuples. E.g. from CellService.execute_mdx_iter
+    :param value_type: pyarrow type of value column. Inferred from values if not provided
+    :return: pyarrow Table
+    """
+    coordinates, values = zip(*cells) if cells else ((), ())
+    element_columns = list(zip(*coordinates)) if coordinates else [() for _ in headers[:-1]]
+
+    columns = [pa.array(column, type=pa.string()).dictionary_encode() for column in element_columns]
+    columns.append(_build_arrow_value_array(list(values), value_type))
+    return pa.Table.from_arrays(columns, names=headers)
+
+
 def _build_csv_line_items_from_axis_tuple(members: Dict, include_attributes: bool = False) -> List[str]:
     if not include_attributes:
         return extract_element_names_from_members(members)
@@ -927,13 +1179,14 @@ def build_pandas_dataframe_from_cellset(
 
 @require_pandas
 def build_cellset_from_pandas_dataframe(
-    df: "pd.DataFrame", sum_numeric_duplicates: bool = True
+    df: "pd.DataFrame", sum_numeric_duplicates: bool = True, compact_keys: bool = False
 ) -> "CaseAndSpaceInsensitiveTuplesDict":
     """
 
     param sum_numeric_duplicates: Aggregate numerical values for duplicated intersections
     param df: a Pandas Dataframe, with dimension-column mapping in correct order.
     As created in build_pandas_dataframe_from_cellset
+    param compact_keys: return a CompactCaseAndSpaceInsensitiveTuplesDict. Lower memory footprint on large DataFrames
 
     :return: a CaseAndSpaceInsensitiveTuplesDict
     """
@@ -941,24 +1194,36 @@ def build_cellset_from_pandas_dataframe(
         df.reset_index(inplace=True)
 
     if sum_numeric_duplicates:
-        value_header = df.columns[-1]
-        dimension_headers = df.columns[:-1]
+        df = aggregate_numeric_duplicate_intersections(df)
 
-        if pd.api.types.is_numeric_dtype(df[value_header]):
-            df = aggregate_duplicate_intersections(df, dimension_headers, value_header)
-        else:
-            filter_mask = df[value_header].apply(np.isreal)
-            df_n = df[filter_mask]
-            df_s = df[~filter_mask]
-            df_n = aggregate_duplicate_intersections(df_n, dimension_headers, value_header)
-            df = pd.concat([df_n, df_s])
-
-    cellset = CaseAndSpaceInsensitiveTuplesDict(
-        dict(zip(df.iloc[:, :-1].itertuples(index=False, name=None), df.iloc[:, -1].values))
-    )
+    cells = zip(df.iloc[:, :-1].itertuples(index=False, name=None), df.iloc[:, -1].values)
+    if compact_keys:
+        return CompactCaseAndSpaceInsensitiveTuplesDict(cells)
+
+    cellset = CaseAndSpaceInsensitiveTuplesDict(dict(cells))
     return cellset
 
 
+def aggregate_numeric_duplicate_intersections(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Aggregate numeric values for duplicated intersections. String values are passed through as they are.
+    Last column is expected to hold the values, all other columns the elements.
+
+    :param df: a Pandas Dataframe, with dimension-column mapping in correct order.
+    :return: a Pandas Dataframe
+    """
+    value_header = df.columns[-1]
+    dimension_headers = df.columns[:-1]
+
+    if pd.api.types.is_numeric_dtype(df[value_header]):
+        return aggregate_duplicate_intersections(df, dimension_headers, value_header)
+
+    filter_mask = df[value_header].apply(np.isreal)
+    df_n = df[filter_mask]
+    df_s = df[~filter_mask]
+    df_n = aggregate_duplicate_intersections(df_n, dimension_headers, value_header)
+    return pd.concat([df_n, df_s])
+
+
 def aggregate_duplicate_intersections(df, dimension_headers, value_header):
     for col in dimension_headers:
         df[col] = df[col].str.lower().str.replace(" ", "")
@@ -1490,6 +1755,197 @@ class CaseAndSpaceInsensitiveTuplesDict(collections.abc.MutableMapping):
         return repr(self)
 
 
+class CompactCaseAndSpaceInsensitiveTuplesDict(CaseAndSpaceInsensitiveTuplesDict):
+    """
+    A memory efficient variant of `CaseAndSpaceInsensitiveTuplesDict` for large cellsets.
+
+    Element names are interned per tuple position: every distinct name is stored once and mapped to an integer id.
+    Keys are stored as a single integer, packing the ids of all items in the tuple.
+    Lookup semantics and the `adjusted_items` / `adjusted_keys` API are the same as in
+    `CaseAndSpaceInsensitiveTuplesDict`:
+        data = CompactCaseAndSpaceInsensitiveTuplesDict()
+        data[('[Business Unit].[UK]', '[Scenario].[Worst Case]')] = 1000
+        assert data[('[BusinessUnit].[UK]', '[Scenario].[worstcase]')] == 1000
+
+    The case of the last key set is remembered per element name, rather than per key.
+
+    Entries are ordered.
+    """
+
+    _BITS = 32
+    _MASK = (1 << _BITS) - 1
+
+    def __init__(self, data=None, **kwargs):
+        """Initialize the dictionary with optional initial data."""
+        self._clear_store()
+        if data is None:
+            data = {}
+        self.update(data, **kwargs)
+
+    def _clear_store(self):
+        # packed key -> value
+        self._store = dict()
+        # per tuple position: name as passed -> id, adjusted name -> id, id -> [name, adjusted name]
+        self._ids_by_name = []
+        self._ids_by_adjusted_name = []
+        self._names = []
+
+    def _intern(self, position: int, item: str) -> int:
+        """Return the id of the item in the position. Register the item if it is not known yet"""
+        if position == len(self._names):
+            self._ids_by_name.append(dict())
+            self._ids_by_adjusted_name.append(dict())
+            # ids start at 1, so that tuples of different lengths don't produce the same packed key
+            self._names.append([None])
+
+        item_id = self._ids_by_name[position].get(item)
+        if item_id is not None:
+            return item_id
+
+        adjusted_item = lower_and_drop_spaces(item)
+        item_id = self._ids_by_adjusted_name[position].get(adjusted_item)
+        if item_id is None:
+            item_id = len(self._names[position])
+            self._ids_by_adjusted_name[position][adjusted_item] = item_id
+            self._names[position].append([item, adjusted_item])
+        else:
+            # remember case of the last key set
+            previous_item = self._names[position][item_id][0]
+            self._ids_by_name[position].pop(previous_item, None)
+            self._names[position][item_id][0] = item
+
+        self._ids_by_name[position][item] = item_id
+        return item_id
+
+    def _pack_key(self, key, register: bool = False) -> Optional[int]:
+        """Pack a key into an integer. Return None for keys with unknown items, unless register is True"""
+        if not isinstance(key, tuple):
+            raise TypeError("Keys must be tuples of strings.")
+
+        packed_key = 0
+        for position, item in enumerate(key):
+            if not isinstance(item, str):
+                raise TypeError("All items in the key tuple must be strings.")
+
+            if register:
+                item_id = self._intern(position, item)
+            elif position >= len(self._names):
+                return None
+            else:
+                item_id = self._ids_by_name[position].get(item)
+                if item_id is None:
+                    item_id = self._ids_by_adjusted_name[position].get(lower_and_drop_spaces(item))
+                    if item_id is None:
+                        return None
+
+            packed_key |= item_id << (position * self._BITS)
+        return packed_key
+
+    def _unpack_key(self, packed_key: int, adjusted: bool = False) -> tuple:
+        index = 1 if adjusted else 0
+        items = []
+        position = 0
+        while packed_key:
+            items.append(self._names[position][packed_key & self._MASK][index])
+            packed_key >>= self._BITS
+            position += 1
+        return tuple(items)
+
+    def __setitem__(self, key, value):
+        """Set the value for a key, interning the items of the key as needed."""
+        self._store[self._pack_key(key, register=True)] = value
+
+    def __getitem__(self, key):
+        """Retrieve the value for a key."""
+        packed_key = self._pack_key(key)
+        try:
+            return self._store[packed_key]
+        except KeyError:
+            raise KeyError(f"Key {key} not found.") from None
+
+    def __delitem__(self, key):
+        """Delete the item associated with the key."""
+        packed_key = self._pack_key(key)
+        try:
+            del self._store[packed_key]
+        except KeyError:
+            raise KeyError(f"Key {key} not found.") from None
+
+    def __iter__(self):
+        """Iterate over the keys in their original case."""
+        return (self._unpack_key(packed_key) for packed_key in self._store)
+
+    def __len__(self):
+        """Return the number of items in the dictionary."""
+        return len(self._store)
+
+    def __contains__(self, key):
+        """Check if the key exists in the dictionary."""
+        return self._pack_key(key) in self._store
+
+    def keys(self):
+        """Return a view of the keys in their original case."""
+        return [self._unpack_key(packed_key) for packed_key in self._store]
+
+    def values(self):
+        """Return a view of the values."""
+        return list(self._store.values())
+
+    def items(self):
+        """Return a view of the items (key-value pairs)."""
+        return [(self._unpack_key(packed_key), value) for packed_key, value in self._store.items()]
+
+    def adjusted_keys(self):
+        """Return a generator of the adjusted keys."""
+        return (self._unpack_key(packed_key, adjusted=True) for packed_key in self._store)
+
+    def adjusted_items(self):
+        """Return a generator of (adjusted_key, value) pairs."""
+        return ((self._unpack_key(packed_key, adjusted=True), value) for packed_key, value in self._store.items())
+
+    def copy(self):
+        """Create a shallow copy of the dictionary."""
+        new_copy = CompactCaseAndSpaceInsensitiveTuplesDict()
+        new_copy._store = self._store.copy()
+        new_copy._ids_by_name = [ids.copy() for ids in self._ids_by_name]
+        new_copy._ids_by_adjusted_name = [ids.copy() for ids in self._ids_by_adjusted_name]
+        new_copy._names = [[list(names) if names else names for names in position] for position in self._names]
+        return new_copy
+
+    def pop(self, key, default=None):
+        """
+        Remove the specified key and return the corresponding value.
+        If key is not found, default is returned if provided, otherwise KeyError is raised.
+
+        Parameters:
+            key (tuple): The key to remove.
+            default: The value to return if the key is not found.
+        """
+        packed_key = self._pack_key(key)
+        try:
+            return self._store.pop(packed_key)
+        except KeyError:
+            if default is not None:
+                return default
+            else:
+                raise KeyError(f"Key {key} not found.") from None
+
+    def popitem(self):
+        """
+        Remove and return a (key, value) pair from the dictionary.
+        Pairs are returned in LIFO order.
+
+        Raises:
+            KeyError: If the dictionary is empty.
+        """
+        packed_key, value = self._store.popitem()
+        return self._unpack_key(packed_key), value
+
+    def clear(self):
+        """Remove all items and interned names from the dictionary."""
+        self._clear_store()
+
+
 class CaseAndSpaceInsensitiveSet(collections.abc.MutableSet):
     """
     A case-and-space-insensitive set-like object for strings.
@@ -1762,6 +2218,122 @@ def frame_to_significant_digits(x, digits=15):
     return str(round(x, digits)).replace("e+", "E")
 
 
+def get_measure_element_type(measure_element: str, measure_dimension_elements: Dict) -> str:
+    """Type of the measure element as used when writing through TI.
+    Defaults to 'Numeric', so that writes to not existing elements trigger minor errors during TI execution
+
+    :param measure_element: element name, optionally prefixed with the hierarchy name ('hier:elem')
+    :param measure_dimension_elements: dictionary of measure elements and their types
+    :return: 'Numeric', 'String' or 'Consolidated'
+    """
+    try:
+        return measure_dimension_elements[measure_element]
+    except KeyError:
+        if ":" in measure_element:
+            return measure_dimension_elements.get(measure_element.split(":")[1], "Numeric")
+        return "Numeric"
+
+
+def _format_ti_number(value, template: str) -> str:
+    if value is None:
+        return "0"
+    # number strings must not exceed float range
+    try:
+        number = float(value)
+    except ValueError:
+        if isinstance(value, str):
+            return value
+        raise
+    return (template % number).replace("e+", "E")
+
+
+@require_pandas
+def build_cell_update_statements_from_dataframe(
+    data: Union["pd.DataFrame", Dict[str, Iterable]],
+    cube_name: str,
+    increment: bool = False,
+    measure_dimension_elements: Dict = None,
+    precision: int = None,
+    skip_non_updateable: bool = False,
+) -> List[str]:
+    """Build CellPutN / CellPutS statements for an unbound TI process column by column.
+    Escaping, type lookup and concatenation are done with pandas string operations on whole columns.
+
+    Numbers are rendered with 15 significant digits (or `precision` decimals) like in
+    `CellService._build_cell_update_statements`. Integral values are written without trailing '.0'.
+
+    :param data: DataFrame or dict of equally long columns. Element columns in the natural order of the cube
+        dimensions, values in the last column
+    :param cube_name: name of the cube
+    :param increment: use CellIncrementN for numeric values
+    :param measure_dimension_elements: dictionary of measure elements and their types. All numeric if None
+    :param precision: max number of decimals. Necessary when dealing with large numbers
+    :param skip_non_updateable: wrap statements in CellIsUpdateable check
+    :return: list of TI statements
+    """
+    if not isinstance(data, pd.DataFrame):
+        data = pd.DataFrame(data)
+    if data.empty:
+        return []
+    if data.shape[1] < 2:
+        raise ValueError("argument 'data' must have at least one element column and one value column")
+
+    element_columns = [
+        data.iloc[:, i].astype(str).str.replace("'", "''", regex=False) for i in range(data.shape[1] - 1)
+    ]
+    elements = "'" + element_columns[0]
+    for column in element_columns[1:]:
+        elements = elements + "','" + column
+    elements = elements + "'"
+
+    measure_elements = data.iloc[:, -2].astype(str)
+    string_elements = [
+        element
+        for element in measure_elements.unique()
+        if get_measure_element_type(element, measure_dimension_elements or {}) == "String"
+    ]
+    is_string = measure_elements.isin(string_elements).to_numpy()
+
+    values = data.iloc[:, -1]
+    value_strings = np.empty(len(data), dtype=object)
+    if is_string.any():
+        strings = values[is_string].map(str)
+        strings = strings.str.replace("'", "''", regex=False).str.replace("\r", "", regex=False)
+        value_strings[is_string] = ("'" + strings.str.replace("\n", "", regex=False) + "'").to_numpy(dtype=object)
+
+    if not is_string.all():
+        template = "%.15g" if precision is None else f"%.{precision}f"
+        numbers = values[~is_string]
+        # number strings are parsed along. None and what doesn't parse is formatted value by value
+        parsed = pd.to_numeric(numbers, errors="coerce").to_numpy(dtype=float)
+        is_number = ~np.isnan(parsed)
+        formatted = np.array([template % number for number in parsed[is_number].tolist()], dtype=object)
+        if precision is None:
+            # decide on the rounded output, as e.g. 999999999999999.9 only reaches 16 digits through rounding.
+            # Large numbers are rare, so they are rendered value by value like in the cell by cell statements
+            large = np.array(["e+" in number for number in formatted], dtype=bool)
+            formatted[large] = [frame_to_significant_digits(number) for number in parsed[is_number][large].tolist()]
+
+        numeric_value_strings = np.empty(len(numbers), dtype=object)
+        numeric_value_strings[is_number] = formatted
+        numeric_value_strings[~is_number] = [
+            _format_ti_number(value, template) for value in numbers[~is_number].tolist()
+        ]
+        value_strings[~is_string] = numeric_value_strings
+
+    numeric_function = "CellIncrementN(" if increment else "CellPutN("
+    functions = pd.Series(np.where(is_string, "CellPutS(", numeric_function), index=elements.index, dtype=str)
+    value_strings = pd.Series(value_strings, index=elements.index, dtype=str)
+
+    statements = functions + value_strings + f",'{cube_name}'," + elements + ")"
+    if skip_non_updateable:
+        statements = f"IF(CellIsUpdateable('{cube_name}', " + elements + ")=1," + statements + ",0);"
+    else:
+        statements = statements + ";"
+
+    return statements.tolist()
+
+
 def drop_dimension_properties(mdx: str):
     pattern = re.compile(r"(?i)DIMENSION\s+PROPERTIES\s+.*?\s+ON")
     mdx = pattern.sub(" ON", mdx)
@@ -44,18 +44,24 @@ from TM1py.Objects.User import User
 from TM1py.Objects.View import View
 from TM1py.Services.AnnotationService import AnnotationService
 from TM1py.Services.ApplicationService import ApplicationService
+from TM1py.Services.AsyncCellService import AsyncCellService
+from TM1py.Services.AsyncRestService import AsyncRestService
 from TM1py.Services.AuditLogService import AuditLogService
 from TM1py.Services.CellService import CellService
+from TM1py.Services.CellWriter import CellWriter
 from TM1py.Services.ChoreService import ChoreService
 from TM1py.Services.ConfigurationService import ConfigurationService
+from TM1py.Services.CubeMetadataCache import CubeMetadataCache
 from TM1py.Services.CubeService import CubeService
 from TM1py.Services.DimensionService import DimensionService
 from TM1py.Services.ElementService import ElementService
 from TM1py.Services.FileService import FileService
 from TM1py.Services.GitService import GitService
+from TM1py.Services.HierarchyCache import HierarchyCache
 from TM1py.Services.HierarchyService import HierarchyService
 from TM1py.Services.JobService import JobService
 from TM1py.Services.ManageService import ManageService
+from TM1py.Services.MdxResultCache import MdxResultCache
 from TM1py.Services.MessageLogService import MessageLogService
 from TM1py.Services.MonitoringService import MonitoringService
 from TM1py.Services.ObjectService import ObjectService
@@ -65,6 +71,7 @@ from TM1py.Services.RestService import RestService
 from TM1py.Services.SandboxService import SandboxService
 from TM1py.Services.SecurityService import SecurityService
 from TM1py.Services.ServerService import ServerService
+from TM1py.Services.SessionPool import SessionPool
 from TM1py.Services.SessionService import SessionService
 from TM1py.Services.SubsetService import SubsetService
 from TM1py.Services.ThreadService import ThreadService
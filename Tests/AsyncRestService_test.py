@@ -0,0 +1,111 @@
+import asyncio
+import configparser
+import unittest
+from pathlib import Path
+
+from TM1py import TM1Service
+from TM1py.Exceptions import TM1pyRestException
+from TM1py.Services.AsyncCellService import AsyncCellService
+from TM1py.Services.AsyncRestService import AsyncRestService
+from TM1py.Utils import run_async
+
+from .Utils import skip_if_no_pandas
+
+try:
+    import httpx  # noqa: F401
+
+    _has_httpx = True
+except ImportError:
+    _has_httpx = False
+
+
+@unittest.skipIf(not _has_httpx, "AsyncRestService requires httpx")
+class TestAsyncRestService(unittest.TestCase):
+    tm1: TM1Service
+
+    mdx = "SELECT {TM1SUBSETALL([}Groups])} ON COLUMNS FROM [}ClientGroups]"
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Establishes a connection to TM1 and creates TM! objects to use across all tests
+        """
+
+        # Connection to TM1
+        cls.config = configparser.ConfigParser()
+        cls.config.read(Path(__file__).parent.joinpath("config.ini"))
+        cls.tm1 = TM1Service(**cls.config["tm1srv01"])
+
+    def test_is_connected(self):
+        async def _is_connected():
+            async with AsyncRestService(rest_service=self.tm1.connection) as rest:
+                return await rest.is_connected()
+
+        self.assertTrue(asyncio.run(_is_connected()))
+
+    def test_create(self):
+        async def _create_and_get_version():
+            async with await AsyncRestService.create(**self.config["tm1srv01"]) as rest:
+                response = await rest.GET("/Configuration/ProductVersion/$value")
+                return response.text
+
+        self.assertEqual(self.tm1.version, asyncio.run(_create_and_get_version()))
+
+    def test_get_not_found(self):
+        async def _get():
+            async with AsyncRestService(rest_service=self.tm1.connection) as rest:
+                await rest.GET("/Processes('TM1py_Tests_Not_Existing_Process')")
+
+        with self.assertRaises(TM1pyRestException) as context:
+            asyncio.run(_get())
+        self.assertEqual(404, context.exception.status_code)
+
+    def test_shared_session_remains_active(self):
+        async def _get_version():
+            async with AsyncRestService(rest_service=self.tm1.connection) as rest:
+                return (await rest.GET("/Configuration/ProductVersion/$value")).text
+
+        asyncio.run(_get_version())
+        self.assertTrue(self.tm1.connection.is_connected())
+
+    def test_execute_mdx_values_concurrently(self):
+        expected_values = self.tm1.cells.execute_mdx_values(self.mdx)
+
+        async def _execute_mdx_values():
+            async with AsyncRestService(rest_service=self.tm1.connection) as rest:
+                cells = AsyncCellService(rest)
+                return await asyncio.gather(*[cells.execute_mdx_values(self.mdx) for _ in range(10)])
+
+        for values in asyncio.run(_execute_mdx_values()):
+            self.assertEqual(expected_values, values)
+
+    def test_execute_mdx(self):
+        expected_cells = self.tm1.cells.execute_mdx(self.mdx)
+
+        async def _execute_mdx():
+            async with AsyncRestService(rest_service=self.tm1.connection) as rest:
+                return await AsyncCellService(rest).execute_mdx(self.mdx)
+
+        self.assertEqual(expected_cells, asyncio.run(_execute_mdx()))
+
+    def test_execute_mdx_cellcount(self):
+        expected_count = self.tm1.cells.execute_mdx_cellcount(self.mdx)
+
+        async def _execute_mdx_cellcount():
+            async with AsyncRestService(rest_service=self.tm1.connection) as rest:
+                return await AsyncCellService(rest).execute_mdx_cellcount(self.mdx)
+
+        self.assertEqual(expected_count, asyncio.run(_execute_mdx_cellcount()))
+
+    @skip_if_no_pandas
+    def test_run_async_within_running_event_loop(self):
+        async def _execute_mdx_dataframe_async():
+            # blocking function that internally runs an event loop
+            return self.tm1.cells.execute_mdx_dataframe_async([self.mdx, self.mdx], max_workers=2)
+
+        df = run_async(_execute_mdx_dataframe_async())
+        self.assertFalse(df.empty)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tm1.logout()
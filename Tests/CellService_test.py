@@ -1,4 +1,7 @@
 import configparser
+import os
+import tempfile
+import time
 import unittest
 from pathlib import Path
 
@@ -10,7 +13,7 @@ from mdxpy import (
     Member,
 )
 
-from TM1py import Sandbox
+from TM1py import CellWriter, Sandbox, SessionPool
 from TM1py.Exceptions.Exceptions import (
     TM1pyException,
     TM1pyRestException,
@@ -39,6 +42,7 @@ from TM1py.Utils import (
 
 from .Utils import (
     skip_if_no_pandas,
+    skip_if_no_pyarrow,
     skip_if_version_higher_or_equal_than,
     skip_if_version_lower_than,
 )
@@ -48,6 +52,12 @@ try:
 except ImportError:
     pass
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pass
+
 
 class TestCellService(unittest.TestCase):
     tm1: TM1Service
@@ -527,6 +537,57 @@ class TestCellService(unittest.TestCase):
 
         self.assertEqual(self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()), [1234])
 
+    def test_write_use_ti_max_workers(self):
+        # exceeds the statements of one process, so that several processes are executed in parallel
+        cells = {
+            (f"Element {i}", f"Element {j}", f"Element {k}"): i * j + k
+            for i in range(1, 101)
+            for j in range(1, 101)
+            for k in range(1, 26)
+        }
+        self.tm1.cells.write(self.cube_name, cells, use_ti=True, max_workers=4)
+
+        query = MdxBuilder.from_cube(self.cube_name)
+        for coordinates in (("Element 1", "Element 1", "Element 1"), ("Element 100", "Element 100", "Element 25")):
+            query.add_member_tuple_to_columns(
+                *[f"[{dimension}].[{element}]" for dimension, element in zip(self.dimension_names, coordinates)]
+            )
+
+        self.assertEqual(self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()), [2, 10025])
+
+    def test_write_max_workers_without_use_ti(self):
+        cells = {("Element 1", "Element4", "Element9"): 1234}
+        with self.assertRaises(ValueError):
+            self.tm1.cells.write(self.cube_name, cells, max_workers=4)
+
+    def test_get_dimension_names_for_writing_from_metadata_cache(self):
+        self.tm1.cells.metadata_cache.invalidate()
+
+        dimension_names = self.tm1.cells.get_dimension_names_for_writing(self.cube_name)
+        self.assertEqual(self.dimension_names, dimension_names)
+        self.assertGreater(len(self.tm1.cells.metadata_cache), 0)
+        self.assertIs(self.tm1.cells.metadata_cache, self.tm1._tm1_rest.metadata_cache)
+
+        # served from the cache. Modifying the result doesn't alter the cache
+        dimension_names.append("Not A Dimension")
+        self.assertEqual(self.dimension_names, self.tm1.cells.get_dimension_names_for_writing(self.cube_name))
+
+    def test_metadata_cache_invalidated_on_cube_update(self):
+        cube_name = self.prefix + "Cube_Metadata_Cache"
+        if self.tm1.cubes.exists(cube_name):
+            self.tm1.cubes.delete(cube_name)
+
+        try:
+            self.tm1.cubes.create(Cube(cube_name, self.dimension_names))
+            self.assertEqual(self.dimension_names, self.tm1.cells.get_dimension_names_for_writing(cube_name))
+
+            self.tm1.cubes.delete(cube_name)
+            self.tm1.cubes.create(Cube(cube_name, self.dimension_names[::-1]))
+            self.assertEqual(self.dimension_names[::-1], self.tm1.cells.get_dimension_names_for_writing(cube_name))
+        finally:
+            if self.tm1.cubes.exists(cube_name):
+                self.tm1.cubes.delete(cube_name)
+
     def test_write_use_blob(self):
         cells = {("Element 1", "Element4", "Element9"): 1234}
         self.tm1.cells.write(self.cube_name, cells, use_blob=True, use_changeset=False)
@@ -540,6 +601,129 @@ class TestCellService(unittest.TestCase):
 
         self.assertEqual(self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()), [1234])
 
+    def test_write_use_blob_use_persistent_process(self):
+        cells = {("Element 1", "Element4", "Element9"): 4321}
+        self.tm1.cells.write(self.cube_name, cells, use_blob=True, use_persistent_process=True)
+        cells = {("Element 1", "Element4", "Element9"): 1}
+        self.tm1.cells.write(self.cube_name, cells, use_blob=True, use_persistent_process=True, increment=True)
+
+        query = MdxBuilder.from_cube(self.cube_name)
+        query.add_member_tuple_to_columns(
+            f"[{self.dimension_names[0]}].[Element 1]",
+            f"[{self.dimension_names[1]}].[Element 4]",
+            f"[{self.dimension_names[2]}].[Element 9]",
+        )
+
+        try:
+            self.assertEqual(self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()), [4322])
+            self.assertEqual(2, len(self.tm1.cells._blob_loader_processes))
+        finally:
+            for process_name in self.tm1.cells._blob_loader_processes:
+                self.tm1.processes.delete(process_name)
+            self.tm1.cells._blob_loader_processes.clear()
+
+    def test_write_use_blob_use_persistent_process_deleted_on_server(self):
+        cells = {("Element 1", "Element4", "Element9"): 1}
+        self.tm1.cells.write(self.cube_name, cells, use_blob=True, use_persistent_process=True)
+        for process_name in self.tm1.cells._blob_loader_processes:
+            self.tm1.processes.delete(process_name)
+
+        cells = {("Element 1", "Element4", "Element9"): 2}
+        self.tm1.cells.write(self.cube_name, cells, use_blob=True, use_persistent_process=True)
+
+        query = MdxBuilder.from_cube(self.cube_name)
+        query.add_member_tuple_to_columns(
+            f"[{self.dimension_names[0]}].[Element 1]",
+            f"[{self.dimension_names[1]}].[Element 4]",
+            f"[{self.dimension_names[2]}].[Element 9]",
+        )
+
+        try:
+            self.assertEqual(self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()), [2])
+        finally:
+            for process_name in self.tm1.cells._blob_loader_processes:
+                self.tm1.processes.delete(process_name)
+            self.tm1.cells._blob_loader_processes.clear()
+
+    def test_write_use_persistent_process_without_use_blob(self):
+        cells = {("Element 1", "Element4", "Element9"): 1}
+        with self.assertRaises(ValueError):
+            self.tm1.cells.write(self.cube_name, cells, use_persistent_process=True)
+
+    def test_cell_writer(self):
+        query = MdxBuilder.from_cube(self.cube_name)
+        query.add_member_tuple_to_columns(
+            f"[{self.dimension_names[0]}].[Element 1]",
+            f"[{self.dimension_names[1]}].[Element 5]",
+            f"[{self.dimension_names[2]}].[Element 9]",
+        )
+
+        with CellWriter(self.tm1.cells) as writer:
+            writer.write_value(1, self.cube_name, ("Element 1", "Element5", "Element9"))
+            writer.write_value(2, self.cube_name, ("ELEMENT 1", "Element 5", "element9"))
+            self.assertEqual(1, len(writer))
+            self.assertEqual([None], self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()))
+
+        self.assertEqual([2], self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()))
+
+    def test_cell_writer_failed_flush_keeps_updates(self):
+        writer = CellWriter(self.tm1.cells, ti_threshold=None, blob_threshold=None)
+        writer.write_value(1, self.cube_name, ("Element 1", "Not Existing Element", "Element9"))
+
+        with self.assertRaises(TM1pyException):
+            writer.flush()
+
+        self.assertEqual(1, len(writer))
+        self.assertEqual([self.cube_name], writer.pending_cubes())
+
+    def test_cell_writer_no_flush_on_exception(self):
+        query = MdxBuilder.from_cube(self.cube_name)
+        query.add_member_tuple_to_columns(
+            f"[{self.dimension_names[0]}].[Element 1]",
+            f"[{self.dimension_names[1]}].[Element 7]",
+            f"[{self.dimension_names[2]}].[Element 9]",
+        )
+
+        with self.assertRaises(RuntimeError):
+            with CellWriter(self.tm1.cells) as writer:
+                writer.write_value(1, self.cube_name, ("Element 1", "Element7", "Element9"))
+                raise RuntimeError()
+
+        self.assertEqual(1, len(writer))
+        self.assertEqual([None], self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()))
+
+    def test_cell_writer_increment_flush_by_size(self):
+        query = MdxBuilder.from_cube(self.cube_name)
+        query.add_member_tuple_to_columns(
+            f"[{self.dimension_names[0]}].[Element 1]",
+            f"[{self.dimension_names[1]}].[Element 6]",
+            f"[{self.dimension_names[2]}].[Element 9]",
+        )
+
+        writer = CellWriter(self.tm1.cells, increment=True, max_cells=2)
+        writer.write_value(1, self.cube_name, ("Element 1", "Element6", "Element9"))
+        writer.write_value(2, self.cube_name, ("Element 1", "Element6", "Element9"))
+        self.assertEqual([None], self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()))
+
+        writer.write_value(3, self.cube_name, ("Element 1", "Element6", "Element8"))
+        self.assertEqual(0, len(writer))
+        self.assertEqual([3], self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()))
+
+    def test_cell_writer_flush_by_age(self):
+        query = MdxBuilder.from_cube(self.cube_name)
+        query.add_member_tuple_to_columns(
+            f"[{self.dimension_names[0]}].[Element 1]",
+            f"[{self.dimension_names[1]}].[Element 8]",
+            f"[{self.dimension_names[2]}].[Element 9]",
+        )
+
+        with CellWriter(self.tm1.cells, max_age=0.5) as writer:
+            writer.write_value(4, self.cube_name, ("Element 1", "Element8", "Element9"))
+            # no further writes. The timer flushes the aged buffer
+            time.sleep(3)
+            self.assertEqual(0, len(writer))
+            self.assertEqual([4], self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()))
+
     def test_write_use_blob_allow_spread(self):
         cells = {
             ("Element 1", "Element4", "Element9"): 1,
@@ -1363,6 +1547,35 @@ class TestCellService(unittest.TestCase):
         values = self.tm1.cells.execute_mdx_values(query.to_mdx())
         self.assertEqual(["text1", "text3"], values)
 
+    @skip_if_no_pandas
+    def test_write_dataframe_use_blob_numeric_and_string_entries(self):
+        df = pd.DataFrame(
+            {
+                self.string_dimension_names[0]: ["d1e1", "d1e1", "d1e1", "d1e1", "d1e1"],
+                self.string_dimension_names[1]: ["d2e1", "d2e1", "d2e1", "d2e1", "d2e1"],
+                self.string_dimension_names[2]: ["d3e1", "d3e2", "d3e2", "n1", "n1"],
+                "Value": ["text1", "text2", "te\r\nxt3", 3.0, 4.0],
+            }
+        )
+        self.tm1.cells.write_dataframe(self.string_cube_name, df, use_blob=True)
+
+        query = MdxBuilder.from_cube(self.string_cube_name)
+        query = query.add_hierarchy_set_to_column_axis(
+            MdxHierarchySet.members(
+                [
+                    Member.of(self.string_dimension_names[2], "d3e1"),
+                    Member.of(self.string_dimension_names[2], "d3e2"),
+                    Member.of(self.string_dimension_names[2], "n1"),
+                ]
+            )
+        )
+        query = query.add_hierarchy_set_to_row_axis(
+            MdxHierarchySet.members([Member.of(self.string_dimension_names[1], "d2e1")])
+        )
+        query = query.add_member_to_where(Member.of(self.string_dimension_names[0], "d1e1"))
+        values = self.tm1.cells.execute_mdx_values(query.to_mdx())
+        self.assertEqual(["text1", "text3", 7], values)
+
     @skip_if_no_pandas
     def test_write_dataframe_async(self):
         df = pd.DataFrame(
@@ -1441,6 +1654,74 @@ class TestCellService(unittest.TestCase):
 
         self.assertEqual(list(df["Value"])[1:-1], values)
 
+    @skip_if_no_pandas
+    def test_write_dataframe_bulk(self):
+        df = pd.DataFrame(
+            {
+                self.dimension_names[0]: ["element 1", "element 1", "element 1"],
+                self.dimension_names[1]: ["element 1", "element 2", "element 3"],
+                self.dimension_names[2]: ["element 5", "element 5", "element 5"],
+                "Value": [1, 2, 3],
+            }
+        )
+        statistics = self.tm1.cells.write_dataframe_bulk(self.cube_name, df, rows_per_blob=2, max_workers=2)
+
+        self.assertEqual([0, 1], [partition["partition"] for partition in statistics])
+        self.assertEqual([2, 1], [partition["rows"] for partition in statistics])
+        self.assertEqual(["CompletedSuccessfully"] * 2, [partition["status"] for partition in statistics])
+
+        query = MdxBuilder.from_cube(self.cube_name)
+        query = query.add_hierarchy_set_to_column_axis(
+            MdxHierarchySet.member(Member.of(self.dimension_names[0], "element 1"))
+        )
+        query = query.add_hierarchy_set_to_row_axis(
+            MdxHierarchySet.members(
+                [
+                    Member.of(self.dimension_names[1], "element 1"),
+                    Member.of(self.dimension_names[1], "element 2"),
+                    Member.of(self.dimension_names[1], "element 3"),
+                ]
+            )
+        )
+        query = query.add_member_to_where(Member.of(self.dimension_names[2], "element 5"))
+        values = self.tm1.cells.execute_mdx_values(query.to_mdx())
+
+        self.assertEqual(list(df["Value"]), values)
+
+    @skip_if_no_pandas
+    def test_write_dataframe_bulk_minor_error(self):
+        df = pd.DataFrame(
+            {
+                self.dimension_names[0]: ["element 1", "element 1", "element 1", "element 1"],
+                self.dimension_names[1]: ["element 2", "element 2", "element 2", "element 2"],
+                self.dimension_names[2]: ["Not Existing", "element 2", "element 3", "element 4"],
+                "Value": [1, 2, 3, 4],
+            }
+        )
+
+        with self.assertRaises(TM1pyWritePartialFailureException) as ex:
+            self.tm1.cells.write_dataframe_bulk(self.cube_name, df, rows_per_blob=2, sum_numeric_duplicates=False)
+        self.assertEqual(1, ex.exception.attempts)
+        self.assertEqual(["HasMinorErrors"], ex.exception.statuses)
+
+        query = MdxBuilder.from_cube(self.cube_name)
+        query = query.add_hierarchy_set_to_column_axis(
+            MdxHierarchySet.member(Member.of(self.dimension_names[0], "element 1"))
+        )
+        query = query.add_hierarchy_set_to_row_axis(
+            MdxHierarchySet.members(
+                [
+                    Member.of(self.dimension_names[2], "element 2"),
+                    Member.of(self.dimension_names[2], "element 3"),
+                    Member.of(self.dimension_names[2], "element 4"),
+                ]
+            )
+        )
+        query = query.add_member_to_where(Member.of(self.dimension_names[1], "element 2"))
+        values = self.tm1.cells.execute_mdx_values(query.to_mdx())
+
+        self.assertEqual(list(df["Value"])[1:], values)
+
     @skip_if_no_pandas
     def test_write_dataframe_error(self):
         df = pd.DataFrame(
@@ -1482,6 +1763,35 @@ class TestCellService(unittest.TestCase):
 
         self.assertEqual(list(cells.values()), values)
 
+    def test_write_async_with_session_pool(self):
+        cells = {
+            ("element 1", "element 1", "element 5"): 4.59,
+            ("element 1", "element 2", "element 5"): 5.87,
+            ("element 1", "element 3", "element 5"): 6.12,
+        }
+
+        with SessionPool(size=3, **self.config["tm1srv01"]) as session_pool:
+            self.tm1.cells.write_async(self.cube_name, cells, 1, 3, session_pool=session_pool)
+
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .add_hierarchy_set_to_column_axis(MdxHierarchySet.member(Member.of(self.dimension_names[0], "element 1")))
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.members(
+                    [
+                        Member.of(self.dimension_names[1], "element 1"),
+                        Member.of(self.dimension_names[1], "element 2"),
+                        Member.of(self.dimension_names[1], "element 3"),
+                    ]
+                )
+            )
+            .add_member_to_where(Member.of(self.dimension_names[2], "element 5"))
+            .to_mdx()
+        )
+        values = self.tm1.cells.execute_mdx_values(mdx)
+
+        self.assertEqual(list(cells.values()), values)
+
     @skip_if_no_pandas
     def test_write_async_minor_errors(self):
         cells = {
@@ -1705,6 +2015,129 @@ class TestCellService(unittest.TestCase):
     def test_execute_mdx_async(self):
         self.run_test_execute_mdx(max_workers=4)
 
+    def run_test_execute_mdx_partitioned(self, partitions: int, skip_zeros: bool = False):
+        self.tm1.cells.write_values(self.cube_name, self.cellset)
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+        expected = self.tm1.cells.execute_mdx(mdx, skip_zeros=skip_zeros, skip_cell_properties=True)
+
+        data = self.tm1.cells.execute_mdx_partitioned(
+            mdx, partitions=partitions, max_workers=4, skip_zeros=skip_zeros, skip_cell_properties=True
+        )
+
+        # same cells in the same (ordinal) order
+        self.assertEqual(list(expected.items()), list(data.items()))
+        self.assertEqual(self.total_value, sum(v for v in data.values() if v))
+
+    def test_execute_mdx_partitioned(self):
+        self.run_test_execute_mdx_partitioned(partitions=4)
+
+    def test_execute_mdx_partitioned_more_partitions_than_rows(self):
+        self.run_test_execute_mdx_partitioned(partitions=500)
+
+    def test_execute_mdx_partitioned_skip_zeros(self):
+        self.run_test_execute_mdx_partitioned(partitions=4, skip_zeros=True)
+
+    @skip_if_no_pandas
+    def test_execute_mdx_dataframe_partitioned(self):
+        self.tm1.cells.write_values(self.cube_name, self.cellset)
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+
+        df = self.tm1.cells.execute_mdx_dataframe_partitioned(mdx, partitions=4, max_workers=4)
+
+        self.assertEqual(len(self.target_coordinates), len(df))
+        self.assertEqual(self.total_value, df["Values"].sum())
+        self.assertEqual(list(self.dimension_names), list(df.columns[:-1]))
+
+    @skip_if_no_pandas
+    def test_execute_mdx_dataframe_parallel(self):
+        self.tm1.cells.write_values(self.cube_name, self.cellset)
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+        )
+
+        df = self.tm1.cells.execute_mdx_dataframe(mdx, parallel=4)
+
+        self.assertEqual(len(self.target_coordinates), len(df))
+        self.assertEqual(self.total_value, df["Value"].sum())
+        pd.testing.assert_frame_equal(
+            self.tm1.cells.execute_mdx_dataframe(mdx).sort_values(list(df.columns)).reset_index(drop=True),
+            df.sort_values(list(df.columns)).reset_index(drop=True),
+        )
+
+    @skip_if_no_pandas
+    def test_execute_mdx_dataframe_parallel_with_session_pool(self):
+        self.tm1.cells.write_values(self.cube_name, self.cellset)
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+        )
+
+        with SessionPool(size=4, **self.config["tm1srv01"]) as session_pool:
+            df = self.tm1.cells.execute_mdx_dataframe(mdx, parallel=4, session_pool=session_pool)
+
+        self.assertEqual(len(self.target_coordinates), len(df))
+        self.assertEqual(self.total_value, df["Value"].sum())
+
+    @skip_if_no_pandas
+    def test_execute_mdx_dataframe_parallel_with_mdx_string(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+        )
+
+        with self.assertRaises(ValueError):
+            self.tm1.cells.execute_mdx_dataframe(mdx.to_mdx(), parallel=4)
+
     def run_test_execute_mdx_top(self, max_workers=1):
         # write cube content
         self.tm1.cells.write_values(self.cube_name, self.cellset)
@@ -2397,6 +2830,95 @@ class TestCellService(unittest.TestCase):
                     self.assertNotIn("UniqueName", member)
                     self.assertNotIn("Ordinal", member)
 
+    def test_execute_mdx_values_result_cache(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .add_member_tuple_to_columns(
+                Member.of(self.dimension_names[0], "Element1"),
+                Member.of(self.dimension_names[1], "Element1"),
+                Member.of(self.dimension_names[2], "Element1"),
+            )
+            .to_mdx()
+        )
+        cache = self.tm1.cells.enable_result_cache(max_entries=8)
+        try:
+            self.tm1.cells.write_value(1, self.cube_name, ("Element1", "Element1", "Element1"))
+            self.assertEqual([1], self.tm1.cells.execute_mdx_values(mdx))
+            # whitespace doesn't matter
+            self.assertEqual([1], self.tm1.cells.execute_mdx_values(mdx.replace(" ", "  ")))
+            self.assertEqual(1, cache.hits)
+
+            # writes change the last data update of the cube
+            self.tm1.cells.write_value(2, self.cube_name, ("Element1", "Element1", "Element1"))
+            self.assertEqual([2], self.tm1.cells.execute_mdx_values(mdx))
+            self.assertEqual(1, cache.hits)
+        finally:
+            self.tm1.cells.disable_result_cache()
+
+    def test_execute_view_result_cache_on_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = self.tm1.cells.enable_result_cache(path=directory)
+            try:
+                first = self.tm1.cells.execute_view_values(self.cube_name, self.view_name, private=False)
+                second = self.tm1.cells.execute_view_values(self.cube_name, self.view_name, private=False)
+            finally:
+                self.tm1.cells.disable_result_cache()
+
+            self.assertEqual(first, second)
+            self.assertEqual(1, cache.hits)
+            self.assertEqual(1, len(cache))
+
+    def test_execute_mdx_values_result_cache_cross_cube_reference(self):
+        d0, d1, d2 = self.dimension_names
+        coordinates = ("Element4", "Element1", "Element1")
+        mdx = f"""
+        WITH MEMBER [{d0}].[{d0}].[Other] AS
+        '[{self.cube_with_rules_name}].([{d0}].[{d0}].[Element4],[{d1}].[{d1}].[Element1],[{d2}].[{d2}].[Element1])'
+        SELECT {{[{d0}].[{d0}].[Other]}} ON 0, {{[{d1}].[{d1}].[Element1]}} ON 1
+        FROM [{self.cube_name}]
+        WHERE ([{d2}].[{d2}].[Element1])
+        """
+        cache = self.tm1.cells.enable_result_cache(max_entries=8)
+        try:
+            self.tm1.cells.write_value(1, self.cube_with_rules_name, coordinates)
+            self.assertEqual([1], self.tm1.cells.execute_mdx_values(mdx))
+            self.assertEqual([1], self.tm1.cells.execute_mdx_values(mdx))
+            self.assertEqual(1, cache.hits)
+
+            # writes to the referenced cube invalidate the result
+            self.tm1.cells.write_value(2, self.cube_with_rules_name, coordinates)
+            self.assertEqual([2], self.tm1.cells.execute_mdx_values(mdx))
+            self.assertEqual(1, cache.hits)
+        finally:
+            self.tm1.cells.disable_result_cache()
+            self.tm1.cells.write_value(0, self.cube_with_rules_name, coordinates)
+
+    def test_execute_mdx_values_result_cache_sandbox(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .add_member_tuple_to_columns(
+                Member.of(self.dimension_names[0], "Element1"),
+                Member.of(self.dimension_names[1], "Element1"),
+                Member.of(self.dimension_names[2], "Element1"),
+            )
+            .to_mdx()
+        )
+        cache = self.tm1.cells.enable_result_cache(max_entries=8)
+        try:
+            self.tm1.cells.execute_mdx_values(mdx, sandbox_name=self.sandbox_name)
+            self.tm1.cells.execute_mdx_values(mdx, sandbox_name=self.sandbox_name)
+            self.assertEqual(0, cache.hits)
+            self.assertEqual(0, len(cache))
+        finally:
+            self.tm1.cells.disable_result_cache()
+
+    @unittest.skipIf(not hasattr(os, "getuid"), "file ownership is not checked on Windows")
+    def test_result_cache_rejects_shared_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            os.chmod(directory, 0o777)
+            with self.assertRaises(PermissionError):
+                self.tm1.cells.enable_result_cache(path=directory)
+
     def test_execute_mdx_values(self):
         self.tm1.cells.write_values(self.cube_name, self.cellset)
 
@@ -2542,6 +3064,83 @@ class TestCellService(unittest.TestCase):
         # check if sum of retrieved values is sum of written values
         self.assertEqual(self.total_value, sum(values))
 
+    def test_execute_mdx_iter(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+
+        cells = list(self.tm1.cells.execute_mdx_iter(mdx))
+
+        coordinates = {coordinates for coordinates, _ in cells}
+        self.assertEqual(len(self.target_coordinates), len(coordinates))
+        self.assertTrue(coordinates.issubset(self.target_coordinates))
+        self.assertEqual(self.total_value, sum(value for _, value in cells))
+
+    def test_execute_mdx_iter_batch_size(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+
+        batches = list(self.tm1.cells.execute_mdx_iter(mdx, batch_size=30))
+
+        self.assertEqual([30, 30, 30, 10], [len(batch) for batch in batches])
+        self.assertEqual(self.total_value, sum(value for batch in batches for _, value in batch))
+
+    def test_execute_mdx_iter_element_unique_names(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_member_to_where(Member.of(self.dimension_names[2], "Element 1"))
+            .to_mdx()
+        )
+
+        coordinates, value = next(self.tm1.cells.execute_mdx_iter(mdx, element_unique_names=True))
+
+        self.assertEqual(
+            (
+                f"[{self.dimension_names[0]}].[{self.dimension_names[0]}].[Element 1]",
+                f"[{self.dimension_names[1]}].[{self.dimension_names[1]}].[Element 1]",
+            ),
+            coordinates,
+        )
+        self.assertEqual(1, value)
+
+    def test_execute_view_iter(self):
+        cells = list(self.tm1.cells.execute_view_iter(cube_name=self.cube_name, view_name=self.view_name))
+
+        coordinates = {coordinates for coordinates, _ in cells}
+        self.assertEqual(len(self.target_coordinates), len(coordinates))
+        self.assertTrue(coordinates.issubset(self.target_coordinates))
+        self.assertEqual(self.total_value, sum(value for _, value in cells))
+
     def test_execute_mdx_csv_use_iterative_json(self):
         mdx = (
             MdxBuilder.from_cube(self.cube_name)
@@ -2756,6 +3355,64 @@ class TestCellService(unittest.TestCase):
         # check if sum of retrieved values is sum of written values
         self.assertEqual(self.total_value, sum(values))
 
+    def test_execute_mdx_csv_use_blob_partitions(self):
+        query = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+        )
+        csv = self.tm1.cells.execute_mdx_csv(query, use_blob=True, partitions=4)
+
+        # header only once
+        lines = csv.replace('"', "").split("\r\n")
+        self.assertEqual(",".join(self.dimension_names + ["Value"]), lines[0])
+        self.assertNotIn(lines[0], lines[1:])
+
+        records = [record for record in lines[1:] if record != ""]
+        coordinates = {tuple(record.lower().split(",")[0:3]) for record in records}
+        self.assertEqual(len(coordinates), len(self.target_coordinates))
+        self.assertEqual(self.total_value, sum(float(record.split(",")[3]) for record in records))
+
+    def test_execute_mdx_csv_partitions_without_use_blob(self):
+        query = MdxBuilder.from_cube(self.cube_name).add_hierarchy_set_to_column_axis(
+            MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+        )
+        with self.assertRaises(ValueError):
+            self.tm1.cells.execute_mdx_csv(query, partitions=4)
+
+    def test_execute_mdx_csv_use_blob_compression(self):
+        query = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+        )
+
+        self.assertEqual(
+            self.tm1.cells.execute_mdx_csv(query, use_blob=True),
+            self.tm1.cells.execute_mdx_csv(query, use_blob=True, compression="gzip"),
+        )
+
+    def test_execute_mdx_csv_compression_without_use_blob(self):
+        query = MdxBuilder.from_cube(self.cube_name).add_hierarchy_set_to_column_axis(
+            MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+        )
+
+        with self.assertRaises(ValueError):
+            self.tm1.cells.execute_mdx_csv(query, compression="gzip")
+
     def test_execute_mdx_csv_use_blob_pass_mdx_as_str(self):
         query = (
             MdxBuilder.from_cube(self.cube_name)
@@ -3337,6 +3994,131 @@ class TestCellService(unittest.TestCase):
         )
         self.assertEqual(expected_df.to_csv(), df.to_csv())
 
+    @skip_if_no_pandas
+    def test_execute_mdx_dataframe_use_vectorized(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+        expected_df = self.tm1.cells.execute_mdx_dataframe(mdx)
+
+        df = self.tm1.cells.execute_mdx_dataframe(mdx, use_vectorized=True)
+
+        self.assertEqual(expected_df.to_csv(), df.to_csv())
+        self.assertEqual(self.total_value, df["Value"].sum())
+
+    @skip_if_no_pandas
+    def test_execute_view_dataframe_use_vectorized_shaped(self):
+        expected_df = self.tm1.cells.execute_view_dataframe(self.cube_name, self.view_name, private=False, shaped=True)
+
+        df = self.tm1.cells.execute_view_dataframe(
+            self.cube_name, self.view_name, private=False, shaped=True, use_vectorized=True
+        )
+
+        self.assertEqual(expected_df.to_csv(), df.to_csv())
+
+    @skip_if_no_pyarrow
+    def test_execute_mdx_arrow(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+
+        table = self.tm1.cells.execute_mdx_arrow(mdx)
+
+        self.assertEqual(list(self.dimension_names) + ["Value"], table.column_names)
+        self.assertTrue(pa.types.is_dictionary(table.schema.field(self.dimension_names[0]).type))
+        self.assertEqual(len(self.target_coordinates), table.num_rows)
+        coordinates = set(zip(*[table.column(dimension).to_pylist() for dimension in self.dimension_names]))
+        self.assertEqual(set(self.target_coordinates), coordinates)
+        self.assertEqual(self.total_value, sum(table.column("Value").to_pylist()))
+
+    @skip_if_no_pyarrow
+    def test_execute_view_arrow(self):
+        table = self.tm1.cells.execute_view_arrow(cube_name=self.cube_name, view_name=self.view_name, private=False)
+
+        self.assertEqual(len(self.target_coordinates), table.num_rows)
+        self.assertEqual(self.total_value, sum(table.column("Value").to_pylist()))
+
+    @skip_if_no_pyarrow
+    def test_execute_mdx_to_parquet(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("cells.parquet")
+            number_rows = self.tm1.cells.execute_mdx_to_parquet(mdx, path=str(path), row_group_size=30)
+
+            parquet_file = pq.ParquetFile(path)
+            self.assertEqual(len(self.target_coordinates), number_rows)
+            self.assertEqual(4, parquet_file.metadata.num_row_groups)
+            table = parquet_file.read()
+
+        self.assertEqual(list(self.dimension_names) + ["Value"], table.column_names)
+        self.assertEqual(self.total_value, sum(table.column("Value").to_pylist()))
+
+    @skip_if_no_pyarrow
+    def test_execute_mdx_to_parquet_string_cells_after_first_row_group(self):
+        mdx = f"""
+        SELECT
+        {{[{self.string_dimension_names[2]}].[n1], [{self.string_dimension_names[2]}].[d3e1]}} ON COLUMNS,
+        {{[{self.string_dimension_names[0]}].[d1e1]}} * {{[{self.string_dimension_names[1]}].[d2e1]}} ON ROWS
+        FROM [{self.string_cube_name}]
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("cells.parquet")
+            number_rows = self.tm1.cells.execute_mdx_to_parquet(mdx, path=str(path), row_group_size=1, skip_zeros=False)
+            table = pq.read_table(path)
+
+        self.assertEqual(2, number_rows)
+        self.assertEqual(pa.string(), table.schema.field("Value").type)
+        self.assertEqual("String1", table.column("Value").to_pylist()[1])
+
+    @skip_if_no_pyarrow
+    def test_execute_view_to_parquet(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("cells.parquet")
+            number_rows = self.tm1.cells.execute_view_to_parquet(
+                cube_name=self.cube_name, view_name=self.view_name, path=str(path), private=False
+            )
+            table = pq.read_table(path)
+
+        self.assertEqual(len(self.target_coordinates), number_rows)
+        self.assertEqual(self.total_value, sum(table.column("Value").to_pylist()))
+
     @skip_if_no_pandas
     def test_execute_mdx_dataframe_async_max_workers_2(self):
         self.run_test_execute_mdx_dataframe_async(max_workers=2)
@@ -3349,7 +4131,13 @@ class TestCellService(unittest.TestCase):
     def test_execute_mdx_dataframe_async_max_workers_8(self):
         self.run_test_execute_mdx_dataframe_async(max_workers=8)
 
-    def run_test_execute_mdx_dataframe_async(self, max_workers):
+    @skip_if_no_pandas
+    def test_execute_mdx_dataframe_async_with_session_pool(self):
+        with SessionPool(size=2, **self.config["tm1srv01"]) as session_pool:
+            self.run_test_execute_mdx_dataframe_async(max_workers=4, session_pool=session_pool)
+            self.assertEqual(2, len(session_pool))
+
+    def run_test_execute_mdx_dataframe_async(self, max_workers, session_pool=None):
         # build a reference "single-threaded" df for comparison
         mdx = (
             MdxBuilder.from_cube(self.cube_name)
@@ -3388,7 +4176,9 @@ class TestCellService(unittest.TestCase):
             )
             mdx_list.append(mdx)
         # check execution with different max_worker parameter
-        df_async = self.tm1.cells.execute_mdx_dataframe_async(mdx_list, max_workers=max_workers)
+        df_async = self.tm1.cells.execute_mdx_dataframe_async(
+            mdx_list, max_workers=max_workers, session_pool=session_pool
+        )
         # check type
         self.assertIsInstance(df_async, pd.DataFrame)
         # check async df are equal to reference df
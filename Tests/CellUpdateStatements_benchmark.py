@@ -0,0 +1,75 @@
+"""Compare the per-cell and the columnar builder for TI statements used by `write_through_unbound_process`.
+Runs offline, no TM1 connection required:
+
+    python -m Tests.CellUpdateStatements_benchmark 500000
+"""
+
+import random
+import sys
+import time
+
+import pandas as pd
+
+from TM1py.Services import CellService
+from TM1py.Utils import (
+    CaseAndSpaceInsensitiveDict,
+    CaseAndSpaceInsensitiveTuplesDict,
+    build_cell_update_statements_from_dataframe,
+)
+
+
+def build_cellset(number_of_cells: int) -> CaseAndSpaceInsensitiveTuplesDict:
+    random.seed(0)
+    cells = CaseAndSpaceInsensitiveTuplesDict()
+    for n in range(number_of_cells):
+        measure = "Comment" if n % 10 == 0 else "Sales"
+        value = f"Comment's {n}" if measure == "Comment" else random.random() * 1e6
+        cells[(f"Version {n % 3}", f"Product {n // 1000}", f"Region {n % 1000}", measure)] = value
+    return cells
+
+
+def measure(name: str, func, *args, **kwargs):
+    start = time.perf_counter()
+    statements = func(*args, **kwargs)
+    print(f"{name:<24}{time.perf_counter() - start:>8.2f}s {len(statements):>12,} statements")
+    return statements
+
+
+def main(number_of_cells: int):
+    cells = build_cellset(number_of_cells)
+    measure_dimension_elements = CaseAndSpaceInsensitiveDict({"Sales": "Numeric", "Comment": "String"})
+
+    per_cell = measure(
+        "per-cell",
+        CellService._build_cell_update_statements,
+        cube_name="Sales",
+        cellset_as_dict=cells,
+        increment=False,
+        measure_dimension_elements=measure_dimension_elements,
+    )
+    columnar = measure(
+        "columnar",
+        CellService._build_cell_update_statements_vectorized,
+        cube_name="Sales",
+        cellset_as_dict=cells,
+        increment=False,
+        measure_dimension_elements=measure_dimension_elements,
+    )
+
+    # without the conversion of the cellset, e.g. when writing a DataFrame
+    data = pd.DataFrame([(*coordinates, value) for coordinates, value in cells.items()])
+    measure(
+        "columnar (DataFrame)",
+        build_cell_update_statements_from_dataframe,
+        data,
+        cube_name="Sales",
+        measure_dimension_elements=measure_dimension_elements,
+    )
+
+    # statements only differ in the rendering of integral numbers (e.g. '3.0' vs. '3')
+    mismatches = sum(a != b for a, b in zip(per_cell, columnar))
+    print(f"{mismatches:,} statements differ")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
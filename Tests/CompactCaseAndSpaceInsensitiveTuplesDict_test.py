@@ -0,0 +1,177 @@
+import unittest
+
+from TM1py.Utils.Utils import (
+    CaseAndSpaceInsensitiveTuplesDict,
+    CompactCaseAndSpaceInsensitiveTuplesDict,
+    build_cellset_from_pandas_dataframe,
+    build_content_from_cellset_dict,
+)
+
+from .Utils import skip_if_no_pandas
+
+try:
+    import pandas as pd
+except ImportError:
+    pass
+
+
+class TestCompactCaseAndSpaceInsensitiveTuplesDict(unittest.TestCase):
+
+    def setUp(self):
+        self.map = CompactCaseAndSpaceInsensitiveTuplesDict()
+        self.map[("Elem1", "Elem1")] = "Value1"
+        self.map[("Elem1", "Elem2")] = 2
+        self.map[("Elem1", "Elem3")] = 3
+
+    def tearDown(self):
+        del self.map
+
+    def test_is_case_and_space_insensitive_tuples_dict(self):
+        self.assertIsInstance(self.map, CaseAndSpaceInsensitiveTuplesDict)
+
+    def test_get_item(self):
+        self.assertEqual(self.map[("ELEM1", "ELEM1")], "Value1")
+        self.assertEqual(self.map[("elem1", "e l e m 2")], 2)
+        self.assertEqual(self.map[("e l e M 1", "elem3")], 3)
+
+    def test_keyerror_on_nonexistent_key(self):
+        with self.assertRaises(KeyError):
+            _ = self.map[("NonExistent", "Key")]
+        with self.assertRaises(KeyError):
+            _ = self.map[("Elem1", "Elem1", "Elem1")]
+        with self.assertRaises(KeyError):
+            _ = self.map[("Elem1",)]
+
+    def test_type_error_on_invalid_key(self):
+        with self.assertRaises(TypeError):
+            self.map["Elem1"] = 1
+        with self.assertRaises(TypeError):
+            self.map[("Elem1", 2)] = 1
+
+    def test_set_item(self):
+        self.map[("E L E M 1", "E L E M 2")] = 3
+        self.assertEqual(self.map[("Elem1", "Elem2")], 3)
+        self.assertEqual(len(self.map), 3)
+
+        self.map[("Elem4", "Elem5")] = 5
+        self.assertEqual(len(self.map), 4)
+        self.assertEqual(self.map[("Elem4", "Elem5")], 5)
+
+    def test_set_item_remembers_last_case(self):
+        self.map[("ELEM 1", "Elem1")] = 1
+
+        self.assertEqual([("ELEM 1", "Elem1"), ("ELEM 1", "Elem2"), ("ELEM 1", "Elem3")], self.map.keys())
+        self.assertEqual(self.map[("Elem1", "Elem1")], 1)
+
+    def test_keys_of_different_lengths(self):
+        self.map[("Elem1",)] = 1
+        self.map[("Elem1", "Elem1", "Elem1")] = 3
+
+        self.assertEqual(len(self.map), 5)
+        self.assertEqual(self.map[("elem1",)], 1)
+        self.assertEqual(self.map[("Elem1", "Elem1")], "Value1")
+        self.assertEqual(self.map[("elem1", "elem1", "elem1")], 3)
+
+    def test_delete_item(self):
+        del self.map[("El em1", "ELEM1")]
+        del self.map[("El em1", "E L E M 2")]
+
+        self.assertNotIn(("Elem1", "Elem1"), self.map)
+        self.assertNotIn(("Elem1", "Elem2"), self.map)
+        self.assertIn(("Elem1", "Elem3"), self.map)
+        with self.assertRaises(KeyError):
+            del self.map[("Elem1", "Elem1")]
+
+    def test_contains(self):
+        self.assertIn(("Elem1", "Elem1"), self.map)
+        self.assertIn((" e l e m 1 ", " elem 3 "), self.map)
+        self.assertNotIn(("Elem2", "Elem1"), self.map)
+        self.assertNotIn(("NonExistent", "Key"), self.map)
+
+    def test_equality(self):
+        other_map = CaseAndSpaceInsensitiveTuplesDict(
+            {("Elem 1", "Elem1"): "Value1", ("ELEM 1", "E L E M 2"): 2, (" Elem1 ", "Elem 3"): 3}
+        )
+        self.assertEqual(self.map, other_map)
+        self.assertEqual(other_map, self.map)
+
+        other_map[("Elem1", "Elem3")] = 4
+        self.assertNotEqual(self.map, other_map)
+
+    def test_keys_values_items(self):
+        self.assertEqual([("Elem1", "Elem1"), ("Elem1", "Elem2"), ("Elem1", "Elem3")], self.map.keys())
+        self.assertEqual(["Value1", 2, 3], self.map.values())
+        self.assertEqual(
+            [(("Elem1", "Elem1"), "Value1"), (("Elem1", "Elem2"), 2), (("Elem1", "Elem3"), 3)], self.map.items()
+        )
+
+    def test_adjusted_keys(self):
+        expected_keys = [("elem1", "elem1"), ("elem1", "elem2"), ("elem1", "elem3")]
+        self.assertEqual(expected_keys, list(self.map.adjusted_keys()))
+
+    def test_adjusted_items(self):
+        expected_items = {("elem1", "elem1"): "Value1", ("elem1", "elem2"): 2, ("elem1", "elem3"): 3}
+        self.assertEqual(expected_items, dict(self.map.adjusted_items()))
+
+    def test_copy(self):
+        copy_map = self.map.copy()
+        copy_map[("Elem4", "Elem4")] = 4
+
+        self.assertIsInstance(copy_map, CompactCaseAndSpaceInsensitiveTuplesDict)
+        self.assertEqual(4, len(copy_map))
+        self.assertEqual(3, len(self.map))
+        self.assertNotIn(("Elem4", "Elem4"), self.map)
+
+    def test_pop_and_popitem(self):
+        self.assertEqual(2, self.map.pop(("elem1", "elem2")))
+        self.assertEqual("default", self.map.pop(("elem1", "elem2"), "default"))
+        self.assertEqual((("Elem1", "Elem3"), 3), self.map.popitem())
+        self.assertEqual(1, len(self.map))
+
+    def test_clear(self):
+        self.map.clear()
+
+        self.assertEqual(0, len(self.map))
+        self.assertNotIn(("Elem1", "Elem1"), self.map)
+
+    def test_build_content_from_cellset_dict(self):
+        raw_cellset = {
+            "Cube": {"Dimensions": [{"Name": "d1"}, {"Name": "d2"}]},
+            "Axes": [
+                {
+                    "Ordinal": 0,
+                    "Cardinality": 2,
+                    "Tuples": [
+                        {"Members": [{"UniqueName": "[d2].[d2].[e1]"}]},
+                        {"Members": [{"UniqueName": "[d2].[d2].[e2]"}]},
+                    ],
+                },
+                {
+                    "Ordinal": 1,
+                    "Cardinality": 1,
+                    "Tuples": [{"Members": [{"UniqueName": "[d1].[d1].[e1]"}]}],
+                },
+            ],
+            "Cells": [{"Value": 1}, {"Value": 2}],
+        }
+
+        content = build_content_from_cellset_dict(raw_cellset, skip_cell_properties=True, compact_keys=True)
+
+        self.assertIsInstance(content, CompactCaseAndSpaceInsensitiveTuplesDict)
+        self.assertEqual(build_content_from_cellset_dict(raw_cellset, skip_cell_properties=True), content)
+        self.assertEqual(2, content[("[d1].[d1].[e1]", "[d2].[d2].[E 2]")])
+
+    @skip_if_no_pandas
+    def test_build_cellset_from_pandas_dataframe(self):
+        df = pd.DataFrame({"d1": ["e1", "e1", "E 1"], "d2": ["e1", "e2", "e1"], "Value": [1.0, 2.0, 3.0]})
+
+        cellset = build_cellset_from_pandas_dataframe(df, sum_numeric_duplicates=False, compact_keys=True)
+
+        self.assertIsInstance(cellset, CompactCaseAndSpaceInsensitiveTuplesDict)
+        self.assertEqual(2, len(cellset))
+        self.assertEqual(3.0, cellset[("e1", "e1")])
+        self.assertEqual(2.0, cellset[("e1", "e2")])
+
+
+if __name__ == "__main__":
+    unittest.main()
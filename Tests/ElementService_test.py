@@ -9,7 +9,7 @@ from mdxpy import MdxBuilder
 from Tests.Utils import skip_if_no_pandas, skip_if_version_lower_than
 from TM1py.Exceptions import TM1pyException, TM1pyRestException
 from TM1py.Objects import Dimension, Element, ElementAttribute, Hierarchy
-from TM1py.Services import TM1Service
+from TM1py.Services import ElementService, TM1Service
 
 
 class TestElementService(unittest.TestCase):
@@ -1070,6 +1070,22 @@ class TestElementService(unittest.TestCase):
         self.assertEqual(element1, self.tm1.elements.get(self.dimension_name, self.dimension_name, element1.name))
         self.assertEqual(element2, self.tm1.elements.get(self.dimension_name, self.dimension_name, element2.name))
 
+    def test_add_elements_and_edges_use_blob(self):
+        consolidation = Element(name="Consolidation", element_type="Consolidated")
+        element1 = Element(name="Element1", element_type="Numeric")
+        element2 = Element(name="Element2", element_type="String")
+        self.tm1.elements.add_elements(
+            self.dimension_name, self.dimension_name, [consolidation, element1, element2], use_blob=True
+        )
+
+        edges = {(consolidation.name, element1.name): 2}
+        self.tm1.elements.add_edges(self.dimension_name, self.hierarchy_name, edges, use_blob=True)
+
+        self.assertEqual(element1, self.tm1.elements.get(self.dimension_name, self.dimension_name, element1.name))
+        self.assertEqual(element2, self.tm1.elements.get(self.dimension_name, self.dimension_name, element2.name))
+        all_edges = self.tm1.elements.get_edges(self.dimension_name, self.dimension_name)
+        self.assertEqual(2, all_edges[consolidation.name, element1.name])
+
     def test_add_elements_fail(self):
         with self.assertRaises(TM1pyRestException) as _:
             element = Element(self.years[0], "Numeric")
@@ -1458,6 +1474,146 @@ class TestElementService(unittest.TestCase):
                 method="TI",
             )
 
+    def test_get_ancestors_bulk(self):
+        ancestors = self.tm1.elements.get_ancestors_bulk(
+            self.dimension_name,
+            self.hierarchy_name,
+            ["1989", "1990", "Total Years", "All Consolidations", "NotExisting"],
+        )
+
+        self.assertEqual(["Total Years", "All Consolidations"], ancestors["1989"])
+        self.assertEqual(["Total Years", "All Consolidations"], ancestors["1 9 9 0"])
+        self.assertEqual(["All Consolidations"], ancestors["TOTAL YEARS"])
+        self.assertEqual([], ancestors["All Consolidations"])
+        self.assertEqual([], ancestors["NotExisting"])
+
+    def test_get_ancestors_bulk_not_recursive(self):
+        ancestors = self.tm1.elements.get_ancestors_bulk(
+            self.dimension_name, self.hierarchy_name, self.years, recursive=False
+        )
+
+        self.assertEqual(len(self.years), len(ancestors))
+        for year in self.years:
+            self.assertEqual(["Total Years"], ancestors[year])
+
+    def test_get_leaves_bulk(self):
+        leaves = self.tm1.elements.get_leaves_bulk(
+            self.dimension_name, self.hierarchy_name, ["All Consolidations", "Total Years", "1989", "NotExisting"]
+        )
+
+        self.assertEqual(set(self.years), set(leaves["All Consolidations"]))
+        self.assertEqual(
+            set(
+                self.tm1.elements.get_leaves_under_consolidation(
+                    self.dimension_name, self.hierarchy_name, "Total Years"
+                )
+            ),
+            set(leaves["totalyears"]),
+        )
+        self.assertEqual(["1989"], leaves["1989"])
+        self.assertEqual([], leaves["NotExisting"])
+
+    def test_get_ancestors_and_leaves_bulk_with_cache(self):
+        self.tm1.elements.enable_cache(ttl=600)
+        try:
+            ancestors = self.tm1.elements.get_ancestors_bulk(
+                self.dimension_name, self.hierarchy_name, ["1989", "All Consolidations", "NotExisting"]
+            )
+            leaves = self.tm1.elements.get_leaves_bulk(
+                self.dimension_name, self.hierarchy_name, ["All Consolidations", "1989", "NotExisting"]
+            )
+        finally:
+            self.tm1.elements.disable_cache()
+
+        self.assertEqual(["Total Years", "All Consolidations"], ancestors["1989"])
+        self.assertEqual([], ancestors["All Consolidations"])
+        self.assertEqual([], ancestors["NotExisting"])
+        self.assertEqual(set(self.years), set(leaves["All Consolidations"]))
+        self.assertEqual(["1989"], leaves["1989"])
+        self.assertEqual([], leaves["NotExisting"])
+
+    def test_enable_cache(self):
+        cache = self.tm1.elements.enable_cache(ttl=600)
+        try:
+            element_names = self.tm1.elements.get_element_names(self.dimension_name, self.hierarchy_name)
+            self.assertEqual(["Total Years", "All Consolidations", *self.years], element_names)
+            self.assertIn((self.dimension_name, self.hierarchy_name), cache)
+
+            self.assertEqual(
+                list(self.years), self.tm1.elements.get_leaf_element_names(self.dimension_name, self.hierarchy_name)
+            )
+            self.assertEqual(
+                ["Total Years"], self.tm1.elements.get_elements_by_level(self.dimension_name, self.hierarchy_name, 1)
+            )
+            self.assertEqual(
+                ["Total Years"], self.tm1.elements.get_parents(self.dimension_name, self.hierarchy_name, "1992")
+            )
+            self.assertEqual(
+                7, len(self.tm1.elements.get_parents_of_all_elements(self.dimension_name, self.hierarchy_name))
+            )
+            self.assertTrue(
+                self.tm1.elements.element_is_ancestor(
+                    self.dimension_name, self.hierarchy_name, "All Consolidations", "1992"
+                )
+            )
+            self.assertFalse(
+                self.tm1.elements.element_is_ancestor(self.dimension_name, self.hierarchy_name, "1992", "NotExisting")
+            )
+            self.assertTrue(
+                self.tm1.elements.element_is_parent(self.dimension_name, self.hierarchy_name, "Total Years", "1992")
+            )
+            self.assertEqual(
+                "1991/92",
+                cache.get_attribute_of_elements(self.dimension_name, self.hierarchy_name, "Financial Year")["1992"],
+            )
+
+            # updates through the service invalidate the cache
+            self.tm1.elements.create(self.dimension_name, self.hierarchy_name, Element(self.extra_year, "Numeric"))
+            self.assertNotIn((self.dimension_name, self.hierarchy_name), cache)
+            self.assertIn(
+                self.extra_year, self.tm1.elements.get_element_names(self.dimension_name, self.hierarchy_name)
+            )
+        finally:
+            self.tm1.elements.disable_cache()
+
+    def test_enable_cache_detects_changes_after_ttl(self):
+        cache = self.tm1.elements.enable_cache(ttl=0)
+        try:
+            self.assertEqual(7, self.tm1.elements.get_number_of_elements(self.dimension_name, self.hierarchy_name))
+
+            # update not done through the cached service
+            element_service = ElementService(self.tm1.connection)
+            element_service.create(self.dimension_name, self.hierarchy_name, Element(self.extra_year, "Numeric"))
+            self.assertIn((self.dimension_name, self.hierarchy_name), cache)
+
+            self.assertEqual(8, self.tm1.elements.get_number_of_elements(self.dimension_name, self.hierarchy_name))
+        finally:
+            self.tm1.elements.disable_cache()
+
+    def test_enable_cache_detects_moved_element_after_max_age(self):
+        cache = self.tm1.elements.enable_cache(ttl=0, max_age=0)
+        try:
+            self.assertTrue(
+                self.tm1.elements.element_is_parent(self.dimension_name, self.hierarchy_name, "Total Years", "1992")
+            )
+
+            # update not done through the cached service. Number of elements and edges is unchanged
+            element_service = ElementService(self.tm1.connection)
+            element_service.delete_edges(self.dimension_name, self.hierarchy_name, [("Total Years", "1992")])
+            element_service.add_edges(self.dimension_name, self.hierarchy_name, {("All Consolidations", "1992"): 1})
+            self.assertIn((self.dimension_name, self.hierarchy_name), cache)
+
+            self.assertFalse(
+                self.tm1.elements.element_is_parent(self.dimension_name, self.hierarchy_name, "Total Years", "1992")
+            )
+            self.assertTrue(
+                self.tm1.elements.element_is_parent(
+                    self.dimension_name, self.hierarchy_name, "All Consolidations", "1992"
+                )
+            )
+        finally:
+            self.tm1.elements.disable_cache()
+
     @classmethod
     def tearDownClass(cls):
         cls.tm1.logout()
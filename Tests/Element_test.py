@@ -29,6 +29,13 @@ class TestElement(unittest.TestCase):
 
         self.assertEqual(hash(element1), hash(element2))
 
+    def test_hash_case_space_difference(self):
+        element1 = Element(name="Element 1", element_type="Numeric")
+        element2 = Element(name="ELEMENT1", element_type="NUMERIC")
+
+        self.assertEqual(hash(element1), hash(element2))
+        self.assertEqual(1, len({element1, element2}))
+
     def test_construct_body(self):
         element = Element("e1", "Numeric")
 
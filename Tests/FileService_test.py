@@ -1,4 +1,5 @@
 import configparser
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -6,6 +7,7 @@ from TM1py import TM1Service
 from TM1py.Exceptions import TM1pyVersionException
 
 from .Utils import (
+    skip_if_no_zstandard,
     skip_if_version_higher_or_equal_than,
     skip_if_version_lower_than,
     verify_version,
@@ -86,6 +88,112 @@ class TestFileService(unittest.TestCase):
     def test_create_get_with_mpu_200_megabyte_per_part(self):
         self.run_create_get(mpu=True, max_mb_per_part=200)
 
+    @skip_if_version_lower_than(version="11.4")
+    def test_create_get_chunks(self):
+        with open(Path(__file__).parent.joinpath("resources", "file.csv"), "rb") as original_file:
+            original_content = original_file.read()
+
+        chunks = (original_content[i : i + 100] for i in range(0, len(original_content), 100))
+        self.tm1.files.create(self.FILE_NAME2, chunks, multi_part_upload=False)
+
+        self.assertEqual(original_content, self.tm1.files.get(self.FILE_NAME2))
+
+    @skip_if_version_lower_than(version="12")
+    def test_create_get_chunks_with_mpu_10_max_workers(self):
+        with open(Path(__file__).parent.joinpath("resources", "file.csv"), "rb") as original_file:
+            original_content = original_file.read()
+
+        chunks = (original_content[i : i + 100] for i in range(0, len(original_content), 100))
+        self.tm1.files.create(
+            self.FILE_NAME2, chunks, multi_part_upload=True, max_mb_per_part=64 / (1024 * 1024), max_workers=10
+        )
+
+        self.assertEqual(original_content, self.tm1.files.get(self.FILE_NAME2))
+
+    @skip_if_version_lower_than(version="12")
+    def test_create_get_empty_chunks_with_mpu(self):
+        self.tm1.files.create(self.FILE_NAME3, iter([b"", b""]), multi_part_upload=True)
+
+        self.assertEqual(b"", self.tm1.files.get(self.FILE_NAME3))
+
+    @skip_if_version_lower_than(version="11.4")
+    def test_create_compression_gzip(self):
+        with open(Path(__file__).parent.joinpath("resources", "file.csv"), "rb") as original_file:
+            content = original_file.read()
+
+        self.tm1.files.create(self.FILE_NAME2, content, multi_part_upload=False, compression="gzip")
+
+        self.assertEqual(content, self.tm1.files.get(self.FILE_NAME2))
+
+    @skip_if_version_lower_than(version="11.4")
+    @skip_if_no_zstandard
+    def test_create_compression_zstd(self):
+        with open(Path(__file__).parent.joinpath("resources", "file.csv"), "rb") as original_file:
+            content = original_file.read()
+
+        self.tm1.files.create(self.FILE_NAME2, content, multi_part_upload=False, compression="zstd")
+
+        self.assertEqual(content, self.tm1.files.get(self.FILE_NAME2))
+
+    @skip_if_version_lower_than(version="12")
+    def test_create_compression_gzip_with_mpu(self):
+        with open(Path(__file__).parent.joinpath("resources", "file.csv"), "rb") as original_file:
+            content = original_file.read()
+
+        # every part is compressed on its own
+        self.tm1.files.create(
+            self.FILE_NAME2,
+            (content[i : i + 16] for i in range(0, len(content), 16)),
+            multi_part_upload=True,
+            max_mb_per_part=16 / (1024 * 1024),
+            compression="gzip",
+        )
+
+        self.assertEqual(content, self.tm1.files.get(self.FILE_NAME2))
+
+    @skip_if_version_lower_than(version="11.4")
+    def test_update_compression_gzip(self):
+        with open(Path(__file__).parent.joinpath("resources", "file.csv"), "rb") as original_file:
+            content = original_file.read()
+
+        self.tm1.files.update(self.FILE_NAME1, content[::-1], multi_part_upload=False, compression="gzip")
+
+        self.assertEqual(content[::-1], self.tm1.files.get(self.FILE_NAME1))
+
+    @skip_if_version_lower_than(version="11.4")
+    def test_get_compression_not_supported(self):
+        with self.assertRaises(ValueError):
+            self.tm1.files.get(self.FILE_NAME1, compression="rar")
+
+    @skip_if_version_lower_than(version="11.4")
+    def test_get_stream(self):
+        chunks = list(self.tm1.files.get_stream(self.FILE_NAME1, chunk_size=16))
+
+        self.assertGreater(len(chunks), 1)
+        with open(Path(__file__).parent.joinpath("resources", "file.csv"), "rb") as original_file:
+            self.assertEqual(original_file.read(), b"".join(chunks))
+
+    @skip_if_version_lower_than(version="11.4")
+    def test_download(self):
+        with tempfile.TemporaryDirectory() as directory:
+            target = self.tm1.files.download(self.FILE_NAME1, Path(directory) / "file.csv")
+
+            with open(Path(__file__).parent.joinpath("resources", "file.csv"), "rb") as original_file:
+                self.assertEqual(original_file.read(), target.read_bytes())
+
+    @skip_if_version_lower_than(version="11.4")
+    def test_download_parts(self):
+        with tempfile.TemporaryDirectory() as directory:
+            target = self.tm1.files.download(self.FILE_NAME1, Path(directory) / "file.csv", parts=4)
+
+            with open(Path(__file__).parent.joinpath("resources", "file.csv"), "rb") as original_file:
+                self.assertEqual(original_file.read(), target.read_bytes())
+
+    @skip_if_version_lower_than(version="11.4")
+    def test_download_parts_with_compression(self):
+        with self.assertRaises(ValueError):
+            self.tm1.files.download(self.FILE_NAME1, "file.csv", parts=4, compression="gzip")
+
     @skip_if_version_lower_than(version="12")
     def test_create_get_in_folder(self):
         with open(Path(__file__).parent.joinpath("resources", "file.csv"), "rb") as original_file:
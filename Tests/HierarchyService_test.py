@@ -442,6 +442,143 @@ class TestHierarchyService(unittest.TestCase):
             edges = {("Total Years", "1989"): 1}
             self.tm1.dimensions.hierarchies.add_edges(self.dimension_name, self.dimension_name, edges)
 
+    def test_write_in_batches(self):
+        countries = [Element(f"Country {number}", "Numeric", attributes={"Code": f"C{number}"}) for number in range(10)]
+        hierarchy = Hierarchy(
+            self.region_dimension_name,
+            self.region_dimension_name,
+            elements=[Element("World", "Consolidated"), *countries],
+            element_attributes=[ElementAttribute("Code", "String")],
+            edges={("World", country.name): 1 for country in countries},
+        )
+        dimension = Dimension(self.region_dimension_name)
+        dimension.add_hierarchy(Hierarchy(self.region_dimension_name, self.region_dimension_name))
+        self.tm1.dimensions.create(dimension)
+
+        progress = []
+        result = self.tm1.hierarchies.write_in_batches(
+            hierarchy, batch_size=4, progress_callback=lambda *args: progress.append(args)
+        )
+
+        self.assertEqual({"elements": 11, "edges": 10, "attribute_values": 10}, result)
+        self.assertEqual(("elements", 11, 11), progress[2])
+        self.assertEqual(("edges", 10, 10), progress[5])
+        self.assertEqual(
+            set(hierarchy.edges.keys()),
+            set(self.tm1.elements.get_edges(self.region_dimension_name, self.region_dimension_name)),
+        )
+        self.assertEqual(
+            "C7",
+            self.tm1.elements.get_attribute_of_elements(
+                self.region_dimension_name, self.region_dimension_name, "Code", ["Country 7"]
+            )["Country 7"],
+        )
+
+    def test_write_in_batches_resume(self):
+        hierarchy = self.tm1.hierarchies.get(self.dimension_name, self.dimension_name)
+        hierarchy.add_element("1990", "Numeric")
+        hierarchy.add_edge("Total Years", "1990", 1)
+
+        result = self.tm1.hierarchies.write_in_batches(hierarchy, batch_size=1, write_attribute_values=False)
+
+        self.assertEqual({"elements": 1, "edges": 1, "attribute_values": 0}, result)
+        edges = self.tm1.elements.get_edges(self.dimension_name, self.dimension_name)
+        self.assertEqual(2, edges["Total Years", "1989"])
+        self.assertEqual(1, edges["Total Years", "1990"])
+
+    def test_sync_dry_run(self):
+        hierarchy = self.tm1.hierarchies.get(self.dimension_name, self.dimension_name)
+        hierarchy.add_element("1990", "Numeric")
+        hierarchy.add_edge("Total Years", "1990", 1)
+        hierarchy.update_edge("Total Years", "1989", 3)
+        hierarchy.remove_element("My Element")
+
+        changes = self.tm1.hierarchies.sync(hierarchy, dry_run=True)
+
+        self.assertEqual(["1990"], changes["elements_to_add"])
+        self.assertEqual(["My Element"], changes["elements_to_delete"])
+        self.assertEqual({("Total Years", "1990"): 1}, changes["edges_to_add"])
+        self.assertEqual({("Total Years", "1989"): 3}, changes["edges_to_update"])
+        self.assertEqual([], changes["edges_to_delete"])
+        self.assertNotIn("1990", self.tm1.elements.get_element_names(self.dimension_name, self.dimension_name))
+
+    def test_sync(self):
+        hierarchy = self.tm1.hierarchies.get(self.dimension_name, self.dimension_name)
+        hierarchy.add_element("1990", "Numeric")
+        hierarchy.add_edge("Total Years", "1990", 1)
+        hierarchy.update_edge("Total Years", "1989", 3)
+        hierarchy.remove_element("My Element")
+
+        self.tm1.hierarchies.sync(hierarchy, batch_size=1)
+
+        element_names = self.tm1.elements.get_element_names(self.dimension_name, self.dimension_name)
+        self.assertIn("1990", element_names)
+        self.assertNotIn("My Element", element_names)
+        edges = self.tm1.elements.get_edges(self.dimension_name, self.dimension_name)
+        self.assertEqual({("Total Years", "1989"): 3, ("Total Years", "1990"): 1}, edges)
+
+        changes = self.tm1.hierarchies.sync(hierarchy, dry_run=True)
+        self.assertFalse(any(changes.values()))
+
+    def test_sync_use_ti(self):
+        hierarchy = self.tm1.hierarchies.get(self.dimension_name, self.dimension_name)
+        hierarchy.add_element("1990", "Numeric")
+        hierarchy.add_edge("Total Years", "1990", 1)
+        hierarchy.update_edge("Total Years", "1989", 3)
+        hierarchy.remove_element("My Element")
+
+        self.tm1.hierarchies.sync(hierarchy, use_ti=True)
+
+        element_names = self.tm1.elements.get_element_names(self.dimension_name, self.dimension_name)
+        self.assertIn("1990", element_names)
+        self.assertNotIn("My Element", element_names)
+        edges = self.tm1.elements.get_edges(self.dimension_name, self.dimension_name)
+        self.assertEqual({("Total Years", "1989"): 3, ("Total Years", "1990"): 1}, edges)
+
+    def test_sync_creates_dimension(self):
+        dimension_name = self.prefix + "Sync_New"
+        hierarchy = Hierarchy(dimension_name, dimension_name)
+        hierarchy.add_element("Total", "Consolidated")
+        hierarchy.add_element("A", "Numeric")
+        hierarchy.add_edge("Total", "A", 1)
+        hierarchy.add_element_attribute("Description", "String")
+
+        try:
+            self.tm1.hierarchies.sync(hierarchy)
+
+            self.assertEqual({("Total", "A"): 1}, self.tm1.elements.get_edges(dimension_name, dimension_name))
+            self.assertEqual(
+                ["Description"],
+                [ea.name for ea in self.tm1.elements.get_element_attributes(dimension_name, dimension_name)],
+            )
+        finally:
+            if self.tm1.dimensions.exists(dimension_name):
+                self.tm1.dimensions.delete(dimension_name)
+
+    def test_sync_dataframe(self):
+        df = DataFrame(
+            {
+                "Year": ["1989", "1990"],
+                "ElementType": ["Numeric", "Numeric"],
+                "Previous Year": ["1988", "1989"],
+                "level000": ["Total Years", "Total Years"],
+                "level000_weight": [1, 1],
+            }
+        )
+
+        changes = self.tm1.hierarchies.sync(df, dimension_name=self.dimension_name, delete_elements=False)
+
+        self.assertEqual(["1990"], changes["elements_to_add"])
+        self.assertEqual({("Total Years", "1989"): 1}, changes["edges_to_update"])
+        self.assertIn(("1990", "Previous Year"), changes["attribute_values_to_update"])
+        self.assertEqual(
+            "1989",
+            self.tm1.elements.get_attribute_of_elements(
+                self.dimension_name, self.dimension_name, "Previous Year", ["1990"]
+            )["1990"],
+        )
+        self.assertIn("My Element", self.tm1.elements.get_element_names(self.dimension_name, self.dimension_name))
+
     def test_is_balanced_false(self):
         is_balanced = self.tm1.dimensions.hierarchies.is_balanced(self.dimension_name, self.dimension_name)
         self.assertFalse(is_balanced)
@@ -286,6 +286,112 @@ class TestHierarchy(unittest.TestCase):
             edges,
         )
 
+    @staticmethod
+    def _build_regions_hierarchy() -> Hierarchy:
+        return Hierarchy(
+            name="NotRelevant",
+            dimension_name="NotRelevant",
+            elements=[
+                Element("Total", "Consolidated"),
+                Element("Europe", "Consolidated"),
+                Element("DACH", "Consolidated"),
+                Element("Germany", "Numeric"),
+                Element("Switzerland", "Numeric"),
+                Element("Austria", "Numeric"),
+                Element("France", "Numeric"),
+                Element("Other", "Numeric"),
+            ],
+            edges={
+                ("Total", "Europe"): 1,
+                ("Europe", "DACH"): 1,
+                ("DACH", "Germany"): 1,
+                ("DACH", "Switzerland"): 1,
+                ("DACH", "Austria"): 1,
+                ("Europe", "France"): 1,
+            },
+        )
+
+    def test_get_ancestor_edges_recursive_true(self):
+        hierarchy = self._build_regions_hierarchy()
+
+        edges = hierarchy.get_ancestor_edges("g e r m a n y", recursive=True)
+        self.assertEqual({("DACH", "Germany"): 1, ("Europe", "DACH"): 1, ("Total", "Europe"): 1}, edges)
+
+    def test_get_leaves(self):
+        hierarchy = self._build_regions_hierarchy()
+
+        self.assertEqual(
+            {"Germany", "Switzerland", "Austria", "France", "Other"},
+            {element.name for element in hierarchy.get_leaves()},
+        )
+        self.assertEqual(
+            {"Germany", "Switzerland", "Austria", "France"},
+            {element.name for element in hierarchy.get_leaves("europe")},
+        )
+        self.assertEqual({"Other"}, {element.name for element in hierarchy.get_leaves("Other")})
+
+    def test_get_level(self):
+        hierarchy = self._build_regions_hierarchy()
+
+        self.assertEqual(3, hierarchy.get_level("Total"))
+        self.assertEqual(2, hierarchy.get_level("Europe"))
+        self.assertEqual(1, hierarchy.get_level("DACH"))
+        self.assertEqual(0, hierarchy.get_level("France"))
+        self.assertEqual(0, hierarchy.get_level("Other"))
+
+    def test_topological_order(self):
+        hierarchy = self._build_regions_hierarchy()
+
+        order = hierarchy.topological_order()
+        self.assertEqual(len(hierarchy), len(order))
+        for parent, component in hierarchy.edges:
+            self.assertLess(order.index(component), order.index(parent))
+
+        order = hierarchy.topological_order(top_down=True)
+        for parent, component in hierarchy.edges:
+            self.assertLess(order.index(parent), order.index(component))
+
+    def test_topological_order_cycle(self):
+        hierarchy = self._build_regions_hierarchy()
+        hierarchy.add_edge("DACH", "Total", 1)
+
+        with self.assertRaises(ValueError):
+            hierarchy.topological_order()
+
+    def test_path_to_root(self):
+        hierarchy = self._build_regions_hierarchy()
+
+        self.assertEqual(["Austria", "DACH", "Europe", "Total"], hierarchy.path_to_root("AUSTRIA"))
+        self.assertEqual(["Other"], hierarchy.path_to_root("Other"))
+
+    def test_index_invalidated_on_mutation(self):
+        hierarchy = self._build_regions_hierarchy()
+        self.assertEqual(3, hierarchy.get_level("Total"))
+
+        hierarchy.add_element("World", "Consolidated")
+        hierarchy.add_edge("World", "Total", 1)
+        self.assertEqual(4, hierarchy.get_level("World"))
+        self.assertEqual(["France", "Europe", "Total", "World"], hierarchy.path_to_root("France"))
+
+        hierarchy.remove_edge("Europe", "DACH")
+        self.assertEqual(2, hierarchy.get_level("Total"))
+        self.assertEqual(set(), hierarchy.get_ancestors("DACH"))
+
+    def test_index_invalidated_on_mutation_in_place(self):
+        hierarchy = self._build_regions_hierarchy()
+        self.assertEqual(["Austria", "DACH", "Europe", "Total"], hierarchy.path_to_root("Austria"))
+
+        # move Austria without changing the number of edges
+        del hierarchy.edges[("DACH", "Austria")]
+        hierarchy.edges[("Europe", "Austria")] = 1
+        self.assertEqual(["Austria", "Europe", "Total"], hierarchy.path_to_root("Austria"))
+
+        # rename Other without changing the number of elements
+        del hierarchy.elements["Other"]
+        hierarchy.elements["Rest"] = Element("Rest", "Numeric")
+        self.assertEqual(["Rest"], hierarchy.path_to_root("Rest"))
+        self.assertIn("Rest", [element.name for element in hierarchy.get_leaves()])
+
     def test_replace_element_consolidation(self):
         hierarchy = Hierarchy(
             name="NotRelevant",
@@ -220,6 +220,27 @@ class TestProcessService(unittest.TestCase):
         with self.assertRaises(TM1pyTimeout):
             self.tm1.processes.execute_with_return(timeout=1, process_name=process.name, pWaitSec="5")
 
+    def test_execute_with_return_future(self):
+        process = self.p_bedrock_server_wait
+        self.tm1.processes.update_or_create(process)
+
+        futures = [
+            self.tm1.processes.execute_with_return_future(process_name=process.name, pWaitSec=1) for _ in range(3)
+        ]
+        for future in futures:
+            success, status, _ = future.result()
+            self.assertTrue(success)
+            self.assertEqual(status, "CompletedSuccessfully")
+        self.assertEqual(0, len(self.tm1._tm1_rest.async_poller))
+
+    def test_execute_with_return_future_timeout(self):
+        process = self.p_bedrock_server_wait
+        self.tm1.processes.update_or_create(process)
+
+        future = self.tm1.processes.execute_with_return_future(timeout=1, process_name=process.name, pWaitSec="5")
+        with self.assertRaises(TM1pyTimeout):
+            future.result()
+
     def test_execute_with_return_compile_error(self):
         process = Process(name=str(uuid.uuid4()))
         process.prolog_procedure = "sText = 'text';sText = 2;"
@@ -2,8 +2,10 @@ import configparser
 import unittest
 from pathlib import Path
 
+from requests import Response
+
 from TM1py import TM1Service
-from TM1py.Services.RestService import RestService
+from TM1py.Services.RestService import PollingStrategy, RestService
 
 
 class TestRestService(unittest.TestCase):
@@ -39,6 +41,33 @@ class TestRestService(unittest.TestCase):
         self.assertEqual(1, next(generator))
         self.assertEqual(1, next(generator))
 
+    def test_polling_strategy_exponential_capped(self):
+        strategy = PollingStrategy(initial_wait=0.1, factor=2, max_wait=1, jitter=0)
+        self.assertEqual([0.1, 0.2, 0.4, 0.8, 1, 1], [strategy.wait_time(attempt) for attempt in range(6)])
+
+    def test_polling_strategy_jitter(self):
+        strategy = PollingStrategy(initial_wait=1, max_wait=1, jitter=0.5)
+        for _ in range(100):
+            self.assertTrue(0.5 <= strategy.wait_time(0) <= 1.5)
+
+    def test_polling_strategy_retry_after(self):
+        response = Response()
+        response.headers["Retry-After"] = "3"
+        self.assertEqual(3, PollingStrategy(jitter=0).wait_time(0, response))
+        self.assertEqual(0.1, PollingStrategy(jitter=0, honour_retry_after=False).wait_time(0, response))
+
+    def test_polling_strategy_parse_retry_after(self):
+        self.assertEqual(2.5, PollingStrategy.parse_retry_after("2.5"))
+        self.assertEqual(0, PollingStrategy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"))
+        self.assertIsNone(PollingStrategy.parse_retry_after("not a date"))
+        self.assertIsNone(PollingStrategy.parse_retry_after(None))
+
+    def test_request_future(self):
+        future = self.tm1._tm1_rest.request_future(
+            "GET", "/Configuration/ProductVersion/$value", transform=lambda response: response.text
+        )
+        self.assertEqual(self.tm1.version, future.result())
+
     def test_build_response_from_async_response_ok(self):
         response_content = (
             b"HTTP/1.1 200 OK\r\nContent-Length: 32\r\nConnection: keep-alive\r\nContent-Encoding: "
@@ -0,0 +1,94 @@
+import configparser
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from TM1py import SessionPool, TM1Service
+
+
+class TestSessionPool(unittest.TestCase):
+    tm1: TM1Service
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config = configparser.ConfigParser()
+        cls.config.read(Path(__file__).parent.joinpath("config.ini"))
+        cls.tm1 = TM1Service(**cls.config["tm1srv01"])
+
+    def test_sessions_are_logged_in_lazily(self):
+        with SessionPool(size=2, **self.config["tm1srv01"]) as pool:
+            self.assertEqual(0, len(pool))
+
+            with pool.session() as tm1:
+                self.assertTrue(tm1.connection.is_connected())
+                self.assertEqual(1, len(pool))
+
+            # idle session is reused
+            with pool.session():
+                self.assertEqual(1, len(pool))
+
+    def test_sessions_are_independent(self):
+        with SessionPool(size=3, **self.config["tm1srv01"]) as pool:
+            sessions = [pool.acquire() for _ in range(3)]
+            session_ids = {tm1.connection.session_id for tm1 in sessions}
+            for tm1 in sessions:
+                pool.release(tm1)
+
+        self.assertEqual(3, len(session_ids))
+        self.assertNotIn(self.tm1.connection.session_id, session_ids)
+
+    def test_size_limits_concurrent_sessions(self):
+        def _get_session_id(_) -> str:
+            with pool.session() as tm1:
+                tm1.server.get_server_name()
+                return tm1.connection.session_id
+
+        with SessionPool(size=2, **self.config["tm1srv01"]) as pool:
+            with ThreadPoolExecutor(8) as executor:
+                session_ids = set(executor.map(_get_session_id, range(16)))
+
+            self.assertLessEqual(len(pool), 2)
+        self.assertLessEqual(len(session_ids), 2)
+
+    def test_acquire_timeout(self):
+        with SessionPool(size=1, **self.config["tm1srv01"]) as pool:
+            with pool.session():
+                with self.assertRaises(TimeoutError):
+                    pool.acquire(timeout=0.1)
+
+    def test_health_check_reconnects(self):
+        with SessionPool(size=1, health_check_interval=0, **self.config["tm1srv01"]) as pool:
+            with pool.session() as tm1:
+                tm1.logout()
+
+            with pool.session() as tm1:
+                self.assertTrue(tm1.connection.is_connected())
+
+    def test_close(self):
+        pool = SessionPool(size=2, **self.config["tm1srv01"])
+        with pool.session():
+            pass
+        pool.close()
+
+        self.assertTrue(pool.closed)
+        self.assertEqual(0, len(pool))
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+
+    def test_from_service(self):
+        with SessionPool.from_service(self.tm1, size=1) as pool:
+            with pool.session() as tm1:
+                self.assertEqual(self.tm1.server.get_server_name(), tm1.server.get_server_name())
+                self.assertNotEqual(self.tm1.connection.session_id, tm1.connection.session_id)
+
+    def test_session_id_not_allowed(self):
+        with self.assertRaises(ValueError):
+            SessionPool(size=2, session_id=self.tm1.connection.session_id)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tm1.logout()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,40 @@ def skip_if_no_pandas(func):
     return wrapper
 
 
+def skip_if_no_pyarrow(func):
+    """
+    Checks whether pyarrow is installed and skips the test if not
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            import pyarrow  # noqa: F401
+
+            return func(self, *args, **kwargs)
+        except ImportError:
+            return self.skipTest(f"Test '{func.__name__}' requires pyarrow")
+
+    return wrapper
+
+
+def skip_if_no_zstandard(func):
+    """
+    Checks whether zstandard is installed and skips the test if not
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            import zstandard  # noqa: F401
+
+            return func(self, *args, **kwargs)
+        except ImportError:
+            return self.skipTest(f"Test '{func.__name__}' requires zstandard")
+
+    return wrapper
+
+
 def skip_if_version_lower_than(version):
     """
     Checks whether TM1 version is lower than a certain version and skips the test
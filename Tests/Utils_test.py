@@ -8,11 +8,15 @@ try:
 except ImportError:
     pass
 
-from TM1py.Services import TM1Service
+from TM1py.Services import CellService, TM1Service
 from TM1py.Utils import (
     CellUpdateableProperty,
     Utils,
     add_url_parameters,
+    build_arrow_table_from_cells,
+    build_arrow_table_from_cellset_dict,
+    build_cell_update_statements_from_dataframe,
+    build_dataframe_from_cellset_dict,
     build_dataframe_from_csv,
     cell_is_updateable,
     drop_dimension_properties,
@@ -29,7 +33,12 @@ from TM1py.Utils import (
     verify_version,
 )
 
-from .Utils import skip_if_paoc, skip_if_version_higher_or_equal_than
+from .Utils import (
+    skip_if_no_pandas,
+    skip_if_no_pyarrow,
+    skip_if_paoc,
+    skip_if_version_higher_or_equal_than,
+)
 
 
 class TestUtilsMethods(unittest.TestCase):
@@ -162,6 +171,107 @@ class TestUtilsMethods(unittest.TestCase):
 
         pd._testing.assert_frame_equal(expected_df, df, check_column_type=False, check_dtype=False, check_exact=False)
 
+    @staticmethod
+    def _build_raw_cellset(cells):
+        def _member(element):
+            return {"Name": element, "Element": {"Name": element}}
+
+        return {
+            "Axes": [
+                {"Ordinal": 0, "Cardinality": 2, "Tuples": [{"Members": [_member(e)]} for e in ("e1", "e2")]},
+                {"Ordinal": 1, "Cardinality": 2, "Tuples": [{"Members": [_member(e)]} for e in ("e1", "e2")]},
+            ],
+            "Cells": cells,
+        }
+
+    def test_build_dataframe_from_cellset_dict(self):
+        raw_cellset = self._build_raw_cellset([{"Value": 1.0}, {"Value": 2.0}, {"Value": 3.0}, {"Value": 4.0}])
+        df = build_dataframe_from_cellset_dict(["[d1].[d1]"], ["[d2].[d2]"], raw_cellset)
+
+        expected_df = pd.DataFrame(
+            {
+                "d1": ["e1", "e1", "e2", "e2"],
+                "d2": ["e1", "e2", "e1", "e2"],
+                "Value": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+
+        self.assertIsInstance(df["d1"].dtype, pd.CategoricalDtype)
+        pd._testing.assert_frame_equal(expected_df, df.astype({"d1": str, "d2": str}), check_column_type=False)
+
+    def test_build_dataframe_from_cellset_dict_with_ordinals(self):
+        raw_cellset = self._build_raw_cellset([{"Ordinal": 1, "Value": 2.0}, {"Ordinal": 2, "Value": None}])
+        df = build_dataframe_from_cellset_dict(["[d1].[d1]"], ["[d2].[d2]"], raw_cellset)
+
+        expected_df = pd.DataFrame(
+            {
+                "d1": ["e1", "e2"],
+                "d2": ["e2", "e1"],
+                "Value": [2.0, np.nan],
+            }
+        )
+
+        pd._testing.assert_frame_equal(expected_df, df.astype({"d1": str, "d2": str}), check_column_type=False)
+
+    def test_build_dataframe_from_cellset_dict_matches_csv(self):
+        raw_cellset = self._build_raw_cellset([{"Value": 1.0}, {"Value": 2.0}, {"Value": 3.0}, {"Value": 4.0}])
+        raw_csv = Utils.build_csv_from_cellset_dict(
+            ["[d1].[d1]"], ["[d2].[d2]"], raw_cellset, line_separator="\r\n", value_separator="~"
+        )
+
+        for shaped in (False, True):
+            df = build_dataframe_from_cellset_dict(["[d1].[d1]"], ["[d2].[d2]"], raw_cellset, shaped=shaped)
+            self.assertEqual(build_dataframe_from_csv(raw_csv, shaped=shaped).to_csv(), df.to_csv())
+
+    def test_build_dataframe_from_cellset_dict_empty(self):
+        df = build_dataframe_from_cellset_dict(["[d1].[d1]"], ["[d2].[d2]"], self._build_raw_cellset([]))
+
+        self.assertTrue(df.empty)
+
+    @skip_if_no_pyarrow
+    def test_build_arrow_table_from_cellset_dict(self):
+        import pyarrow as pa
+
+        raw_cellset = self._build_raw_cellset([{"Value": 1.0}, {"Value": None}, {"Value": 3.0}, {"Value": 4.0}])
+        table = build_arrow_table_from_cellset_dict(["[d1].[d1]"], ["[d2].[d2]"], raw_cellset)
+
+        self.assertEqual(["d1", "d2", "Value"], table.column_names)
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("d1").type))
+        self.assertEqual(pa.float64(), table.schema.field("Value").type)
+        self.assertEqual(
+            {"d1": ["e1", "e1", "e2", "e2"], "d2": ["e1", "e2", "e1", "e2"], "Value": [1.0, None, 3.0, 4.0]},
+            table.to_pydict(),
+        )
+
+    @skip_if_no_pyarrow
+    def test_build_arrow_table_from_cellset_dict_string_values(self):
+        import pyarrow as pa
+
+        raw_cellset = self._build_raw_cellset([{"Value": "a"}, {"Value": 2.0}, {"Value": None}, {"Value": ""}])
+        table = build_arrow_table_from_cellset_dict(["[d1].[d1]"], ["[d2].[d2]"], raw_cellset)
+
+        self.assertEqual(pa.string(), table.schema.field("Value").type)
+        self.assertEqual(["a", "2.0", None, ""], table.column("Value").to_pylist())
+
+    @skip_if_no_pyarrow
+    def test_build_arrow_table_from_cells(self):
+        import pyarrow as pa
+
+        cells = [(("e1", "e1"), 1.0), (("e1", "e2"), 2.0), (("e2", "e1"), 3.0)]
+        table = build_arrow_table_from_cells(["d1", "d2", "Value"], cells)
+
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("d2").type))
+        self.assertEqual(
+            {"d1": ["e1", "e1", "e2"], "d2": ["e1", "e2", "e1"], "Value": [1.0, 2.0, 3.0]}, table.to_pydict()
+        )
+
+    @skip_if_no_pyarrow
+    def test_build_arrow_table_from_cells_value_type_mismatch(self):
+        import pyarrow as pa
+
+        with self.assertRaises(ValueError):
+            build_arrow_table_from_cells(["d1", "Value"], [(("e1",), "a")], value_type=pa.float64())
+
     def test_get_dimensions_from_where_clause_no_where(self):
         mdx = """
         SELECT {[dim3].[e2]} ON COLUMNS, {[dim4].[e5]} ON ROWS FROM [cube]
@@ -460,6 +570,54 @@ class TestUtilsMethods(unittest.TestCase):
         framed_value = frame_to_significant_digits(1.2345e3, 2)
         self.assertEqual("1200.0", framed_value)
 
+    @skip_if_no_pandas
+    def test_build_cell_update_statements_from_dataframe(self):
+        measure_dimension_elements = {"Sales": "Numeric", "Comment": "String"}
+        cells = {
+            ("e'1", "Sales"): 1.5,
+            ("e2", "Comment"): "it's\r\nok",
+            ("e3", "Sales"): 0.1 + 0.2,
+            ("e4", "Sales"): -2.25e20,
+            ("e5", "h:Comment"): None,
+            ("e6", "Sales"): "12.5",
+            ("e7", "Sales"): 999999999999999.9,
+            ("e8", "Sales"): -999999999999999.9,
+        }
+        df = pd.DataFrame([(*coordinates, value) for coordinates, value in cells.items()])
+
+        for increment in (False, True):
+            for skip_non_updateable in (False, True):
+                for precision in (None, 3):
+                    expected = CellService._build_cell_update_statements(
+                        cube_name="c1",
+                        cellset_as_dict=cells,
+                        increment=increment,
+                        measure_dimension_elements=measure_dimension_elements,
+                        precision=precision,
+                        skip_non_updateable=skip_non_updateable,
+                    )
+                    statements = build_cell_update_statements_from_dataframe(
+                        df,
+                        cube_name="c1",
+                        increment=increment,
+                        measure_dimension_elements=measure_dimension_elements,
+                        precision=precision,
+                        skip_non_updateable=skip_non_updateable,
+                    )
+                    self.assertEqual(expected, statements)
+
+    @skip_if_no_pandas
+    def test_build_cell_update_statements_from_dataframe_columns(self):
+        statements = build_cell_update_statements_from_dataframe(
+            {"d1": ["e1", "e2"], "d2": ["m1", "m1"], "Value": [3, 1e16]}, cube_name="c1"
+        )
+
+        self.assertEqual(["CellPutN(3,'c1','e1','m1');", "CellPutN(1E16,'c1','e2','m1');"], statements)
+
+    @skip_if_no_pandas
+    def test_build_cell_update_statements_from_dataframe_empty(self):
+        self.assertEqual([], build_cell_update_statements_from_dataframe(pd.DataFrame(), cube_name="c1"))
+
     def test_element_name_from_element_unique_name_happy_case(self):
         element_name = Utils.element_name_from_element_unique_name("[d1].[e1]")
         self.assertEqual("e1", element_name)
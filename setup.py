@@ -41,6 +41,9 @@ setup(
     ],
     extras_require={
         "pandas": ["pandas"],
+        "pyarrow": ["pyarrow"],
+        "async": ["httpx"],
+        "zstd": ["zstandard"],
         "dev": [
             "pytest",
             "pytest-xdist",